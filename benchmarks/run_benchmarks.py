@@ -0,0 +1,368 @@
+"""Run the benchmark suite against a synthetic sample library.
+
+Usage::
+
+    poetry run python -m benchmarks.run_benchmarks --banks 16 --output results.json
+
+Each benchmark is run `--repeat` times, and its timings are written as
+JSON, so results can be compared between commits and machines.
+"""
+import json
+import platform
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+import click
+import numpy as np
+
+from benchmarks.synthetic_library import (
+    DEFAULT_AUDIO_CHANNELS,
+    DEFAULT_BANK_COUNT,
+    DEFAULT_DURATION,
+    DEFAULT_SAMPLE_RATE,
+    DEFAULT_SUBTYPE,
+    LibrarySpec,
+    SyntheticLibrary,
+)
+from octo_slample.bank_exporter import BankExporter
+from octo_slample.bank_initializer import BankInitializer
+from octo_slample.constants import DEFAULT_CHANNEL_COUNT, SIXTEENTHS_PER_BAR
+from octo_slample.json import VALIDATION_CACHE
+from octo_slample.pattern.text_pattern import TextPattern
+from octo_slample.sampler.compiled_sample_bank import CompiledSampleBank
+from octo_slample.sampler.json_sample_bank import JsonSampleBank
+from octo_slample.sampler.looping_sampler import LoopingSampler
+from octo_slample.sampler.mixer import Mixer
+from octo_slample.sampler.sample_store import SAMPLE_STORE
+from octo_slample.wav_writer import WavWriter
+
+RESULTS_VERSION = 1
+DEFAULT_REPEAT = 5
+PATTERN_BARS = 64
+DISPATCH_BARS = 64
+
+
+class BenchmarkContext(NamedTuple):
+    """The library and scratch space a benchmark runs against."""
+
+    spec: LibrarySpec
+    library_path: Path
+    bank_files: list[Path]
+    work_path: Path
+
+
+# A benchmark does its setup, untimed, then returns the callable to time.
+Benchmark = Callable[[BenchmarkContext], Callable[[], object]]
+
+
+def fresh_directory(context: BenchmarkContext, name: str) -> Path:
+    """Create an empty directory in the scratch space.
+
+    Args:
+        context (BenchmarkContext): The benchmark context.
+        name (str): The directory name prefix.
+
+    Returns:
+        Path: The new directory.
+    """
+    return Path(tempfile.mkdtemp(prefix=f"{name}-", dir=context.work_path))
+
+
+def load_banks(context: BenchmarkContext) -> list[JsonSampleBank]:
+    """Load every bank in the library.
+
+    Args:
+        context (BenchmarkContext): The benchmark context.
+
+    Returns:
+        list[JsonSampleBank]: The banks, in bank order.
+    """
+    return [JsonSampleBank.from_file(bank_file) for bank_file in context.bank_files]
+
+
+def bench_json_sample_bank_from_file(context: BenchmarkContext) -> Callable:
+    """Load every bank file, validating each against its schema."""
+    VALIDATION_CACHE.clear()
+
+    return lambda: load_banks(context)
+
+
+def bench_json_sample_bank_from_file_validated(
+    context: BenchmarkContext,
+) -> Callable:
+    """Load every bank file again, once each has been validated."""
+    VALIDATION_CACHE.clear()
+    load_banks(context)
+
+    return lambda: load_banks(context)
+
+
+def bench_channel_load(context: BenchmarkContext) -> Callable:
+    """Decode every channel's sample, with an empty sample store."""
+    banks = load_banks(context)
+    SAMPLE_STORE.clear()
+
+    return lambda: [
+        bank[channel].sample for bank in banks for channel in range(len(bank))
+    ]
+
+
+def bench_channel_volume(context: BenchmarkContext) -> Callable:
+    """Change every channel's volume and read its gain."""
+    channels = [bank[n] for bank in load_banks(context) for n in range(len(bank))]
+
+    def run() -> None:
+        for volume in range(-24, 1):
+            for channel in channels:
+                channel.volume = volume
+                channel.gain
+
+    return run
+
+
+def bench_compiled_sample_bank_from_file(context: BenchmarkContext) -> Callable:
+    """Open every bank, compiled, and read its samples."""
+    output_path = fresh_directory(context, "compiled")
+    compiled_files = [
+        CompiledSampleBank.compile(bank, output_path / f"{number}.octobank")
+        for number, bank in enumerate(load_banks(context), start=1)
+    ]
+
+    def run() -> None:
+        for compiled_file in compiled_files:
+            bank = CompiledSampleBank.from_file(compiled_file)
+            [bank[channel].sample for channel in range(len(bank))]
+
+    return run
+
+
+def bench_wav_writer_write_bank(context: BenchmarkContext) -> Callable:
+    """Write every bank, converting its samples."""
+    banks = load_banks(context)
+    output_path = fresh_directory(context, "write-bank")
+
+    return lambda: [
+        WavWriter.write_bank(bank, number, output_path)
+        for number, bank in enumerate(banks, start=1)
+    ]
+
+
+def bench_bank_exporter_export_set(context: BenchmarkContext) -> Callable:
+    """Export the library to an empty set."""
+    output_path = fresh_directory(context, "export-set")
+
+    return lambda: BankExporter.export_set(context.library_path, output_path)
+
+
+def bench_bank_exporter_export_set_unchanged(context: BenchmarkContext) -> Callable:
+    """Export the library again, to a set it is already exported to."""
+    output_path = fresh_directory(context, "export-set-unchanged")
+    BankExporter.export_set(context.library_path, output_path)
+
+    return lambda: BankExporter.export_set(context.library_path, output_path)
+
+
+def bench_bank_initializer_init_recursive(context: BenchmarkContext) -> Callable:
+    """Write every bank file again."""
+    return lambda: BankInitializer.init_recursive(context.library_path, force=True)
+
+
+def bench_text_pattern_parse(context: BenchmarkContext) -> Callable:
+    """Parse a long text pattern."""
+    steps = PATTERN_BARS * SIXTEENTHS_PER_BAR
+    lines = SyntheticLibrary.pattern_lines(
+        np.random.default_rng(context.spec.seed), DEFAULT_CHANNEL_COUNT, steps
+    )
+
+    def run() -> TextPattern:
+        pattern = TextPattern(step_count=steps)
+        pattern.pattern = lines
+
+        return pattern
+
+    return run
+
+
+def bench_looping_sampler_dispatch(context: BenchmarkContext) -> Callable:
+    """Compile a pattern and schedule its steps on the mixer."""
+    pattern = TextPattern()
+    pattern.pattern = SyntheticLibrary.pattern_lines(
+        np.random.default_rng(context.spec.seed),
+        DEFAULT_CHANNEL_COUNT,
+        SIXTEENTHS_PER_BAR,
+    )
+    mixer = Mixer()
+    sampler = LoopingSampler(pattern=pattern, bank=load_banks(context)[0], mixer=mixer)
+    until_frame = round(DISPATCH_BARS * SIXTEENTHS_PER_BAR * sampler.frames_per_step)
+
+    # decode the samples before timing
+    [sampler.bank[channel].sample for channel in range(len(sampler))]
+
+    def run() -> None:
+        sampler.pattern = pattern
+        sampler.schedule_steps(0, 0, until_frame)
+        mixer.cancel_scheduled()
+
+    return run
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "json_sample_bank.from_file": bench_json_sample_bank_from_file,
+    "json_sample_bank.from_file.validated": bench_json_sample_bank_from_file_validated,
+    "channel.load": bench_channel_load,
+    "channel.volume": bench_channel_volume,
+    "compiled_sample_bank.from_file": bench_compiled_sample_bank_from_file,
+    "wav_writer.write_bank": bench_wav_writer_write_bank,
+    "bank_exporter.export_set": bench_bank_exporter_export_set,
+    "bank_exporter.export_set.unchanged": bench_bank_exporter_export_set_unchanged,
+    "bank_initializer.init_recursive": bench_bank_initializer_init_recursive,
+    "text_pattern.parse": bench_text_pattern_parse,
+    "looping_sampler.dispatch": bench_looping_sampler_dispatch,
+}
+
+
+def time_benchmark(
+    benchmark: Benchmark, context: BenchmarkContext, repeat: int
+) -> dict:
+    """Time a benchmark.
+
+    The benchmark's setup is run before each timed run.
+
+    Args:
+        benchmark (Benchmark): The benchmark.
+        context (BenchmarkContext): The benchmark context.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        dict: The run times, in seconds.
+    """
+    times = []
+
+    for _ in range(0, repeat):
+        run = benchmark(context)
+
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+
+    return {
+        "runs": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "max": max(times),
+    }
+
+
+def run_benchmarks(
+    spec: LibrarySpec,
+    work_path: str | Path,
+    names: list[str] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """Generate a library and run benchmarks against it.
+
+    Args:
+        spec (LibrarySpec): The size and format of the library.
+        work_path (str|Path): The directory to generate the library and
+            write outputs in.
+        names (list[str], optional): The benchmarks to run. Defaults to
+            every benchmark.
+        repeat (int, optional): The number of timed runs per benchmark.
+            Defaults to `DEFAULT_REPEAT`.
+
+    Returns:
+        dict: The machine-readable results.
+    """
+    assert repeat > 0, f"repeat must be positive, but got {repeat}"
+
+    names = list(BENCHMARKS) if not names else names
+    unknown = set(names) - set(BENCHMARKS)
+    assert not unknown, f"unknown benchmarks: {', '.join(sorted(unknown))}"
+
+    library_path = Path(work_path, "library")
+    context = BenchmarkContext(
+        spec,
+        library_path,
+        SyntheticLibrary.generate(library_path, spec),
+        Path(work_path),
+    )
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "library": spec._asdict(),
+        "results": [
+            {"name": name, **time_benchmark(BENCHMARKS[name], context, repeat)}
+            for name in names
+        ],
+    }
+
+
+@click.command()
+@click.option("--banks", default=DEFAULT_BANK_COUNT, help="Number of banks", type=int)
+@click.option(
+    "--duration",
+    default=DEFAULT_DURATION,
+    help="Sample length, in seconds",
+    type=float,
+)
+@click.option(
+    "--sample-rate", default=DEFAULT_SAMPLE_RATE, help="Sample rate", type=int
+)
+@click.option("--subtype", default=DEFAULT_SUBTYPE, help="Sample WAV subtype")
+@click.option(
+    "--audio-channels",
+    default=DEFAULT_AUDIO_CHANNELS,
+    help="Channels per sample",
+    type=int,
+)
+@click.option("--repeat", default=DEFAULT_REPEAT, help="Runs per benchmark", type=int)
+@click.option(
+    "--benchmark",
+    "-k",
+    "names",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS)),
+    help="Benchmark to run; may be repeated. Defaults to all",
+)
+@click.option("--output", "-o", help="Results JSON file. Defaults to stdout")
+def main(
+    banks: int,
+    duration: float,
+    sample_rate: int,
+    subtype: str,
+    audio_channels: int,
+    repeat: int,
+    names: tuple[str, ...],
+    output: str | None,
+) -> None:
+    """Run the benchmark suite and write the results as JSON."""
+    spec = LibrarySpec(
+        banks=banks,
+        duration=duration,
+        sample_rate=sample_rate,
+        subtype=subtype,
+        audio_channels=audio_channels,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="octo-slample-benchmarks-") as work_path:
+        results = run_benchmarks(spec, work_path, list(names), repeat)
+
+    if output is None:
+        click.echo(json.dumps(results, indent=4))
+        return
+
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
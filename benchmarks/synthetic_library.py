@@ -0,0 +1,112 @@
+"""Synthetic sample libraries for benchmarks.
+
+This module contains the LibrarySpec and SyntheticLibrary classes.  A
+library is a directory of banks, each a directory of noise WAV files
+with a ``bank.json``, sized by the spec so that benchmarks can be run
+against libraries of any size without shipping audio.
+"""
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import soundfile as sf
+
+from octo_slample.bank_initializer import BankInitializer
+from octo_slample.constants import DEFAULT_CHANNEL_COUNT
+
+DEFAULT_BANK_COUNT = 8
+DEFAULT_DURATION = 1.0
+DEFAULT_SAMPLE_RATE = 48000
+DEFAULT_SUBTYPE = "PCM_24"
+DEFAULT_AUDIO_CHANNELS = 2
+DEFAULT_SEED = 0
+
+
+class LibrarySpec(NamedTuple):
+    """The size and audio format of a synthetic library."""
+
+    banks: int = DEFAULT_BANK_COUNT
+    channels: int = DEFAULT_CHANNEL_COUNT
+    duration: float = DEFAULT_DURATION
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+    subtype: str = DEFAULT_SUBTYPE
+    audio_channels: int = DEFAULT_AUDIO_CHANNELS
+    seed: int = DEFAULT_SEED
+
+
+class SyntheticLibrary:
+    """Generate sample libraries of noise.
+
+    Each bank directory is named ``bank_NNN`` and holds one WAV file per
+    channel, named ``sample_N.wav``.  Samples are seeded, so a spec
+    always generates the same library.
+    """
+
+    @classmethod
+    def generate(cls, root: str | Path, spec: LibrarySpec) -> list[Path]:
+        """Generate a library.
+
+        Args:
+            root (str|Path): The directory to generate the library in.
+            spec (LibrarySpec): The size and audio format of the library.
+
+        Returns:
+            list[Path]: The bank files, in bank order.
+        """
+        assert spec.banks > 0, f"banks must be positive, but got {spec.banks}"
+        assert (
+            spec.channels == DEFAULT_CHANNEL_COUNT
+        ), f"banks must have {DEFAULT_CHANNEL_COUNT} channels, but got {spec.channels}"
+
+        rng = np.random.default_rng(spec.seed)
+        frames = max(1, round(spec.duration * spec.sample_rate))
+        bank_files = []
+
+        for bank in range(1, spec.banks + 1):
+            bank_directory = Path(root, f"bank_{bank:03}")
+            bank_directory.mkdir(parents=True, exist_ok=True)
+
+            for channel in range(1, spec.channels + 1):
+                sf.write(
+                    bank_directory / f"sample_{channel}.wav",
+                    cls.noise(rng, frames, spec.audio_channels),
+                    spec.sample_rate,
+                    subtype=spec.subtype,
+                )
+
+            BankInitializer.init(bank_directory, force=True)
+            bank_files.append(bank_directory / "bank.json")
+
+        return bank_files
+
+    @classmethod
+    def noise(cls, rng: np.random.Generator, frames: int, channels: int) -> np.ndarray:
+        """Generate quiet white noise.
+
+        Args:
+            rng (np.random.Generator): The noise generator.
+            frames (int): The number of frames.
+            channels (int): The number of channels.
+
+        Returns:
+            np.ndarray: The float32 noise, shaped ``(frames, channels)``.
+        """
+        return rng.uniform(-0.5, 0.5, (frames, channels)).astype(np.float32)
+
+    @classmethod
+    def pattern_lines(
+        cls, rng: np.random.Generator, channels: int, steps: int
+    ) -> list[str]:
+        """Generate the text lines of a random pattern.
+
+        Args:
+            rng (np.random.Generator): The step generator.
+            channels (int): The number of channels.
+            steps (int): The number of steps.
+
+        Returns:
+            list[str]: One line of ``x`` and ``.`` steps per channel.
+        """
+        hits = rng.random((channels, steps)) < 0.25
+
+        return ["".join(np.where(row, "x", ".")) for row in hits]
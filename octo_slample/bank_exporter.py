@@ -1,7 +1,13 @@
 """Export a bank to a set of wav files."""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from octo_slample.directory import DirectoryMixin
+from octo_slample.directory_walker import DirectoryIndex
+from octo_slample.export_manifest import ExportManifest
+from octo_slample.sample_converter import CONVERTER_VERSION
+from octo_slample.sampler.channel import Channel
 from octo_slample.sampler.json_sample_bank import JsonSampleBank
 from octo_slample.wav_writer import WavWriter
 
@@ -46,42 +52,292 @@ class BankExporter(DirectoryMixin):
         return bank_path, sample_paths
 
     @classmethod
-    def export_set(self, input_directory: Path, output_directory: Path) -> None:
+    def export_bank_incremental(
+        self,
+        bank_file: Path,
+        bank_number: int,
+        set_output_path: Path,
+        previous: dict | None = None,
+        bank: JsonSampleBank | None = None,
+    ) -> tuple[Path, list[str | ValueError], dict]:
+        """Export a bank, skipping files whose inputs are unchanged.
+
+        A channel is only written if its sample's contents or its export
+        settings differ from those recorded in `previous`, or if its
+        output file has changed since it was written.  `info.txt` is
+        only written if the bank file has changed.  Outputs of channels
+        that no longer have a sample are deleted.
+
+        Args:
+            bank_file (Path): The path to the bank file.
+            bank_number (int): The bank number.
+            set_output_path (Path): The Squid Set output path.
+            previous (dict, optional): The bank's entry in the manifest
+                of the previous export. Defaults to ``None``, which
+                writes every file.
+            bank (JsonSampleBank, optional): The bank, already loaded
+                from `bank_file`. Defaults to ``None``, which loads it.
+
+        Returns:
+            tuple[Path, list[str], dict]: A tuple containing:
+                The path at which the bank is saved
+                A list of paths of the exported files, or ValueError if
+                a sample could not be written.
+                The bank's new manifest entry.
+
+        Raises:
+            ValueError: If the bank file does not exist.
+            SchemaError: If the bank file is not valid.
+        """
+        if bank is None:
+            bank = JsonSampleBank.from_file(bank_file)
+        previous = previous if previous is not None else {}
+        previous_channels = previous.get("channels", {})
+
+        bank_path = WavWriter.build_bank_output_path(set_output_path, bank_number)
+        WavWriter.create_directory(bank_path)
+
+        sample_paths = []
+        channels = {}
+
+        for channel in bank._channels:
+            key = str(channel.number)
+            entry = previous_channels.get(key)
+            output_path = WavWriter.build_sample_output_path(bank_path, channel.number)
+
+            if channel.sample_path is None:
+                if entry is not None:
+                    Path(output_path).unlink(missing_ok=True)
+
+                sample_paths.append(WavWriter.write_channel(channel, bank_path))
+                continue
+
+            source = ExportManifest.file_record(
+                channel.sample_path, entry["source"] if entry else None
+            )
+
+            settings = self.channel_settings(channel)
+
+            if (
+                entry is not None
+                and entry["source"]["hash"] == source["hash"]
+                and entry.get("settings") == settings
+                and ExportManifest.is_unchanged(output_path, entry["output"])
+            ):
+                channels[key] = {
+                    "source": source,
+                    "settings": settings,
+                    "output": entry["output"],
+                }
+                sample_paths.append(output_path)
+                continue
+
+            output_path = WavWriter.write_channel(channel, bank_path)
+            channels[key] = {
+                "source": source,
+                "settings": settings,
+                "output": ExportManifest.file_record(output_path),
+            }
+            sample_paths.append(output_path)
+
+        previous_settings = previous.get("settings")
+        settings = ExportManifest.file_record(bank_file, previous_settings)
+        info_path = Path(bank_path, "info.txt")
+        info = previous.get("info")
+
+        if (
+            previous_settings is None
+            or previous_settings["hash"] != settings["hash"]
+            or not ExportManifest.is_unchanged(info_path, info)
+        ):
+            WavWriter.write_info_txt(bank, bank_path)
+            info = ExportManifest.file_record(info_path)
+
+        return (
+            bank_path,
+            sample_paths,
+            {"settings": settings, "info": info, "channels": channels},
+        )
+
+    @classmethod
+    def channel_settings(self, channel: Channel) -> dict:
+        """Record the settings a channel's sample is exported with.
+
+        A channel whose settings differ from those it was last exported
+        with is exported again.
+
+        Args:
+            channel (Channel): The channel.
+
+        Returns:
+            dict: The channel's ``volume``, and the ``converter`` version.
+        """
+        return {"volume": channel.volume, "converter": CONVERTER_VERSION}
+
+    @classmethod
+    def export_set(
+        self, input_directory: Path, output_directory: Path, jobs: int = 1
+    ) -> list[tuple[Path, list[str | ValueError]] | Exception]:
         """Export a set of sample banks to a Squid Sample set.
 
-        This method always overwrites the output directory, so be careful
-        when using it and ensure that your samples are stored elsewhere.
+        This method overwrites files in the output directory, so be
+        careful when using it and ensure that your samples are stored
+        elsewhere.
+
+        Bank directories are numbered in sorted order.  Bank files are
+        loaded concurrently before any bank is exported.  When `jobs` is
+        greater than 1, banks are exported in a pool of `jobs` processes.
+        Either way, results are returned in bank order, and a bank that
+        fails to export does not stop the others from being exported.
+
+        A manifest of the export is kept in the output directory.  Files
+        whose inputs are unchanged since the last export are not written
+        again, and outputs of banks that no longer exist are deleted.
 
         Args:
-            iinput_directorynput (Path): The input path.
+            input_directory (Path): The input path.
             output_directory (Path): The output path.
+            jobs (int, optional): The number of banks to export at once.
+                Defaults to 1.
 
         Returns:
-            list[Tuple[Path, str|ValueError]]: A list of tuples containing:
+            list[Tuple[Path, str|ValueError]|Exception]: A list, in bank
+                order, of either the exception that stopped the bank from
+                being exported, or a tuple containing:
                 The path at which the bank is saved
                 A list of paths of the exported files, or ValueError if
                 a sample could not be written.
 
         Raises:
             ValueError: If the input directory does not exist.
-            SchemaError: If the bank file is not valid.
         """
+        assert (
+            isinstance(jobs, int) and jobs >= 1
+        ), f"jobs must be a positive integer, but got {jobs}"
+
         self.directory = input_directory
 
         self.create_directory(output_directory)
 
+        manifest = ExportManifest.load(output_directory)
+
+        # the set and its bank directories are listed once, and the bank
+        # files are found in that listing rather than globbed again
+        index = DirectoryIndex.build(self.directory, max_depth=1)
         bank_directories = self.collect_subdirectories(
-            self.directory, with_file_suffix=".json"
+            self.directory, with_file_suffix=".json", index=index
         )
-        squid_banks = []
 
-        # for each bank directory, export the bank.  The bank number is
-        # the index of the bank directory in the list of bank directories.
-        for bank_number, bank_directory in enumerate(bank_directories):
-            bank_file = next(bank_directory.glob("*.json"))
+        # The bank number is the index of the bank directory in the
+        # sorted list of bank directories.
+        bank_files = [
+            index[bank_directory].json_files[0]
+            for bank_directory in bank_directories
+            if index[bank_directory].json_files
+        ]
+        bank_numbers = range(1, len(bank_files) + 1)
+        previous_entries = [manifest.banks.get(str(n)) for n in bank_numbers]
+        banks = JsonSampleBank.from_files(bank_files)
+
+        if jobs == 1 or len(bank_files) <= 1:
+            results = list(
+                map(
+                    self._export_bank_isolated,
+                    bank_files,
+                    bank_numbers,
+                    repeat(output_directory),
+                    previous_entries,
+                    banks,
+                )
+            )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(bank_files))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        self._export_bank_isolated,
+                        bank_files,
+                        bank_numbers,
+                        repeat(output_directory),
+                        previous_entries,
+                        banks,
+                    )
+                )
+
+        for bank_number, result in zip(bank_numbers, results):
+            # a bank that failed keeps its previous entry and outputs
+            if not isinstance(result, Exception):
+                manifest.banks[str(bank_number)] = result[2]
+
+        for key in [key for key in manifest.banks if int(key) > len(bank_files)]:
+            self._remove_bank_outputs(output_directory, int(key), manifest.banks[key])
+            del manifest.banks[key]
+
+        manifest.save(output_directory)
+
+        return [
+            result if isinstance(result, Exception) else result[:2]
+            for result in results
+        ]
+
+    @classmethod
+    def _export_bank_isolated(
+        self,
+        bank_file: Path,
+        bank_number: int,
+        set_output_path: Path,
+        previous: dict | None = None,
+        bank: JsonSampleBank | Exception | None = None,
+    ) -> tuple[Path, list[str | ValueError], dict] | Exception:
+        """Export a bank, returning any error rather than raising it.
+
+        Args:
+            bank_file (Path): The path to the bank file.
+            bank_number (int): The bank number.
+            set_output_path (Path): The Squid Set output path.
+            previous (dict, optional): The bank's entry in the manifest
+                of the previous export.
+            bank (JsonSampleBank|Exception, optional): The bank, already
+                loaded from `bank_file`, or the exception that stopped it
+                from being loaded.
+
+        Returns:
+            tuple[Path, list[str], dict]|Exception: The result of
+                `export_bank_incremental`, or the exception it raised.
+        """
+        if isinstance(bank, Exception):
+            return bank
+
+        try:
+            return self.export_bank_incremental(
+                bank_file, bank_number, set_output_path, previous, bank
+            )
+        except Exception as e:
+            return e
+
+    @classmethod
+    def _remove_bank_outputs(
+        self, set_output_path: Path, bank_number: int, entry: dict
+    ) -> None:
+        """Delete the files written for a bank that no longer exists.
+
+        Only files recorded in the manifest are deleted.  The bank
+        directory is removed if nothing else is left in it.
+
+        Args:
+            set_output_path (Path): The Squid Set output path.
+            bank_number (int): The bank number.
+            entry (dict): The bank's entry in the manifest.
+        """
+        bank_path = Path(WavWriter.build_bank_output_path(set_output_path, bank_number))
 
-            result = self.export_bank(bank_file, bank_number + 1, output_directory)
+        for number in entry.get("channels", {}):
+            Path(WavWriter.build_sample_output_path(bank_path, int(number))).unlink(
+                missing_ok=True
+            )
 
-            squid_banks.append(result)
+        Path(bank_path, "info.txt").unlink(missing_ok=True)
 
-        return squid_banks
+        if bank_path.is_dir() and not any(bank_path.iterdir()):
+            bank_path.rmdir()
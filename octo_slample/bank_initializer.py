@@ -10,9 +10,30 @@ Arguments:
     dir: The directory to initialize.
 """
 import json
+import struct
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
 
 from octo_slample.directory import DirectoryMixin
+from octo_slample.directory_walker import (
+    DEFAULT_MAX_WORKERS,
+    DirectoryIndex,
+    DirectoryScan,
+    DirectoryWalker,
+)
 from octo_slample.exception import BankExistsError
+from octo_slample.wav_reader import WavReader
+
+
+class InitSummary(NamedTuple):
+    """The outcome of a recursive initialization."""
+
+    directories_scanned: int
+    written: tuple[Path, ...]
+    skipped: tuple[Path, ...]
+    failed: tuple[tuple[Path, Exception], ...]
 
 
 class BankInitializer(DirectoryMixin):
@@ -54,64 +75,260 @@ class BankInitializer(DirectoryMixin):
                 not forcing.
             FileNotFoundError: If there are no WAV files in the directory.
         """
-        if self._recursive and self.collect_subdirectories(self.directory) != []:
+        if self._recursive:
             self.recursively_run()
         else:
             self.write_bank_file()
 
-    def recursively_run(self) -> None:
-        """Recursively run the initializer on subdirectories, if they exist."""
-        for subdirectory in self.collect_subdirectories(self.directory):
-            BankInitializer.init(
-                subdirectory,
-                self._force,
-                self._recursive,
-                self._ignore_existing_bank_file,
+    def recursively_run(
+        self,
+        jobs: int = DEFAULT_MAX_WORKERS,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> InitSummary:
+        """Recursively run the initializer on subdirectories, if they exist.
+
+        The tree is listed once into a
+        :class:`~octo_slample.directory_walker.DirectoryIndex`, then the
+        bank files are written by a pool of `jobs` threads.  A bank that
+        cannot be written does not stop the others.
+
+        Args:
+            jobs (int, optional): The maximum number of directories listed
+                or bank files written at once. Defaults to
+                `DEFAULT_MAX_WORKERS`.
+            progress (Callable[[int, int], None], optional): Called with
+                the number of banks completed and the total number of
+                banks, each time a bank is completed.
+
+        Returns:
+            InitSummary: The banks written, skipped and failed.
+        """
+        scans = DirectoryIndex.build(self.directory, max_workers=jobs)
+        bank_directories = self.collect_bank_directories(scans, self.directory)
+
+        written = []
+        skipped = []
+        failed = []
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            write = self._write_scanned_bank_file
+            futures = {
+                executor.submit(write, scans[directory]): directory
+                for directory in bank_directories
+            }
+
+            for completed, future in enumerate(as_completed(futures), start=1):
+                directory = futures[future]
+
+                try:
+                    (written if future.result() else skipped).append(directory)
+                except Exception as e:
+                    failed.append((directory, e))
+
+                if progress is not None:
+                    progress(completed, len(futures))
+
+        return InitSummary(
+            len(scans),
+            tuple(sorted(written)),
+            tuple(sorted(skipped)),
+            tuple(sorted(failed, key=lambda failure: failure[0])),
+        )
+
+    @classmethod
+    def collect_bank_directories(
+        cls, scans: Mapping[Path, DirectoryScan], root: Path
+    ) -> list[Path]:
+        """Find the directories to write bank files into.
+
+        Starting at `root`, subdirectories that contain WAV files or
+        further subdirectories are descended into.  A directory with no
+        such subdirectories gets a bank file.
+
+        Args:
+            scans (Mapping[Path, DirectoryScan]): The entries of each
+                directory in the tree.
+            root (Path): The root of the tree.
+
+        Returns:
+            list[Path]: The bank directories, sorted by path.
+        """
+
+        def is_candidate(directory: Path) -> bool:
+            scan = scans.get(directory)
+
+            return scan is not None and (
+                scan.has_suffix(".wav") or scan.subdirectories != ()
             )
 
-    def to_bank_dict(self) -> dict:
+        bank_directories = []
+        directories = [root]
+
+        while directories:
+            directory = directories.pop()
+            subdirectories = [
+                subdirectory
+                for subdirectory in scans[directory].subdirectories
+                if is_candidate(subdirectory)
+            ]
+
+            if subdirectories:
+                directories.extend(subdirectories)
+            else:
+                bank_directories.append(directory)
+
+        return sorted(bank_directories)
+
+    def _write_scanned_bank_file(self, scan: DirectoryScan) -> bool:
+        """Write the bank file for a directory that has been listed.
+
+        Args:
+            scan (DirectoryScan): The directory's entries.
+
+        Returns:
+            bool: True if the bank file was written, False if an existing
+                bank file was ignored.
+        """
+        initializer = BankInitializer(
+            scan.path,
+            self._force,
+            self._recursive,
+            self._ignore_existing_bank_file,
+        )
+
+        return initializer.write_bank_file(scan)
+
+    def to_bank_dict(self, files: Iterable[Path] | None = None) -> dict:
         """Convert the initializer instance to a bank dictionary.
 
+        Each sample's header is probed for its audio format, which is
+        stored under ``info``.  Samples whose header cannot be read are
+        stored without ``info``.
+
+        Args:
+            files (Iterable[Path], optional): The files in the directory.
+                Defaults to listing the directory.
+
         Returns:
             dict: The bank dictionary.
         """
+        files = DirectoryWalker.scan(self.directory).files if files is None else files
+
         return {
             "name": self.directory.name,
             "description": "",
             "samples": [
-                {
-                    "name": file.stem,
-                    "path": str(file.resolve()),
-                }
-                for file in sorted(self.directory.iterdir())
+                self.to_sample_dict(file)
+                for file in sorted(files)
                 if file.suffix == ".wav"
             ],
         }
 
-    def write_bank_file(self) -> None:
+    @classmethod
+    def to_sample_dict(cls, file: Path) -> dict:
+        """Convert a sample file to a bank sample dictionary.
+
+        Args:
+            file (Path): The sample file.
+
+        Returns:
+            dict: The sample dictionary.
+        """
+        sample = {
+            "name": file.stem,
+            "path": str(file.resolve()),
+        }
+
+        info = cls.probe_sample(file)
+        if info is not None:
+            sample["info"] = info
+
+        return sample
+
+    @classmethod
+    def probe_sample(cls, file: Path) -> dict | None:
+        """Read a sample's audio format from its header.
+
+        No audio is decoded.  PCM and float WAV headers are parsed
+        directly; soundfile is only imported for other formats.
+
+        Args:
+            file (Path): The sample file.
+
+        Returns:
+            dict: The sample's frame count, sample rate, channel count,
+                subtype, file size and modification time, or ``None`` if
+                the file or its header cannot be read.
+        """
+        try:
+            header = WavReader.read_header(file)
+        except (OSError, ValueError, struct.error):
+            return None
+
+        if header is not None and header.subtype is not None:
+            info = {
+                "frames": header.frames,
+                "sample_rate": header.sample_rate,
+                "channels": header.channels,
+                "subtype": header.subtype,
+            }
+        else:
+            import soundfile as sf
+
+            try:
+                sf_info = sf.info(str(file))
+            except (OSError, RuntimeError):
+                return None
+
+            info = {
+                "frames": sf_info.frames,
+                "sample_rate": sf_info.samplerate,
+                "channels": sf_info.channels,
+                "subtype": sf_info.subtype,
+            }
+
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+
+        return {**info, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def write_bank_file(self, scan: DirectoryScan | None = None) -> bool:
         """Write the bank file.
 
+        Args:
+            scan (DirectoryScan, optional): The directory's entries, if
+                it has already been listed.
+
+        Returns:
+            bool: True if the bank file was written, False if an existing
+                bank file was ignored.
+
         Raises:
             BankExistsError: If there is an existing bank file and we're
                 not forcing.
             FileNotFoundError: If there are no WAV files in the directory.
         """
-        if (self.directory / "bank.json").exists() and self._ignore_existing_bank_file:
-            return
+        scan = DirectoryWalker.scan(self.directory) if scan is None else scan
+        files = list(scan.files)
+        bank_exists = (self.directory / "bank.json") in files
 
-        if (self.directory / "bank.json").exists() and not self._force:
+        if bank_exists and self._ignore_existing_bank_file:
+            return False
+
+        if bank_exists and not self._force:
             raise BankExistsError(self.directory)
 
         # if there are no WAV files in the folder and we're not recursive,
         # throw an exception
-        if (
-            not any(file.suffix == ".wav" for file in self.directory.iterdir())
-            and not self._recursive
-        ):
+        if not any(file.suffix == ".wav" for file in files) and not self._recursive:
             raise FileNotFoundError(self.directory)
 
         with open(self.directory / "bank.json", "w") as bank_file:
-            json.dump(self.to_bank_dict(), bank_file, indent=4)
+            json.dump(self.to_bank_dict(files), bank_file, indent=4)
+
+        return True
 
     @classmethod
     def init(
@@ -138,7 +355,13 @@ class BankInitializer(DirectoryMixin):
         return initializer
 
     @classmethod
-    def init_recursive(cls, directory: str, force: bool = False) -> None:
+    def init_recursive(
+        cls,
+        directory: str,
+        force: bool = False,
+        jobs: int = DEFAULT_MAX_WORKERS,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> InitSummary:
         """Initialize a sample directory recursively.
 
         Ignores existing bank files if they exist.
@@ -146,8 +369,16 @@ class BankInitializer(DirectoryMixin):
         Args:
             directory (str): The directory to initialize.
             force (bool, optional): Whether to force initialization. Defaults to False.
+            jobs (int, optional): The maximum number of directories listed
+                or bank files written at once. Defaults to
+                `DEFAULT_MAX_WORKERS`.
+            progress (Callable[[int, int], None], optional): Called with
+                the number of banks completed and the total number of
+                banks, each time a bank is completed.
+
+        Returns:
+            InitSummary: The banks written, skipped and failed.
         """
         initializer = cls(directory, force, True, True)
-        initializer.run()
 
-        return initializer
+        return initializer.recursively_run(jobs, progress)
@@ -1,24 +1,34 @@
 """Command line interface for Octo Slample.
 
 Octo Slample is a sampler that can play 8 channels at once.
+
+Each command imports the modules it needs when it runs, so commands
+that do not play or convert audio, such as ``init``, start without
+importing numpy, soundfile or sounddevice.
 """
 
+from __future__ import annotations
+
+import threading
 import traceback
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import click
 from click import ClickException
-from schema import SchemaError
 
-from octo_slample.bank_exporter import BankExporter
-from octo_slample.bank_initializer import BankInitializer
-from octo_slample.constants import DEFAULT_BPM
+from octo_slample.bank_initializer import BankInitializer, InitSummary
+from octo_slample.constants import (
+    COMPILED_BANK_SUFFIX,
+    DEFAULT_BPM,
+    DEFAULT_MAX_POLYPHONY,
+)
+from octo_slample.directory_walker import DEFAULT_MAX_WORKERS
 from octo_slample.exception import BankExistsError
-from octo_slample.pattern.json_pattern import JsonPattern
-from octo_slample.sampler.json_sample_bank import JsonSampleBank
-from octo_slample.sampler.looping_sampler import LoopingSampler
-from octo_slample.sampler.sampler import Sampler
+from octo_slample.loop_stats import LoopStats
+
+if TYPE_CHECKING:
+    from octo_slample.sampler.sample_bank import SampleBank
 
 
 def read_valid_channel() -> Union[int, None]:
@@ -55,6 +65,28 @@ def print_pads_menu(sampler) -> None:
     click.echo("q: Quit")
 
 
+def load_bank(bank: str) -> SampleBank:
+    """Load a bank file.
+
+    Compiled banks, with the ``.octobank`` suffix, are memory-mapped.
+    Any other bank file is loaded as JSON.
+
+    Args:
+        bank (str): The bank file.
+
+    Returns:
+        SampleBank: The bank.
+    """
+    if Path(bank).suffix == COMPILED_BANK_SUFFIX:
+        from octo_slample.sampler.compiled_sample_bank import CompiledSampleBank
+
+        return CompiledSampleBank.from_file(bank)
+
+    from octo_slample.sampler.json_sample_bank import JsonSampleBank
+
+    return JsonSampleBank.from_file(bank)
+
+
 @click.group()
 def octo_slample() -> None:
     """Octo Slample command line interface."""
@@ -62,41 +94,183 @@ def octo_slample() -> None:
 
 
 @octo_slample.command()
-@click.option("--pattern", "-p", help="Pattern file", required=True, type=str)
+@click.option("--pattern", "-p", help="Pattern file", type=str)
+@click.option("--song", "-s", help="Song file, instead of a pattern", type=str)
 @click.option("--bank", "-b", help="Bank file", required=True, type=str)
 @click.option("--bpm", default=DEFAULT_BPM, help="Beats per minute", type=int)
-def loop(pattern: str, bank: str, bpm: int) -> None:
+@click.option(
+    "--polyphony",
+    default=DEFAULT_MAX_POLYPHONY,
+    help="Maximum number of voices",
+    metavar="N",
+    type=click.IntRange(min=1),
+)
+@click.option("--stats", is_flag=True, help="Report step timing on exit")
+@click.option(
+    "--stats-interval",
+    help="Also report step timing every N seconds",
+    metavar="N",
+    type=click.FloatRange(min=0, min_open=True),
+)
+def loop(
+    pattern: str | None,
+    song: str | None,
+    bank: str,
+    bpm: int,
+    polyphony: int,
+    stats: bool,
+    stats_interval: float | None,
+) -> None:
     """Run the loop mode.
 
-    In loop mode, the loop is played continuously.
+    In loop mode, the loop is played continuously.  Pass either a
+    pattern, or a song that chains patterns together.
 
     Args:
         pattern (str): The pattern file.
+        song (str): The song file.
         bank (str): The bank file.
         bpm (int): (Optional) Playback beats per minute.
+        polyphony (int): (Optional) Maximum number of voices.
+        stats (bool): (Optional) Report step timing on exit.
+        stats_interval (float): (Optional) Also report step timing
+            every `stats_interval` seconds.
 
     Raises:
+        UsageError: If neither or both of a pattern and song are passed.
         ClickException: If an error occurred.
     """
+    if (pattern is None) == (song is None):
+        raise click.UsageError("Pass either --pattern or --song")
+
+    from schema import SchemaError
+
+    from octo_slample.pattern.json_pattern import JsonPattern
+    from octo_slample.pattern.json_song import JsonSong
+    from octo_slample.sampler.looping_sampler import LoopingSampler
+
+    loop_stats = LoopStats() if stats or stats_interval else None
+    stop_reporting = threading.Event()
+
     try:
         s = LoopingSampler(
             bpm=bpm,
-            pattern=JsonPattern.from_file(pattern),
-            bank=JsonSampleBank.from_file(bank),
+            pattern=JsonPattern.from_file(pattern) if song is None else None,
+            bank=load_bank(bank),
+            max_polyphony=polyphony,
+            stats=loop_stats,
+            song=JsonSong.from_file(song) if song is not None else None,
         )
-        click.echo("Playing pattern: \n")
-        click.echo(s.pattern)
+
+        if song is None:
+            click.echo("Playing pattern: \n")
+            click.echo(s.pattern)
+        else:
+            click.echo("Playing song: \n")
+            click.echo(s.song)
+
+        if stats_interval:
+            report_loop_stats_periodically(loop_stats, stats_interval, stop_reporting)
+
         s.clock.start()
         s.loop()
     except SchemaError as e:
         raise ClickException(f"{e}")
     except Exception as e:
         raise ClickException("Unknown Error: " + str(e))
+    finally:
+        stop_reporting.set()
+        if loop_stats is not None:
+            print_loop_stats(loop_stats)
+
+
+def print_loop_stats(loop_stats: LoopStats) -> None:
+    """Print the step timing of a loop.
+
+    Args:
+        loop_stats (LoopStats): The loop's timing statistics.
+    """
+    click.echo("Step timing:")
+    for line in loop_stats.report().splitlines():
+        click.echo(f" - {line}")
+
+
+def report_loop_stats_periodically(
+    loop_stats: LoopStats, interval: float, stop: threading.Event
+) -> threading.Thread:
+    """Print the step timing of a loop until stopped.
+
+    Args:
+        loop_stats (LoopStats): The loop's timing statistics.
+        interval (float): The number of seconds between reports.
+        stop (threading.Event): Set to stop reporting.
+
+    Returns:
+        threading.Thread: The reporting thread.
+    """
+
+    def report() -> None:
+        while not stop.wait(interval):
+            print_loop_stats(loop_stats)
+
+    reporter = threading.Thread(target=report, daemon=True)
+    reporter.start()
+
+    return reporter
+
+
+@octo_slample.command()
+@click.option("--pattern", "-p", help="Pattern file", required=True, type=str)
+@click.option("--bank", "-b", help="Bank file", required=True, type=str)
+@click.option("--output", "-o", help="Output WAV file", required=True, type=str)
+@click.option("--bpm", default=DEFAULT_BPM, help="Beats per minute", type=int)
+@click.option("--bars", help="Number of bars to render", type=int)
+def render(pattern: str, bank: str, output: str, bpm: int, bars: int | None) -> None:
+    """Render a pattern to a WAV file.
+
+    Rendering is performed offline, faster than real time.
+
+    Args:
+        pattern (str): The pattern file.
+        bank (str): The bank file.
+        output (str): The WAV file to write.
+        bpm (int): (Optional) Beats per minute.
+        bars (int): (Optional) The number of bars to render.
+            Defaults to a single pass of the pattern.
+
+    Raises:
+        ClickException: If an error occurred.
+    """
+    from schema import SchemaError
+
+    from octo_slample.pattern.json_pattern import JsonPattern
+    from octo_slample.sampler.pattern_renderer import PatternRenderer
+
+    try:
+        renderer = PatternRenderer(
+            JsonPattern.from_file(pattern),
+            load_bank(bank),
+            bpm=bpm,
+        )
+        path = renderer.write(output, bars)
+
+        click.echo(f"Rendered pattern to '{path}'")
+    except SchemaError as e:
+        raise ClickException(f"{e}")
+    except Exception as e:
+        raise ClickException("Unknown Error: " + str(e))
 
 
 @octo_slample.command()
 @click.option("--bank", "-b", help="Bank file", required=True, type=str)
-def pads(bank: str) -> None:
+@click.option(
+    "--polyphony",
+    default=DEFAULT_MAX_POLYPHONY,
+    help="Maximum number of voices",
+    metavar="N",
+    type=click.IntRange(min=1),
+)
+def pads(bank: str, polyphony: int) -> None:
     """Run the pads mode.
 
     In pads mode, the user can play channels by pressing the corresponding
@@ -106,6 +280,7 @@ def pads(bank: str) -> None:
 
     Args:
         bank (str): The bank file.
+        polyphony (int): (Optional) Maximum number of voices.
 
     Raises:
         ClickException: If an error occurred.
@@ -113,10 +288,12 @@ def pads(bank: str) -> None:
     Returns:
         None: If the user quits.
     """
+    from octo_slample.sampler.sampler import Sampler
+
     click.clear()
 
-    s = Sampler()
-    s.bank = JsonSampleBank.from_file(bank)
+    s = Sampler(max_polyphony=polyphony)
+    s.bank = load_bank(bank)
 
     print_pads_menu(s)
 
@@ -132,6 +309,43 @@ def pads(bank: str) -> None:
 
         click.echo(f"Playing channel {channel}")
 
+    s.mixer.stop()
+
+
+@octo_slample.command(name="compile")
+@click.option("--bank", "-b", help="Bank file", required=True, type=str)
+@click.option("--output", "-o", help="Compiled bank file", type=str)
+def compile_bank(bank: str, output: str | None) -> None:
+    """Compile a bank to a single file that opens instantly.
+
+    The bank's samples are decoded and written after its settings, so
+    `loop`, `pads` and `render` can memory-map them rather than decode
+    them.  The output defaults to the bank file with an ``.octobank``
+    suffix.
+
+    Args:
+        bank (str): The bank file.
+        output (str): (Optional) The compiled bank file.
+
+    Raises:
+        ClickException: If an error occurred.
+    """
+    from schema import SchemaError
+
+    from octo_slample.sampler.compiled_sample_bank import CompiledSampleBank
+    from octo_slample.sampler.json_sample_bank import JsonSampleBank
+
+    output = output or str(Path(bank).with_suffix(COMPILED_BANK_SUFFIX))
+
+    try:
+        path = CompiledSampleBank.compile(JsonSampleBank.from_file(bank), output)
+
+        click.echo(f"Compiled bank to '{path}'")
+    except SchemaError as e:
+        raise ClickException(f"{e}")
+    except Exception as e:
+        raise ClickException("Unknown Error: " + str(e))
+
 
 @octo_slample.command()
 @click.option("--bank", "-b", help="Bank file", required=True, type=str)
@@ -139,6 +353,8 @@ def pads(bank: str) -> None:
 @click.option("--output", "-o", help="Output path", required=True, type=str)
 def export(bank: str, bank_number: int, output: str) -> None:
     """Export a bank to a set of wav files."""
+    from octo_slample.bank_exporter import BankExporter
+
     try:
         click.echo("Exporting bank to Squid format...")
 
@@ -157,7 +373,15 @@ def export(bank: str, bank_number: int, output: str) -> None:
 @octo_slample.command()
 @click.argument("input_directory", type=click.Path(exists=True))
 @click.argument("output_directory", type=click.Path(exists=False))
-def export_set(input_directory: Path, output_directory: Path) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of banks to export at once",
+    default=1,
+    type=click.IntRange(min=1),
+    metavar="N",
+)
+def export_set(input_directory: Path, output_directory: Path, jobs: int = 1) -> None:
     """Export a set of banks to a Squid formatted Set.
 
     Usage:
@@ -166,18 +390,28 @@ def export_set(input_directory: Path, output_directory: Path) -> None:
     Args:
         input_directory (Path): The input directory. Must exist.
         output_directory (Path): The output directory. Does not need to exist.
+        jobs (int): The number of banks to export at once.
 
     Raises:
         ClickException: If an error occurred.
     """
+    from octo_slample.bank_exporter import BankExporter
+
     try:
         click.echo(f"- Creating '{output_directory}' if it doesn't exist")
         BankExporter.create_directory(output_directory)
 
         click.echo(f"- Exporting banks in '{input_directory}' to '{output_directory}'")
-        results = BankExporter.export_set(input_directory, output_directory)
+        results = BankExporter.export_set(input_directory, output_directory, jobs)
+
+        failures = 0
+        for bank_number, result in enumerate(results, start=1):
+            if isinstance(result, Exception):
+                failures += 1
+                click.echo(f" - Bank {bank_number} failed: {result}")
+                continue
 
-        for bank_path, sample_paths in results:
+            bank_path, sample_paths = result
             click.echo(f" - {bank_path}")
             for sample_path in sample_paths:
                 click.echo(f"   - {sample_path}")
@@ -185,6 +419,9 @@ def export_set(input_directory: Path, output_directory: Path) -> None:
         traceback.print_exception(e)
         raise ClickException(f"Export error: {e}")
 
+    if failures:
+        raise ClickException(f"{failures} of {len(results)} banks failed to export")
+
 
 @octo_slample.command()
 @click.argument("directory", type=click.Path(exists=True))
@@ -204,12 +441,33 @@ def export_set(input_directory: Path, output_directory: Path) -> None:
     required=False,
     type=bool,
 )
-def init(directory: Path, force: bool = False, recursive: bool = False) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of directories to initialize at once",
+    default=DEFAULT_MAX_WORKERS,
+    type=click.IntRange(min=1),
+    metavar="N",
+)
+def init(
+    directory: Path,
+    force: bool = False,
+    recursive: bool = False,
+    jobs: int = DEFAULT_MAX_WORKERS,
+) -> None:
     """Initialize a sample directory."""
     try:
         if recursive:
             click.echo(f"Initializing sample directory '{directory}' recursively")
-            BankInitializer.init_recursive(directory, force)
+            summary = BankInitializer.init_recursive(
+                directory, force, jobs, print_init_progress
+            )
+            print_init_summary(summary)
+
+            if summary.failed:
+                raise ClickException(
+                    f"{len(summary.failed)} directories could not be initialized"
+                )
         else:
             BankInitializer.init(directory, force)
 
@@ -226,5 +484,29 @@ def init(directory: Path, force: bool = False, recursive: bool = False) -> None:
         )
 
 
+def print_init_progress(completed: int, total: int) -> None:
+    """Print the progress of a recursive initialization.
+
+    Args:
+        completed (int): The number of banks completed.
+        total (int): The total number of banks.
+    """
+    click.echo(f"\r- {completed}/{total} banks", nl=completed == total)
+
+
+def print_init_summary(summary: InitSummary) -> None:
+    """Print the summary of a recursive initialization.
+
+    Args:
+        summary (InitSummary): The summary.
+    """
+    click.echo(f"- Scanned {summary.directories_scanned} directories")
+    click.echo(f"- Wrote {len(summary.written)} bank files")
+    click.echo(f"- Skipped {len(summary.skipped)} existing bank files")
+
+    for directory, error in summary.failed:
+        click.echo(f"- Failed '{directory}': {type(error).__name__}: {error}")
+
+
 if __name__ == "__main__":
     octo_slample()
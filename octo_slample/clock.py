@@ -1,12 +1,33 @@
 """Clock module.
 
 This module contains the clock function that is used to play the music.
+
+The clock has two schedules.  The ``epoch`` schedule sleeps until the
+next multiple of the step length on the wall clock.  The ``deadline``
+schedule anchors to a monotonic counter when the clock is started and
+waits for absolute per-step deadlines, so it stays phase-locked to the
+start time however long it runs, and reports the deadlines it misses.
 """
 
 
 import time
 
-from octo_slample.constants import DEFAULT_BPM, DEFAULT_STEP_COUNT, SECONDS_PER_MINUTE
+from octo_slample.constants import (
+    DEFAULT_BPM,
+    DEFAULT_STEP_COUNT,
+    NANOSECONDS_PER_SECOND,
+    SECONDS_PER_MINUTE,
+    SIXTEENTHS_PER_BEAT,
+)
+from octo_slample.loop_stats import LatencyHistogram
+
+SCHEDULE_EPOCH = "epoch"
+SCHEDULE_DEADLINE = "deadline"
+SCHEDULES = (SCHEDULE_EPOCH, SCHEDULE_DEADLINE)
+
+# the final stretch before a deadline is spun rather than slept, as
+# sleeps can overshoot by around a millisecond
+DEFAULT_SPIN_NS = 1_000_000
 
 
 class Clock:
@@ -15,7 +36,14 @@ class Clock:
     This class is used to iterate in time between beats.
     """
 
-    def __init__(self, step_count: int = DEFAULT_STEP_COUNT, bpm: int = DEFAULT_BPM):
+    def __init__(
+        self,
+        step_count: int = DEFAULT_STEP_COUNT,
+        bpm: int = DEFAULT_BPM,
+        schedule: str = SCHEDULE_EPOCH,
+        spin_ns: int = DEFAULT_SPIN_NS,
+        lateness: LatencyHistogram | None = None,
+    ):
         """Initialize the clock with the given step count and beats per minute.
 
         The step count determines the number of steps per pattern, while BPM
@@ -26,12 +54,31 @@ class Clock:
                 Defaults to `DEFAULT_STEP_COUNT`.
             bpm (int, optional): The beats per minute of the clock.
                 Defaults to `DEFAULT_BPM`.
+            schedule (str, optional): How beats are timed, one of
+                `SCHEDULES`. Defaults to `SCHEDULE_EPOCH`.
+            spin_ns (int, optional): How long before a deadline the
+                ``deadline`` schedule stops sleeping and spins.
+                Defaults to `DEFAULT_SPIN_NS`.
+            lateness (LatencyHistogram, optional): If given, how late
+                each beat is reached is recorded into it.
         """
+        assert (
+            schedule in SCHEDULES
+        ), f"schedule must be one of {SCHEDULES}, but got {schedule}"
+        assert spin_ns >= 0, f"spin_ns must not be negative, but got {spin_ns}"
+
         self._counter = 0
         self._step_count = step_count
         self._bpm = bpm
         self._steps_per_second = SECONDS_PER_MINUTE / bpm * self._step_count
         self._is_running = False
+        self._schedule = schedule
+        self._spin_ns = spin_ns
+        self._start_ns = 0
+        self._next_step = 1
+        self._missed_deadlines = 0
+        self._max_lateness_ns = 0
+        self._lateness = lateness
 
     def beat(self) -> int:
         """Go to the next beat of the clock.
@@ -50,10 +97,10 @@ class Clock:
         if self._is_running is False:
             return self._counter
 
-        time.sleep(
-            1 / self._steps_per_second
-            - time.time() * self._steps_per_second % 1 / self._steps_per_second
-        )
+        if self._schedule == SCHEDULE_DEADLINE:
+            self._wait_for_deadline()
+        else:
+            self._wait_for_epoch_step()
 
         self._counter += 1
         if self._counter == self._step_count:
@@ -61,6 +108,141 @@ class Clock:
 
         return self._counter
 
+    def _wait_for_epoch_step(self) -> None:
+        """Sleep until the next multiple of the step length.
+
+        Returns:
+            None
+        """
+        delay = (
+            1 / self._steps_per_second
+            - time.time() * self._steps_per_second % 1 / self._steps_per_second
+        )
+
+        if self._lateness is None:
+            time.sleep(delay)
+            return
+
+        target = time.perf_counter_ns() + round(delay * NANOSECONDS_PER_SECOND)
+        time.sleep(delay)
+        self._lateness.record(time.perf_counter_ns() - target)
+
+    def _wait_for_deadline(self) -> None:
+        """Wait for the next step's deadline.
+
+        The deadline is computed from the start time, so lateness does not
+        accumulate.  The wait sleeps until `spin_ns` before the deadline,
+        then spins.
+
+        A step that is reached after its deadline is counted as missed and
+        returns at once, so the clock catches up.  If a whole step or more
+        has been lost, the steps in between are skipped and the clock
+        resumes on the next deadline, keeping its phase.
+
+        Returns:
+            None
+        """
+        deadline = self.deadline_ns(self._next_step)
+        now = time.perf_counter_ns()
+
+        if now > deadline:
+            self._missed_deadlines += 1
+            self._max_lateness_ns = max(self._max_lateness_ns, now - deadline)
+            if self._lateness is not None:
+                self._lateness.record(now - deadline)
+
+            if now - deadline >= self.step_ns:
+                self._next_step = self.step_at(now) + 1
+            else:
+                self._next_step += 1
+
+            return
+
+        if deadline - now > self._spin_ns:
+            time.sleep((deadline - now - self._spin_ns) / NANOSECONDS_PER_SECOND)
+
+        while (now := time.perf_counter_ns()) < deadline:
+            pass
+
+        if self._lateness is not None:
+            self._lateness.record(now - deadline)
+
+        self._next_step += 1
+
+    @property
+    def step_ns(self) -> float:
+        """Get the length of a sixteenth-note step.
+
+        Returns:
+            float: The step length, in nanoseconds.
+        """
+        return (
+            SECONDS_PER_MINUTE
+            * NANOSECONDS_PER_SECOND
+            / (self._bpm * SIXTEENTHS_PER_BEAT)
+        )
+
+    def deadline_ns(self, step: int) -> int:
+        """Get the deadline of a step.
+
+        Args:
+            step (int): The number of steps since the clock started.
+
+        Returns:
+            int: The step's deadline, on the `time.perf_counter_ns` clock.
+        """
+        return self._start_ns + (
+            step
+            * SECONDS_PER_MINUTE
+            * NANOSECONDS_PER_SECOND
+            // (self._bpm * SIXTEENTHS_PER_BEAT)
+        )
+
+    def step_at(self, time_ns: int) -> int:
+        """Get the number of whole steps between the start and a time.
+
+        Args:
+            time_ns (int): The time, on the `time.perf_counter_ns` clock.
+
+        Returns:
+            int: The number of whole steps.
+        """
+        return (
+            (time_ns - self._start_ns)
+            * self._bpm
+            * SIXTEENTHS_PER_BEAT
+            // (SECONDS_PER_MINUTE * NANOSECONDS_PER_SECOND)
+        )
+
+    @property
+    def schedule(self) -> str:
+        """Get how beats are timed.
+
+        Returns:
+            str: One of `SCHEDULES`.
+        """
+        return self._schedule
+
+    @property
+    def missed_deadlines(self) -> int:
+        """Get the number of beats reached after their deadline.
+
+        Only the ``deadline`` schedule has deadlines.
+
+        Returns:
+            int: The number of missed deadlines since the clock started.
+        """
+        return self._missed_deadlines
+
+    @property
+    def max_lateness_ns(self) -> int:
+        """Get the latest a beat has been reached after its deadline.
+
+        Returns:
+            int: The lateness, in nanoseconds.
+        """
+        return self._max_lateness_ns
+
     @property
     def is_running(self) -> bool:
         """Get whether the clock is running.
@@ -73,9 +255,16 @@ class Clock:
     def start(self) -> None:
         """Start the clock.
 
+        The ``deadline`` schedule is anchored to the start time, and its
+        missed deadlines are reset.
+
         Returns:
             None
         """
+        self._start_ns = time.perf_counter_ns()
+        self._next_step = 1
+        self._missed_deadlines = 0
+        self._max_lateness_ns = 0
         self._is_running = True
 
     def stop(self) -> None:
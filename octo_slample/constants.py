@@ -5,8 +5,13 @@ constants are used throughout the project to ensure consistency and to
 avoid magic numbers.
 """
 BEATS_PER_BAR = 4
+COMPILED_BANK_SUFFIX = ".octobank"
 DEFAULT_BPM = 120
 DEFAULT_CHANNEL_COUNT = 8
+DEFAULT_MAX_POLYPHONY = 32
+DEFAULT_SAMPLE_RATE = 44100
 DEFAULT_STEP_COUNT = 16
+NANOSECONDS_PER_SECOND = 1_000_000_000
 SECONDS_PER_MINUTE = 60
 SIXTEENTHS_PER_BAR = 16
+SIXTEENTHS_PER_BEAT = SIXTEENTHS_PER_BAR // BEATS_PER_BAR
@@ -3,6 +3,8 @@ from abc import ABCMeta
 from pathlib import Path
 from typing import Union
 
+from octo_slample.directory_walker import DirectoryIndex
+
 
 class DirectoryMixin(metaclass=ABCMeta):
     """A mixin class for working with directories."""
@@ -40,17 +42,24 @@ class DirectoryMixin(metaclass=ABCMeta):
 
     @classmethod
     def collect_subdirectories(
-        self, directory: Path, with_file_suffix: str = ".wav"
-    ) -> None:
+        self,
+        directory: Path,
+        with_file_suffix: str = ".wav",
+        index: DirectoryIndex | None = None,
+    ) -> list[Path]:
         """Collect all subdirectories with WAV files.
 
         For the given `directory`, collect all subdirectories that contain
         WAV files, or subdirectories that contain subdirectories that can
-        be iterated further.
+        be iterated further.  Subdirectories are returned sorted by
+        path, so the order does not depend on the filesystem.
 
         Args:
             directory (Path): The directory to collect subdirectories from.
             with_file_suffix (str): The file suffix to look for.
+            index (DirectoryIndex, optional): An index of the tree to
+                reuse.  Defaults to listing `directory` and its
+                subdirectories once.
 
         Returns:
             list: The list of subdirectories.
@@ -58,15 +67,10 @@ class DirectoryMixin(metaclass=ABCMeta):
         directory = Path(directory)
         assert directory.is_dir(), "Directory must be a directory."
 
-        return [
-            subdirectory
-            for subdirectory in directory.iterdir()
-            if subdirectory.is_dir()
-            and any(
-                (file.suffix == with_file_suffix or file.is_dir())
-                for file in subdirectory.iterdir()
-            )
-        ]
+        if index is None:
+            index = DirectoryIndex.build(directory, max_depth=1)
+
+        return index.subdirectories_with(directory, with_file_suffix)
 
     @classmethod
     def create_directory(cls, path: Union[str, Path]) -> None:
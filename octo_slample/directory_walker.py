@@ -0,0 +1,273 @@
+"""Concurrent directory tree walker.
+
+This module contains the DirectoryScan, DirectoryWalker and
+DirectoryIndex classes.  Each directory is listed once, with
+`os.scandir`, and the directories at each depth are listed concurrently,
+so walking a tree on a network mount is bounded by round trips per level
+rather than per directory.
+"""
+import os
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+DEFAULT_MAX_WORKERS = 16
+
+
+class DirectoryScan(NamedTuple):
+    """The entries of one directory."""
+
+    path: Path
+    files: tuple[Path, ...]
+    subdirectories: tuple[Path, ...]
+    error: OSError | None = None
+    stat_calls: int = 0
+
+    @property
+    def wav_files(self) -> tuple[Path, ...]:
+        """Get the WAV files in the directory.
+
+        Returns:
+            tuple[Path, ...]: The WAV files, sorted by path.
+        """
+        return tuple(file for file in self.files if file.suffix == ".wav")
+
+    @property
+    def json_files(self) -> tuple[Path, ...]:
+        """Get the JSON files in the directory.
+
+        Returns:
+            tuple[Path, ...]: The JSON files, sorted by path.
+        """
+        return tuple(file for file in self.files if file.suffix == ".json")
+
+    def has_suffix(self, suffix: str) -> bool:
+        """Whether the directory contains a file with the given suffix.
+
+        Args:
+            suffix (str): The file suffix, e.g. ``".wav"``.
+
+        Returns:
+            bool: True if a file in the directory has the suffix.
+        """
+        return any(file.suffix == suffix for file in self.files)
+
+
+class DirectoryWalker:
+    """Walk a directory tree with a bounded pool of threads."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize the walker.
+
+        Args:
+            max_workers (int, optional): The maximum number of
+                directories listed at once. Defaults to
+                `DEFAULT_MAX_WORKERS`.
+        """
+        assert (
+            isinstance(max_workers, int) and max_workers > 0
+        ), f"max_workers must be a positive integer, but got {max_workers}"
+
+        self._max_workers = max_workers
+
+    @classmethod
+    def scan(cls, directory: str | Path) -> DirectoryScan:
+        """List a directory's files and subdirectories.
+
+        Entries are sorted by path.  A directory that cannot be listed is
+        returned empty, with the error that stopped it being listed.
+
+        Entry types come from the directory listing itself, so no entry is
+        stat'ed, except symbolic links, which are followed.  Those stat
+        calls are counted in the scan's ``stat_calls``.
+
+        Args:
+            directory (str|Path): The directory to list.
+
+        Returns:
+            DirectoryScan: The directory's entries.
+        """
+        directory = Path(directory)
+        files = []
+        subdirectories = []
+        stat_calls = 0
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+
+                        if not is_dir and entry.is_symlink():
+                            stat_calls += 1
+                            is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+
+                    (subdirectories if is_dir else files).append(directory / entry.name)
+        except OSError as e:
+            return DirectoryScan(directory, (), (), e, stat_calls)
+
+        return DirectoryScan(
+            directory,
+            tuple(sorted(files)),
+            tuple(sorted(subdirectories)),
+            None,
+            stat_calls,
+        )
+
+    def walk(
+        self, root: str | Path, max_depth: int | None = None
+    ) -> dict[Path, DirectoryScan]:
+        """List every directory in a tree.
+
+        Args:
+            root (str|Path): The root of the tree.
+            max_depth (int, optional): The depth of the deepest
+                directories to list, where the root is at depth 0.
+                Defaults to ``None``, which lists the whole tree.
+
+        Returns:
+            dict[Path, DirectoryScan]: The entries of each directory in
+                the tree, keyed by path.
+        """
+        scans = {}
+        level = [Path(root)]
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while level and (max_depth is None or depth <= max_depth):
+                depth += 1
+                level_scans = list(executor.map(self.scan, level))
+                scans.update((scan.path, scan) for scan in level_scans)
+
+                level = [
+                    subdirectory
+                    for scan in level_scans
+                    for subdirectory in scan.subdirectories
+                    if subdirectory not in scans
+                ]
+
+        return scans
+
+
+class DirectoryIndex(Mapping):
+    """An immutable index of the directories in a tree.
+
+    The index maps each listed directory's path to its
+    :class:`DirectoryScan`, so callers that need the same tree can share
+    one listing rather than each listing it again.
+    """
+
+    def __init__(self, root: str | Path, scans: Mapping[Path, DirectoryScan]):
+        """Initialize the index.
+
+        Args:
+            root (str|Path): The root of the tree.
+            scans (Mapping[Path, DirectoryScan]): The entries of each
+                directory, keyed by path.
+        """
+        self._root = Path(root)
+        self._scans = MappingProxyType(dict(scans))
+
+    @classmethod
+    def build(
+        cls,
+        root: str | Path,
+        max_depth: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> "DirectoryIndex":
+        """Walk a tree and index it.
+
+        Args:
+            root (str|Path): The root of the tree.
+            max_depth (int, optional): The depth of the deepest
+                directories to list, where the root is at depth 0.
+                Defaults to ``None``, which lists the whole tree.
+            max_workers (int, optional): The maximum number of
+                directories listed at once. Defaults to
+                `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            DirectoryIndex: The index.
+        """
+        return cls(root, DirectoryWalker(max_workers).walk(root, max_depth))
+
+    @property
+    def root(self) -> Path:
+        """Get the root of the tree.
+
+        Returns:
+            Path: The root of the tree.
+        """
+        return self._root
+
+    @property
+    def scandir_calls(self) -> int:
+        """Get the number of directories listed to build the index.
+
+        Returns:
+            int: The number of `os.scandir` calls.
+        """
+        return len(self._scans)
+
+    @property
+    def stat_calls(self) -> int:
+        """Get the number of entries stat'ed to build the index.
+
+        Returns:
+            int: The number of stat calls.
+        """
+        return sum(scan.stat_calls for scan in self._scans.values())
+
+    def __getitem__(self, directory: Path) -> DirectoryScan:
+        """Get the entries of a directory.
+
+        Args:
+            directory (Path): The directory.
+
+        Returns:
+            DirectoryScan: The directory's entries.
+        """
+        return self._scans[directory]
+
+    def __iter__(self) -> Iterator[Path]:
+        """Iterate over the indexed directories.
+
+        Returns:
+            Iterator[Path]: The indexed directories.
+        """
+        return iter(self._scans)
+
+    def __len__(self) -> int:
+        """Return the number of indexed directories.
+
+        Returns:
+            int: The number of indexed directories.
+        """
+        return len(self._scans)
+
+    def subdirectories_with(self, directory: Path, suffix: str) -> list[Path]:
+        """Find the subdirectories that contain files or subdirectories.
+
+        Only subdirectories that contain a file with `suffix`, or that
+        contain subdirectories of their own, are returned.
+
+        Args:
+            directory (Path): The directory to search.
+            suffix (str): The file suffix to look for.
+
+        Returns:
+            list[Path]: The subdirectories, sorted by path.
+        """
+        return [
+            subdirectory
+            for subdirectory in self[directory].subdirectories
+            if subdirectory in self
+            and (
+                self[subdirectory].has_suffix(suffix)
+                or self[subdirectory].subdirectories != ()
+            )
+        ]
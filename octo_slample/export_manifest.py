@@ -0,0 +1,124 @@
+"""A record of the files written by a set export.
+
+This module contains the ExportManifest class.  The manifest is stored
+in the exported set and records, for each bank and channel, the content
+hashes of the inputs and outputs, and each channel's export settings,
+so later exports only rewrite the files whose inputs have changed.
+"""
+import json
+from pathlib import Path
+
+from octo_slample.sampler.sample_store import SampleStore
+
+MANIFEST_FILE_NAME = "octo-slample-manifest.json"
+MANIFEST_VERSION = 1
+
+
+class ExportManifest:
+    """A record of the files written by a set export.
+
+    Banks are keyed by bank number and channels by channel number, both
+    as strings so the manifest round-trips through JSON unchanged.
+    """
+
+    def __init__(self, banks: dict | None = None):
+        """Initialize the manifest.
+
+        Args:
+            banks (dict, optional): The manifest entry of each bank,
+                keyed by bank number. Defaults to no banks.
+        """
+        self.banks = banks if banks is not None else {}
+
+    @classmethod
+    def load(cls, set_output_path: str | Path) -> "ExportManifest":
+        """Load the manifest of an exported set.
+
+        A missing, unreadable or outdated manifest is treated as empty,
+        so every file is written again.
+
+        Args:
+            set_output_path (str|Path): The Squid Set output path.
+
+        Returns:
+            ExportManifest: The manifest.
+        """
+        try:
+            with open(Path(set_output_path, MANIFEST_FILE_NAME)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+        ):
+            return cls()
+
+        return cls(manifest.get("banks", {}))
+
+    def save(self, set_output_path: str | Path) -> None:
+        """Write the manifest into an exported set.
+
+        Args:
+            set_output_path (str|Path): The Squid Set output path.
+        """
+        with open(Path(set_output_path, MANIFEST_FILE_NAME), "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "banks": self.banks}, f, indent=4)
+
+    @classmethod
+    def file_record(cls, path: str | Path, previous: dict | None = None) -> dict:
+        """Record a file's path, size, modification time and content hash.
+
+        If `previous` records the same path, size and modification time,
+        its hash is reused rather than hashing the file again.
+
+        Args:
+            path (str|Path): The path to the file.
+            previous (dict, optional): An earlier record of the file.
+
+        Returns:
+            dict: The record of the file.
+        """
+        stat = Path(path).stat()
+        record = {
+            "path": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+        if previous is not None and all(
+            previous.get(key) == value for key, value in record.items()
+        ):
+            record["hash"] = previous["hash"]
+        else:
+            record["hash"] = SampleStore.hash_file(path)
+
+        return record
+
+    @classmethod
+    def is_unchanged(cls, path: str | Path, record: dict | None) -> bool:
+        """Whether a file still matches its record.
+
+        Only the file's size and modification time are checked, so the
+        file is not read.
+
+        Args:
+            path (str|Path): The path to the file.
+            record (dict): The record of the file. May be ``None``.
+
+        Returns:
+            bool: True if the file exists and matches the record.
+        """
+        if record is None:
+            return False
+
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return False
+
+        return (stat.st_size, stat.st_mtime_ns) == (
+            record.get("size"),
+            record.get("mtime_ns"),
+        )
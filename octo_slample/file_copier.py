@@ -0,0 +1,157 @@
+"""Copy files without reading them into Python.
+
+This module contains the FileCopier class, which copies files with the
+fastest mechanism the platform and filesystem support: a reflink, then
+`os.copy_file_range`, then `os.sendfile`, falling back to a buffered
+copy.
+"""
+import os
+import shutil
+from pathlib import Path
+
+# from linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+class FileCopier:
+    """Copy files in the kernel where possible.
+
+    This class contains class methods that copy a file's bytes without
+    passing them through Python.  Each mechanism is tried in turn, and
+    a mechanism that is not supported by the platform or filesystem
+    falls through to the next.
+    """
+
+    @classmethod
+    def copy(cls, source_path: str | Path, output_path: str | Path) -> str:
+        """Copy a file.
+
+        An existing file at `output_path` is overwritten.
+
+        Args:
+            source_path (str|Path): The path to the file to copy.
+            output_path (str|Path): The path to copy the file to.
+
+        Returns:
+            str: The path to the copied file.
+        """
+        with open(source_path, "rb") as source, open(output_path, "wb") as output:
+            size = os.fstat(source.fileno()).st_size
+
+            if not (
+                cls._reflink(source, output)
+                or cls._copy_file_range(source, output, size)
+                or cls._sendfile(source, output, size)
+            ):
+                source.seek(0)
+                output.seek(0)
+                output.truncate()
+                shutil.copyfileobj(source, output)
+
+        return str(output_path)
+
+    @classmethod
+    def _reflink(cls, source, output) -> bool:
+        """Share the source's blocks with the output, on Linux.
+
+        Reflinks are supported by copy-on-write filesystems such as
+        Btrfs and XFS.  No data is copied.
+
+        Args:
+            source: The source file, open for reading.
+            output: The output file, open for writing.
+
+        Returns:
+            bool: True if the file was cloned.
+        """
+        try:
+            import fcntl
+
+            fcntl.ioctl(output.fileno(), FICLONE, source.fileno())
+        except (ImportError, OSError):
+            return False
+
+        return True
+
+    @classmethod
+    def _copy_file_range(cls, source, output, size: int) -> bool:
+        """Copy the file within the kernel with `os.copy_file_range`.
+
+        Args:
+            source: The source file, open for reading.
+            output: The output file, open for writing.
+            size (int): The number of bytes to copy.
+
+        Returns:
+            bool: True if the file was copied.
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+
+        return cls._copy_in_kernel(
+            lambda offset: os.copy_file_range(
+                source.fileno(), output.fileno(), size - offset
+            ),
+            output,
+            size,
+        )
+
+    @classmethod
+    def _sendfile(cls, source, output, size: int) -> bool:
+        """Copy the file within the kernel with `os.sendfile`.
+
+        Args:
+            source: The source file, open for reading.
+            output: The output file, open for writing.
+            size (int): The number of bytes to copy.
+
+        Returns:
+            bool: True if the file was copied.
+        """
+        if not hasattr(os, "sendfile"):
+            return False
+
+        return cls._copy_in_kernel(
+            lambda offset: os.sendfile(
+                output.fileno(), source.fileno(), offset, size - offset
+            ),
+            output,
+            size,
+        )
+
+    @classmethod
+    def _copy_in_kernel(cls, copy_chunk, output, size: int) -> bool:
+        """Copy a file in chunks with a kernel copy call.
+
+        Args:
+            copy_chunk (Callable[[int], int]): Copies the bytes from the
+                given offset onwards, returning the number copied.
+            output: The output file, open for writing.
+            size (int): The number of bytes to copy.
+
+        Returns:
+            bool: True if every byte was copied, False if the call is
+                not supported for these files.
+        """
+        offset = 0
+
+        try:
+            while offset < size:
+                copied = copy_chunk(offset)
+                if copied == 0:
+                    break
+
+                offset += copied
+        except OSError:
+            if offset == 0:
+                return False
+
+            raise
+
+        if offset != size:
+            output.seek(0)
+            output.truncate()
+
+            return False
+
+        return True
@@ -1,7 +1,116 @@
-"""A mixin class for loading and saving JSON documents."""
+"""A mixin class for loading and saving JSON documents.
 
+This module contains the JsonMixin and ValidationCache classes.  Each
+class's schema is built once, and files that have already validated
+against it are not validated again until they change.
+
+Documents are parsed with ``orjson`` when it is installed, and with the
+standard library's ``json`` otherwise.
+"""
+
+import hashlib
 import json
+import os
+import threading
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from octo_slample.directory_walker import DEFAULT_MAX_WORKERS, DirectoryIndex
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+HASH_ALGORITHM = "blake2b"
+
+
+class ValidationCache:
+    """A record of the JSON files that have validated against a schema.
+
+    Files are keyed by class and resolved path, and recorded with their
+    size, modification time and content hash.  A file is only trusted
+    if all three still match.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of validated files.
+
+        Returns:
+            int: The number of validated files.
+        """
+        return len(self._entries)
+
+    @classmethod
+    def fingerprint(cls, stat: os.stat_result, contents: bytes) -> tuple:
+        """Fingerprint a file's contents.
+
+        Args:
+            stat (os.stat_result): The file's status.
+            contents (bytes): The file's contents.
+
+        Returns:
+            tuple: The file's size, modification time and content hash.
+        """
+        return (
+            stat.st_size,
+            stat.st_mtime_ns,
+            hashlib.new(HASH_ALGORITHM, contents).hexdigest(),
+        )
+
+    def is_valid(self, cls: type, path: str | Path, fingerprint: tuple) -> bool:
+        """Whether a file has validated against a class's schema.
+
+        Args:
+            cls (type): The class the file was loaded as.
+            path (str|Path): The path to the file.
+            fingerprint (tuple): The file's current fingerprint.
+
+        Returns:
+            bool: True if the file validated with the same fingerprint.
+        """
+        with self._lock:
+            return self._entries.get(self._key(cls, path)) == fingerprint
+
+    def add(self, cls: type, path: str | Path, fingerprint: tuple) -> None:
+        """Record that a file has validated against a class's schema.
+
+        Args:
+            cls (type): The class the file was loaded as.
+            path (str|Path): The path to the file.
+            fingerprint (tuple): The file's fingerprint when it validated.
+        """
+        with self._lock:
+            self._entries[self._key(cls, path)] = fingerprint
+
+    def clear(self) -> None:
+        """Forget every validated file."""
+        with self._lock:
+            self._entries.clear()
+
+    @classmethod
+    def _key(cls, schema_class: type, path: str | Path) -> tuple:
+        """Get the key of a file.
+
+        Args:
+            schema_class (type): The class the file was loaded as.
+            path (str|Path): The path to the file.
+
+        Returns:
+            tuple: The class and the file's resolved path.
+        """
+        return (schema_class, str(Path(path).resolve()))
+
+
+VALIDATION_CACHE = ValidationCache()
 
 
 class JsonMixin(metaclass=ABCMeta):
@@ -10,9 +119,15 @@ class JsonMixin(metaclass=ABCMeta):
     This class provides methods for loading and saving JSON documents.
 
     This class is also an abstract base class. Subclasses must implement
-    the schema and _load methods.
+    the schema and _load methods.  Documents are validated against the
+    schema before they are passed to `_load`.  Instances loaded from a
+    file know the path they were loaded from, in `file_path`, so `_load`
+    can resolve paths in the document against it.
     """
 
+    _compiled_schemas = {}
+    file_path = None
+
     @abstractmethod
     def schema(self) -> dict:
         """Return the JSON schema for this class.
@@ -36,29 +151,163 @@ class JsonMixin(metaclass=ABCMeta):
     def from_file(cls, file_path: str):
         """Create a new instance from a JSON file.
 
+        Files that have validated before, and have not changed since,
+        are not validated again.
+
         Args:
             filename (str): The path to the JSON file.
 
         Returns:
             A new instance.
         """
-        with open(file_path, "r") as f:
-            json_dict = json.load(f)
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            contents = f.read()
+
+        json_dict = json_loads(contents)
+        fingerprint = ValidationCache.fingerprint(stat, contents)
+        trusted = VALIDATION_CACHE.is_valid(cls, file_path, fingerprint)
+
+        instance = cls.from_json(json_dict, validate=not trusted, file_path=file_path)
+
+        if not trusted:
+            VALIDATION_CACHE.add(cls, file_path, fingerprint)
+
+        return instance
+
+    @classmethod
+    def from_files(
+        cls,
+        file_paths: list[str | Path],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list:
+        """Create new instances from many JSON files at once.
+
+        Files are read, parsed and validated in a pool of threads.  A
+        file that cannot be loaded does not stop the others from being
+        loaded.
+
+        Args:
+            file_paths (list[str|Path]): The paths to the JSON files.
+            max_workers (int, optional): The maximum number of files
+                loaded at once. Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list: A list, in the order of `file_paths`, of either a new
+                instance or the exception that stopped the file from
+                being loaded.
+        """
+        assert (
+            isinstance(max_workers, int) and max_workers > 0
+        ), f"max_workers must be a positive integer, but got {max_workers}"
+
+        file_paths = list(file_paths)
+
+        if len(file_paths) <= 1:
+            return list(map(cls._from_file_isolated, file_paths))
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(file_paths))
+        ) as executor:
+            return list(executor.map(cls._from_file_isolated, file_paths))
+
+    @classmethod
+    def load_tree(
+        cls,
+        root: str | Path,
+        suffix: str = ".json",
+        max_depth: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict:
+        """Create new instances from every JSON file in a tree.
+
+        Args:
+            root (str|Path): The root of the tree.
+            suffix (str, optional): The suffix of the files to load.
+                Defaults to ``".json"``.
+            max_depth (int, optional): The depth of the deepest
+                directories to search, where the root is at depth 0.
+                Defaults to ``None``, which searches the whole tree.
+            max_workers (int, optional): The maximum number of
+                directories listed, and files loaded, at once. Defaults
+                to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            dict: The new instance, or the exception that stopped the
+                file from being loaded, keyed by file path in sorted
+                order.
+        """
+        index = DirectoryIndex.build(root, max_depth, max_workers)
+        file_paths = sorted(
+            file
+            for scan in index.values()
+            for file in scan.files
+            if file.suffix == suffix
+        )
+
+        return dict(zip(file_paths, cls.from_files(file_paths, max_workers)))
 
-        return cls.from_json(json_dict)
+    @classmethod
+    def _from_file_isolated(cls, file_path: str | Path):
+        """Create a new instance, returning any error rather than raising it.
+
+        Args:
+            file_path (str|Path): The path to the JSON file.
+
+        Returns:
+            A new instance, or the exception raised while loading it.
+        """
+        try:
+            return cls.from_file(file_path)
+        except Exception as e:
+            return e
 
     @classmethod
-    def from_json(cls, json_dict: dict):
+    def compiled_schema(cls):
+        """Get the schema for this class, building it once.
+
+        Returns:
+            The schema.
+        """
+        schema = cls._compiled_schemas.get(cls)
+
+        if schema is None:
+            schema = cls._compiled_schemas.setdefault(cls, cls.schema())
+
+        return schema
+
+    @classmethod
+    def from_json(
+        cls,
+        json_dict: dict,
+        validate: bool = True,
+        file_path: str | Path | None = None,
+    ):
         """Create a new instance from a JSON dictonary.
 
+        If the JSON document does not match the schema, a `SchemaError`
+        is raised.
+
         Args:
             json_dict (dict): The JSON document containing the
                 instance configuration.
+            validate (bool, optional): Whether to validate the document.
+                Only documents that are known to be valid should skip
+                validation. Defaults to ``True``.
+            file_path (str|Path, optional): The path the document was
+                read from. Defaults to ``None``.
 
         Returns:
             A new class instance.
+
+        Raises:
+            SchemaError: If the JSON document does not match the schema.
         """
+        if validate:
+            cls.compiled_schema().validate(json_dict)
+
         instance = cls()
+        instance.file_path = Path(file_path) if file_path is not None else None
 
         instance._load(json_dict)
 
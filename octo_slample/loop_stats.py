@@ -0,0 +1,146 @@
+"""Timing statistics for loop playback.
+
+This module contains the LatencyHistogram and LoopStats classes.  Times
+are counted into a fixed set of logarithmic buckets, so recording a
+time is cheap and a loop can run for hours in constant memory.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+
+from octo_slample.constants import NANOSECONDS_PER_SECOND
+
+NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+# bucket edges run from 1 microsecond to 10 seconds, 20 buckets per decade
+HISTOGRAM_MIN_NS = 1_000
+HISTOGRAM_DECADES = 7
+HISTOGRAM_BUCKETS_PER_DECADE = 20
+
+
+class LatencyHistogram:
+    """A fixed-size histogram of times, in nanoseconds.
+
+    Percentiles are reported as the upper edge of the bucket they fall
+    in, so they are accurate to within a bucket, about 12%.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._edges = [
+            round(HISTOGRAM_MIN_NS * 10 ** (bucket / HISTOGRAM_BUCKETS_PER_DECADE))
+            for bucket in range(0, HISTOGRAM_DECADES * HISTOGRAM_BUCKETS_PER_DECADE + 1)
+        ]
+        self._counts = [0] * (len(self._edges) + 1)
+        self._count = 0
+        self._max = 0
+
+    def __len__(self) -> int:
+        """Return the number of recorded times.
+
+        Returns:
+            int: The number of recorded times.
+        """
+        return self._count
+
+    @property
+    def max(self) -> int:
+        """Get the longest recorded time.
+
+        Returns:
+            int: The longest time, in nanoseconds.
+        """
+        return self._max
+
+    def record(self, time_ns: int) -> None:
+        """Record a time.
+
+        Negative times are recorded as 0.
+
+        Args:
+            time_ns (int): The time, in nanoseconds.
+        """
+        time_ns = max(time_ns, 0)
+
+        self._counts[bisect_right(self._edges, time_ns)] += 1
+        self._count += 1
+        self._max = max(self._max, time_ns)
+
+    def percentile(self, percent: float) -> int:
+        """Get a percentile of the recorded times.
+
+        Args:
+            percent (float): The percentile. 0-100.
+
+        Returns:
+            int: The time, in nanoseconds, or 0 if nothing was recorded.
+        """
+        assert 0 <= percent <= 100, f"percent must be 0-100, but got {percent}"
+
+        if self._count == 0:
+            return 0
+
+        rank = max(1, -(-self._count * percent // 100))
+        for bucket, total in enumerate(accumulate(self._counts)):
+            if total >= rank:
+                break
+
+        if bucket >= len(self._edges):
+            return self._max
+
+        return min(self._edges[bucket], self._max)
+
+    def reset(self) -> None:
+        """Remove every recorded time."""
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._max = 0
+
+    def summary(self) -> str:
+        """Summarize the recorded times.
+
+        Returns:
+            str: The count, p50, p99 and maximum, in milliseconds.
+        """
+        return (
+            f"n={self._count}"
+            + f" p50={self.percentile(50) / NANOSECONDS_PER_MILLISECOND:.3f} ms"
+            + f" p99={self.percentile(99) / NANOSECONDS_PER_MILLISECOND:.3f} ms"
+            + f" max={self._max / NANOSECONDS_PER_MILLISECOND:.3f} ms"
+        )
+
+
+class LoopStats:
+    """Timing statistics for a playing loop.
+
+    ``lateness`` records how late each step fired, and ``dispatch``
+    records how long each step took to dispatch.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.lateness = LatencyHistogram()
+        self.dispatch = LatencyHistogram()
+
+    @classmethod
+    def frames_to_ns(cls, frames: int, sample_rate: int) -> int:
+        """Convert a number of frames to nanoseconds.
+
+        Args:
+            frames (int): The number of frames.
+            sample_rate (int): The sample rate.
+
+        Returns:
+            int: The duration, in nanoseconds.
+        """
+        return frames * NANOSECONDS_PER_SECOND // sample_rate
+
+    def report(self) -> str:
+        """Report the statistics.
+
+        Returns:
+            str: One line per histogram.
+        """
+        return (
+            f"lateness: {self.lateness.summary()}\n"
+            + f"dispatch: {self.dispatch.summary()}"
+        )
@@ -65,22 +65,14 @@ class JsonPattern(JsonMixin, TextPattern):
     def _load(self, json_pattern: dict):
         """Load the pattern from a JSON file.
 
-        Validates the JSON pattern against the schema defined by
-        `JsonPattern.schema()`, then returns a Pattern instance.
-
-        If the json document does not match the schema, a `SchemaError` is raised.
+        The JSON pattern has already been validated against the schema
+        defined by `JsonPattern.schema()`.
 
         If the pattern has a header, it is removed.
 
         Args:
             json_pattern (dict): The JSON pattern.
-
-        Raises:
-            SchemaError: If the JSON pattern does not match the schema.
         """
-        # validate JSON pattern
-        self.schema().validate(json_pattern)
-
         # remove header row
         if (
             "name" in json_pattern["pattern"][0]
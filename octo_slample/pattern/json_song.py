@@ -0,0 +1,91 @@
+"""JSON song class.
+
+This class is used to load a song, and its patterns, from a JSON file.
+"""
+
+from pathlib import Path
+
+from schema import And, Optional, Schema
+
+from octo_slample.json import JsonMixin
+from octo_slample.pattern.json_pattern import JsonPattern
+from octo_slample.pattern.song import Song, SongSection
+
+
+class JsonSong(JsonMixin, Song):
+    """Read songs from JSON files.
+
+    Each section refers to a JSON pattern file.  Relative pattern paths
+    are resolved against the directory of the song file.  Pattern files
+    are loaded concurrently, and a pattern used by several sections is
+    loaded once.
+    """
+
+    @classmethod
+    def schema(self):
+        """Get the schema for the JSON song.
+
+        The JSON schema has the following format:
+
+        .. code-block:: json
+
+            {
+                "name": "song name",
+                "description": "song description",
+                "sections": [
+                    { "pattern": "patterns/intro.pattern.json", "repeat": 4 },
+                    { "pattern": "patterns/verse.pattern.json", "repeat": 8 },
+                    { "pattern": "patterns/intro.pattern.json" },
+                ]
+            }
+
+        ``repeat`` is optional, and defaults to 1.  Relative ``pattern``
+        paths are relative to the song file.
+
+        Returns:
+            The schema.
+        """
+        return Schema(
+            {
+                "name": And(str, len),
+                Optional("description"): str,
+                "sections": And(
+                    [
+                        {
+                            "pattern": And(str, len),
+                            Optional("repeat"): And(int, lambda n: n > 0),
+                        }
+                    ],
+                    len,
+                ),
+            }
+        )
+
+    def _load(self, json_song: dict):
+        """Load the song from a JSON file.
+
+        The JSON song has already been validated against the schema
+        defined by `JsonSong.schema()`.
+
+        Args:
+            json_song (dict): The JSON song.
+
+        Raises:
+            SchemaError: If a pattern file is not valid.
+            FileNotFoundError: If a pattern file does not exist.
+        """
+        directory = self.file_path.parent if self.file_path is not None else Path()
+        paths = [directory / section["pattern"] for section in json_song["sections"]]
+        unique_paths = list(dict.fromkeys(paths))
+        patterns = dict(zip(unique_paths, JsonPattern.from_files(unique_paths)))
+
+        for pattern in patterns.values():
+            if isinstance(pattern, Exception):
+                raise pattern
+
+        self.sections = [
+            SongSection(patterns[path], section.get("repeat", 1))
+            for path, section in zip(paths, json_song["sections"])
+        ]
+        self.name = json_song["name"]
+        self.description = json_song.get("description", None)
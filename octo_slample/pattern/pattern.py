@@ -1,11 +1,99 @@
 """Pattern module.
 
-This module contains the Pattern class.
+This module contains the Pattern and ChannelSteps classes.  Steps are
+stored in a ``(channels, steps)`` NumPy bool array, so patterns with
+thousands of steps stay small and can be queried a whole channel or
+step at a time.
 """
 
 from collections.abc import Sequence
 
-from octo_slample.constants import DEFAULT_CHANNEL_COUNT, DEFAULT_STEP_COUNT
+import numpy as np
+
+from octo_slample.constants import (
+    DEFAULT_CHANNEL_COUNT,
+    DEFAULT_STEP_COUNT,
+    SIXTEENTHS_PER_BAR,
+)
+
+
+class ChannelSteps(Sequence):
+    """A live view of one channel's steps in a pattern.
+
+    The view behaves like a list of bools.  Setting a step sets it in
+    the pattern.
+    """
+
+    __slots__ = ("_steps",)
+
+    def __init__(self, steps: np.ndarray):
+        """Initialize the view.
+
+        Args:
+            steps (np.ndarray): The channel's row of the pattern array.
+        """
+        self._steps = steps
+
+    def __len__(self) -> int:
+        """Get the number of steps.
+
+        Returns:
+            The number of steps.
+        """
+        return len(self._steps)
+
+    def __getitem__(self, step: int | slice) -> bool | list[bool]:
+        """Get a step, or a list of steps.
+
+        Args:
+            step (int|slice): The step or steps.
+
+        Returns:
+            Whether the step is set, or a list of whether each step is set.
+        """
+        if isinstance(step, slice):
+            return self._steps[step].tolist()
+
+        return bool(self._steps[step])
+
+    def __setitem__(self, step: int | slice, value) -> None:
+        """Set a step, or a slice of steps.
+
+        Args:
+            step (int|slice): The step or steps.
+            value: Whether the step or steps are set.
+        """
+        self._steps[step] = value
+
+    def __eq__(self, other) -> bool:
+        """Compare the steps to another sequence of steps.
+
+        Args:
+            other: The other sequence.
+
+        Returns:
+            True if the steps are equal.
+        """
+        if not isinstance(other, (Sequence, np.ndarray)):
+            return NotImplemented
+
+        return self._steps.tolist() == list(other)
+
+    def __repr__(self) -> str:
+        """Get the steps as a list representation.
+
+        Returns:
+            The representation.
+        """
+        return repr(self._steps.tolist())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Get the steps as an array, without copying.
+
+        Returns:
+            np.ndarray: The channel's row of the pattern array.
+        """
+        return np.asarray(self._steps, dtype=dtype)
 
 
 class Pattern:
@@ -47,7 +135,7 @@ class Pattern:
             0 < channel_count
         ), f"Channel must be a positive integer, but got {channel_count}."
 
-        self._pattern = [[False] * step_count for _ in range(0, channel_count)]
+        self._steps = np.zeros((channel_count, step_count), dtype=bool)
         self._channel_volumes = [0] * channel_count
 
     def __len__(self) -> int:
@@ -56,7 +144,7 @@ class Pattern:
         Returns:
             The number of steps in the pattern.
         """
-        return len(self._pattern[0])
+        return self._steps.shape[1]
 
     def channel_count(self) -> int:
         """Get the number of channels.
@@ -64,9 +152,9 @@ class Pattern:
         Returns:
             The number of channels.
         """
-        return len(self._pattern)
+        return self._steps.shape[0]
 
-    def __getitem__(self, channel: int) -> list:
+    def __getitem__(self, channel: int) -> ChannelSteps:
         """Get the pattern for the given channel.
 
         Channels are 0-indexed.
@@ -75,24 +163,70 @@ class Pattern:
             channel: The channel. 0-7.
 
         Returns:
-            The pattern for the given channel.
+            A live view of the pattern for the given channel.
         """
         self.__validate_channel_number(channel)
 
-        return self._pattern[channel]
+        return ChannelSteps(self._steps[channel])
 
     @property
-    def pattern(self) -> list[list[bool]]:
+    def pattern(self) -> list[ChannelSteps]:
         """Get the pattern.
 
-        The pattern is stored in a list of lists. The outer list is the 8
-        channels. The inner list is the 16 beats. Each beat is a boolean
-        indicating whether or not the channel should be played on that beat.
+        The pattern is a list of the 8 channels. Each channel is a live,
+        list-like view of its 16 beats. Each beat is a boolean indicating
+        whether or not the channel should be played on that beat.
 
         Returns:
             The pattern.
         """
-        return self._pattern
+        return [ChannelSteps(steps) for steps in self._steps]
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Get the pattern as an array.
+
+        Returns:
+            np.ndarray: A read-only ``(channels, steps)`` bool view of
+                the pattern.
+        """
+        steps = self._steps.view()
+        steps.flags.writeable = False
+
+        return steps
+
+    def channels_on_step(self, step: int) -> np.ndarray:
+        """Get the channels that are played on a step.
+
+        Args:
+            step: The step. 0-n.
+
+        Returns:
+            np.ndarray: The indices of the channels, in ascending order.
+        """
+        return np.flatnonzero(self._steps[:, step])
+
+    def hit_counts(self) -> np.ndarray:
+        """Get the number of steps set on each channel.
+
+        Returns:
+            np.ndarray: The number of hits, per channel.
+        """
+        return np.count_nonzero(self._steps, axis=1)
+
+    def density_per_bar(self) -> np.ndarray:
+        """Get the fraction of steps set in each bar of each channel.
+
+        A final, partial bar is measured over the steps it has.
+
+        Returns:
+            np.ndarray: The densities, shaped ``(channels, bars)``.
+        """
+        bar_starts = np.arange(0, len(self), SIXTEENTHS_PER_BAR)
+        hits = np.add.reduceat(self._steps, bar_starts, axis=1, dtype=np.int64)
+        bar_lengths = np.diff(np.append(bar_starts, len(self)))
+
+        return hits / bar_lengths
 
     def is_step_set(self, channel: int, step: int) -> bool:
         """Get the step for the given channel.
@@ -117,7 +251,7 @@ class Pattern:
             0 <= step < len(self)
         ), f"Invalid step. Expected 0-{len(self)-1} but got {step}."
 
-        return self._pattern[channel][step]
+        return bool(self._steps[channel, step])
 
     def __validate_channel_number(self, channel: int):
         """Validate the channel number.
@@ -0,0 +1,96 @@
+"""Song class.
+
+This module contains the SongSection and Song classes.  A song is an
+ordered chain of patterns, each repeated a number of times.
+"""
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from octo_slample.pattern.pattern import Pattern
+
+
+class SongSection(NamedTuple):
+    """A pattern, and the number of times it is played in a row."""
+
+    pattern: Pattern
+    repeats: int = 1
+
+
+class Song:
+    """An ordered chain of patterns.
+
+    Sections are played in order, each pattern repeated `repeats` times
+    at its own channel volumes, and the song starts again from its first
+    section when it ends.
+    """
+
+    def __init__(
+        self,
+        sections: Sequence[SongSection] = (),
+        name: str | None = None,
+        description: str | None = None,
+    ):
+        """Initialize the song.
+
+        Args:
+            sections (Sequence[SongSection], optional): The song's
+                sections, in order. Defaults to no sections.
+            name (str, optional): The name of the song. Defaults to
+                ``None``.
+            description (str, optional): The description of the song.
+                Defaults to ``None``.
+        """
+        self._sections = ()
+        if sections:
+            self.sections = sections
+        self.name = name
+        self.description = description
+
+    @property
+    def sections(self) -> tuple[SongSection, ...]:
+        """Get the song's sections.
+
+        Returns:
+            tuple[SongSection, ...]: The sections, in order.
+        """
+        return self._sections
+
+    @sections.setter
+    def sections(self, sections: Sequence[SongSection]) -> None:
+        """Set the song's sections.
+
+        Args:
+            sections (Sequence[SongSection]): The sections, in order.
+                There must be at least one.
+        """
+        sections = tuple(SongSection(*section) for section in sections)
+
+        assert len(sections) > 0, "a song must have at least one section"
+        for section in sections:
+            assert isinstance(
+                section.pattern, Pattern
+            ), f"pattern must be a Pattern, but got {section.pattern}"
+            assert (
+                isinstance(section.repeats, int) and section.repeats > 0
+            ), f"repeats must be a positive integer, but got {section.repeats}"
+
+        self._sections = sections
+
+    def __len__(self) -> int:
+        """Return the number of steps in the song.
+
+        Returns:
+            int: The number of steps in one pass of the song.
+        """
+        return sum(len(section.pattern) * section.repeats for section in self._sections)
+
+    def __str__(self) -> str:
+        """Return a string representation of the song.
+
+        Returns:
+            str: Each section's repeat count, followed by its pattern.
+        """
+        return "\n".join(
+            f"Section {number} (x{section.repeats}):\n{section.pattern}"
+            for number, section in enumerate(self._sections, start=1)
+        )
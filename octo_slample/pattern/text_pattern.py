@@ -2,13 +2,15 @@
 
 This class is used to create a pattern from a list of text strings.
 """
+import numpy as np
+
 from octo_slample.constants import (
     BEATS_PER_BAR,
     DEFAULT_CHANNEL_COUNT,
     DEFAULT_STEP_COUNT,
     SIXTEENTHS_PER_BAR,
 )
-from octo_slample.pattern.pattern import Pattern
+from octo_slample.pattern.pattern import ChannelSteps, Pattern
 
 VALID_PATTERN_CHARS = [" ", "x", "X", "."]
 
@@ -66,11 +68,11 @@ class TextPattern(Pattern):
                 )
 
     @property
-    def pattern(self) -> list[list[bool]]:
+    def pattern(self) -> list[ChannelSteps]:
         """Get the pattern.
 
         Returns:
-            list[list[bool]]: The pattern.
+            list[ChannelSteps]: The pattern.
         """
         return super().pattern
 
@@ -100,9 +102,10 @@ class TextPattern(Pattern):
         """
         self._validate_pattern_lines(lines)
 
-        for idx_i, line in enumerate(lines):
-            for idx_j, char in enumerate(line.ljust(len(self), ".")):
-                self._pattern[idx_i][idx_j] = char.lower() == "x"
+        for idx, line in enumerate(lines):
+            self._steps[idx] = [
+                char.lower() == "x" for char in line.ljust(len(self), ".")
+            ]
 
     def __str__(self) -> str:
         """Get the pattern as a string.
@@ -111,10 +114,10 @@ class TextPattern(Pattern):
             The pattern as a string.
         """
         pattern_string = f"  {self._build_pattern_header()}\n"
-        for idx, channel in enumerate(self._pattern):
+        for idx, channel in enumerate(self._steps):
             pattern_string += (
                 f"{idx} "
-                + "".join(["x" if step else "." for step in channel])
+                + "".join(np.where(channel, "x", "."))
                 + f" ({str(self.channel_volumes[idx]).rjust(5)} dB)"
                 + "\n"
             )
@@ -132,7 +135,7 @@ class TextPattern(Pattern):
             The pattern header.
         """
         pattern_header = ""
-        pattern_length = len(self.pattern[0])
+        pattern_length = len(self)
 
         for bar in range(0, pattern_length // SIXTEENTHS_PER_BAR):
             for step in range(0, BEATS_PER_BAR):
@@ -0,0 +1,374 @@
+"""Stream audio files into 16-bit WAV files, block by block.
+
+This module contains the LowPassFilter, LinearResampler and
+SampleConverter classes.  Audio is read from the source file in
+fixed-size blocks, so converting a sample needs a few blocks of memory
+however long the sample is.
+"""
+import math
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# bumped whenever a change to the converter changes its output, so
+# exported samples are converted again
+CONVERTER_VERSION = 1
+DEFAULT_BLOCK_FRAMES = 65536
+MAX_OUTPUT_CHANNELS = 2
+OUTPUT_FORMAT = "WAV"
+OUTPUT_SUBTYPE = "PCM_16"
+
+# subtypes that can be copied to 16-bit PCM without requantizing
+LOSSLESS_SUBTYPES = ("PCM_S8", "PCM_U8", "PCM_16")
+
+INT16_SCALE = 32768
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+# the anti-alias filter passes frequencies up to this fraction of the
+# target Nyquist frequency, and spans this many sinc zero crossings on
+# each side of its centre
+FILTER_ROLLOFF = 0.9
+FILTER_ZERO_CROSSINGS = 16
+FILTER_KAISER_BETA = 8.6
+
+
+class LowPassFilter:
+    """Low-pass filter a stream of audio blocks.
+
+    The filter is a linear-phase, Kaiser-windowed sinc FIR.  Its delay is
+    compensated, so output frame ``n`` lines up with input frame ``n``,
+    and the stream is treated as silent before its first frame and after
+    its last.  The last frames of each block are carried over to the
+    next, so the output is the same however the source is split into
+    blocks.
+    """
+
+    def __init__(self, cutoff: float):
+        """Initialize the filter.
+
+        Args:
+            cutoff (float): The cutoff frequency, in cycles per frame.
+                Must be between 0 and 0.5.
+        """
+        assert 0 < cutoff < 0.5, f"cutoff must be between 0 and 0.5, but got {cutoff}"
+
+        self._delay = math.ceil(FILTER_ZERO_CROSSINGS / (2 * cutoff))
+        n = np.arange(-self._delay, self._delay + 1)
+        taps = np.sinc(2 * cutoff * n) * np.kaiser(len(n), FILTER_KAISER_BETA)
+        self._taps = (taps / taps.sum()).astype(np.float32)
+        self._history = None
+
+    @property
+    def taps(self) -> np.ndarray:
+        """Get the filter's coefficients.
+
+        Returns:
+            np.ndarray: The float32 coefficients, which sum to 1.
+        """
+        return self._taps
+
+    def process(self, block: np.ndarray, last: bool = False) -> np.ndarray:
+        """Filter the next block of the stream.
+
+        Args:
+            block (np.ndarray): The next block, shaped
+                ``(frames, channels)``.
+            last (bool, optional): Whether this is the final block.
+                Defaults to ``False``.
+
+        Returns:
+            np.ndarray: The float32 filtered audio that can be computed
+                so far, shaped ``(frames, channels)``.
+        """
+        channels = block.shape[1]
+        if self._history is None:
+            self._history = np.zeros((self._delay, channels), dtype=np.float32)
+
+        buffer = [self._history, block.astype(np.float32, copy=False)]
+        if last:
+            buffer.append(np.zeros((self._delay, channels), dtype=np.float32))
+        buffer = np.concatenate(buffer)
+
+        count = len(buffer) - len(self._taps) + 1
+        if count <= 0:
+            self._history = buffer
+            return np.empty((0, channels), dtype=np.float32)
+
+        filtered = np.empty((count, channels), dtype=np.float32)
+        for channel in range(0, channels):
+            filtered[:, channel] = np.convolve(
+                buffer[:, channel], self._taps, mode="valid"
+            )
+
+        self._history = buffer[count:]
+
+        return filtered
+
+
+class LinearResampler:
+    """Resample a stream of audio blocks by linear interpolation.
+
+    When downsampling, the stream is first passed through a
+    :class:`LowPassFilter` that removes frequencies above the target
+    Nyquist frequency, so they are not folded back into the audible
+    band.
+
+    The last frame of each block is carried over to the next, so the
+    output is the same however the source is split into blocks.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, source_frames: int):
+        """Initialize the resampler.
+
+        Args:
+            source_rate (int): The sample rate of the source.
+            target_rate (int): The sample rate to resample to.
+            source_frames (int): The number of frames in the source.
+        """
+        assert source_rate > 0, "source_rate must be positive"
+        assert target_rate > 0, "target_rate must be positive"
+
+        self._step = source_rate / target_rate
+        self._filter = (
+            LowPassFilter(FILTER_ROLLOFF * target_rate / (2 * source_rate))
+            if target_rate < source_rate
+            else None
+        )
+        self._output_frames = round(source_frames * target_rate / source_rate)
+        self._position = 0
+        self._base = 0
+        self._carry = None
+
+    @classmethod
+    def resample(
+        cls, audio: np.ndarray, source_rate: int, target_rate: int
+    ) -> np.ndarray:
+        """Resample audio that is already in memory, in one block.
+
+        Args:
+            audio (np.ndarray): The audio, shaped ``(frames, channels)``.
+            source_rate (int): The sample rate of the audio.
+            target_rate (int): The sample rate to resample to.
+
+        Returns:
+            np.ndarray: The float32 resampled audio, shaped
+                ``(frames, channels)``.
+        """
+        return cls(source_rate, target_rate, len(audio)).process(audio, last=True)
+
+    @property
+    def output_frames(self) -> int:
+        """Get the number of frames the resampled stream will contain.
+
+        Returns:
+            int: The number of output frames.
+        """
+        return self._output_frames
+
+    def process(self, block: np.ndarray, last: bool = False) -> np.ndarray:
+        """Resample the next block of the stream.
+
+        Blocks of any dtype are interpolated in float32, so integer
+        samples do not wrap around between frames.
+
+        Args:
+            block (np.ndarray): The next source block, shaped
+                ``(frames, channels)``.
+            last (bool, optional): Whether this is the final block.
+                Defaults to ``False``.
+
+        Returns:
+            np.ndarray: The float32 resampled audio that can be computed
+                so far, shaped ``(frames, channels)``.
+        """
+        block = block.astype(np.float32, copy=False)
+
+        if self._filter is not None:
+            block = self._filter.process(block, last)
+
+        buffer = block if self._carry is None else np.concatenate((self._carry, block))
+        if len(buffer) == 0:
+            return np.empty((0, block.shape[1]), dtype=np.float32)
+
+        end = self._base + len(buffer) - 1
+        stop = (
+            self._output_frames
+            if last
+            else min(self._output_frames, math.ceil(end / self._step))
+        )
+
+        positions = np.arange(self._position, stop) * self._step - self._base
+        left = np.minimum(positions.astype(np.int64), len(buffer) - 1)
+        right = np.minimum(left + 1, len(buffer) - 1)
+        fraction = (positions - left).astype(np.float32)[:, np.newaxis]
+
+        resampled = buffer[left] + (buffer[right] - buffer[left]) * fraction
+
+        self._position = max(self._position, stop)
+        self._base = end
+        self._carry = buffer[-1:]
+
+        return resampled.astype(np.float32, copy=False)
+
+    def flush(self, channels: int) -> np.ndarray:
+        """Resample the frames left at the end of the stream.
+
+        Args:
+            channels (int): The number of channels in the stream.
+
+        Returns:
+            np.ndarray: The float32 remaining audio, shaped
+                ``(frames, channels)``.
+        """
+        return self.process(np.empty((0, channels), dtype=np.float32), last=True)
+
+
+class SampleConverter:
+    """Convert audio files to 16-bit WAV files without decoding them whole.
+
+    This class contains class methods that stream a source file through
+    resampling, channel layout conversion, gain and dithered bit-depth
+    reduction, one block at a time.
+    """
+
+    @classmethod
+    def convert(
+        cls,
+        source_path: str | Path,
+        output_path: str | Path,
+        sample_rate: int,
+        block_frames: int = DEFAULT_BLOCK_FRAMES,
+        rng: np.random.Generator | None = None,
+        gain: float = 1.0,
+    ) -> str:
+        """Convert an audio file to a 16-bit WAV file.
+
+        Files that are already 16-bit or less at the output sample rate
+        are copied block by block, sample for sample, unless a gain is
+        applied.  Otherwise, each block is resampled, scaled by the gain
+        and dithered.  Channels beyond the first two are dropped.
+
+        Args:
+            source_path (str|Path): The path to the source audio file.
+            output_path (str|Path): The path of the WAV file to write.
+            sample_rate (int): The sample rate of the WAV file.
+            block_frames (int, optional): The number of frames read at a
+                time. Defaults to `DEFAULT_BLOCK_FRAMES`.
+            rng (np.random.Generator, optional): The dither noise
+                generator. Defaults to a new, randomly seeded generator.
+            gain (float, optional): The linear gain to apply. Defaults
+                to ``1.0``.
+
+        Returns:
+            str: The path to the written file.
+        """
+        with sf.SoundFile(str(source_path)) as source:
+            channels = min(source.channels, MAX_OUTPUT_CHANNELS)
+
+            with sf.SoundFile(
+                str(output_path),
+                "w",
+                samplerate=sample_rate,
+                channels=channels,
+                subtype=OUTPUT_SUBTYPE,
+                format=OUTPUT_FORMAT,
+            ) as output:
+                if (
+                    source.samplerate == sample_rate
+                    and source.subtype in LOSSLESS_SUBTYPES
+                    and gain == 1.0
+                ):
+                    for block in source.blocks(
+                        block_frames, dtype="int16", always_2d=True
+                    ):
+                        output.write(block[:, :channels])
+                else:
+                    cls._convert_blocks(
+                        source, output, channels, block_frames, rng, gain
+                    )
+
+        return str(output_path)
+
+    @classmethod
+    def dither(cls, block: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Reduce float audio to int16 with TPDF dither.
+
+        Triangular noise of one least significant bit is added before
+        rounding, so quantization error becomes benign noise rather than
+        distortion.
+
+        Args:
+            block (np.ndarray): The float audio, in the range -1 to 1.
+            rng (np.random.Generator): The noise generator.
+
+        Returns:
+            np.ndarray: The int16 audio.
+        """
+        noise = rng.random(block.shape, dtype=np.float32)
+        noise -= rng.random(block.shape, dtype=np.float32)
+
+        scaled = block * np.float32(INT16_SCALE)
+        scaled += noise
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, INT16_MIN, INT16_MAX, out=scaled)
+
+        return scaled.astype(np.int16)
+
+    @classmethod
+    def _convert_blocks(
+        cls,
+        source: sf.SoundFile,
+        output: sf.SoundFile,
+        channels: int,
+        block_frames: int,
+        rng: np.random.Generator | None,
+        gain: float = 1.0,
+    ) -> None:
+        """Resample, scale, dither and write every block of the source.
+
+        Args:
+            source (sf.SoundFile): The open source file.
+            output (sf.SoundFile): The open output file.
+            channels (int): The number of output channels.
+            block_frames (int): The number of frames read at a time.
+            rng (np.random.Generator|None): The dither noise generator.
+            gain (float, optional): The linear gain to apply. Defaults
+                to ``1.0``.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        resampler = (
+            LinearResampler(source.samplerate, output.samplerate, source.frames)
+            if source.samplerate != output.samplerate
+            else None
+        )
+
+        for block in source.blocks(block_frames, dtype="float32", always_2d=True):
+            block = block[:, :channels]
+            if resampler is not None:
+                block = resampler.process(block)
+
+            output.write(cls.dither(cls._apply_gain(block, gain), rng))
+
+        if resampler is not None:
+            output.write(
+                cls.dither(cls._apply_gain(resampler.flush(channels), gain), rng)
+            )
+
+    @classmethod
+    def _apply_gain(cls, block: np.ndarray, gain: float) -> np.ndarray:
+        """Scale a block of float audio.
+
+        Args:
+            block (np.ndarray): The float audio.
+            gain (float): The linear gain.
+
+        Returns:
+            np.ndarray: The scaled audio, or `block` itself if the gain
+                is ``1.0``.
+        """
+        if gain == 1.0:
+            return block
+
+        return block * np.float32(gain)
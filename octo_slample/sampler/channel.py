@@ -6,11 +6,8 @@ channel on the OctoSlample.
 from pathlib import Path
 
 import numpy as np
-import simpleaudio as sa
-import soundfile as sf
 
-LEFT_RIGHT_CHANNEL_COUNT = 2
-SAMPLE_WIDTH = 2
+from octo_slample.sampler.sample_store import SAMPLE_STORE
 
 
 class Channel:
@@ -22,6 +19,7 @@ class Channel:
         name: str | None = None,
         sample_path: str | None = None,
         volume: float = 0,
+        choke_group: int | None = None,
     ):
         """Initialize the channel.
 
@@ -35,28 +33,26 @@ class Channel:
                 :class:`~octo_slample.sampler.sample_bank.SampleBank`
                 and :class:`~octo_slample.pattern.Pattern` objects.
             sample_path (str): Path to the channel's sample. Optional.
-                If provided, the sample will be loaded and the
-                :class:`~octo_slample.sampler.channel.Channel` will be
-                ready to play.
+                If provided, the sample will be loaded when it is first
+                played or exported.
             volume (float): The channel's volume in decibels. Optional.
                 Defaults to 0.
+            choke_group (int): The channel's choke group. Optional.
+                Channels in the same choke group stop each other when
+                played, e.g. a closed hi-hat cutting an open hi-hat.
         """
+        self._sample_path = None
+        self._sample = None
+        self._sample_rate = None
+        self._info = None
+
         self.number = channel_number
         self.name = name
         self.volume = volume
+        self.choke_group = choke_group
 
         if sample_path is not None:
             self.sample = sample_path
-        else:
-            self._sample = None
-            self._sample_path = None
-
-    def play(self) -> None:
-        """Play the channel's sound."""
-        if self._sample is not None:
-            sa.play_buffer(
-                self._sample, LEFT_RIGHT_CHANNEL_COUNT, SAMPLE_WIDTH, self._sample_rate
-            )
 
     @property
     def name(self) -> str | None:
@@ -103,6 +99,60 @@ class Channel:
 
         self._number = number
 
+    @property
+    def choke_group(self) -> int | None:
+        """Return the channel's choke group.
+
+        Returns:
+            int: The channel's choke group, or ``None``.
+        """
+        return self._choke_group
+
+    @choke_group.setter
+    def choke_group(self, choke_group: int | None) -> None:
+        """Set the channel's choke group.
+
+        Args:
+            choke_group (int): The channel's choke group.
+                May be ``None``.
+
+        Returns:
+            None
+        """
+        assert choke_group is None or isinstance(
+            choke_group, int
+        ), "choke_group must be an int or None"
+
+        self._choke_group = choke_group
+
+    @property
+    def info(self) -> dict | None:
+        """Return the audio format of the channel's sample.
+
+        This is the format probed from the sample's header by
+        ``init``, so reading it does not touch the sample file.
+
+        Returns:
+            dict: The sample's ``frames``, ``sample_rate``,
+                ``channels``, ``subtype``, ``size`` and ``mtime_ns``, or
+                ``None`` if the format is not known.
+        """
+        return self._info
+
+    @info.setter
+    def info(self, info: dict | None) -> None:
+        """Set the audio format of the channel's sample.
+
+        Args:
+            info (dict): The sample's audio format. May be ``None``.
+
+        Returns:
+            None
+        """
+        assert info is None or isinstance(info, dict), "info must be a dict or None"
+
+        self._info = info
+
     @property
     def volume(self) -> float:
         """Return the channel's volume in decibels.
@@ -126,9 +176,17 @@ class Channel:
 
         self._volume = float(volume)
 
-        if hasattr(self, "_original_sample"):
-            # apply the new volume
-            self._sample = self.apply_audio_volume(self._original_sample, volume)
+    @property
+    def gain(self) -> float:
+        """Return the channel's volume as a linear gain.
+
+        The gain is applied by the mixer and renderer as samples are
+        summed, so changing the volume never rescales the sample.
+
+        Returns:
+            float: The gain to multiply the channel's sample by.
+        """
+        return self.db_to_percent(self._volume)
 
     def __str__(self) -> str:
         """Return the channel's number.
@@ -144,20 +202,26 @@ class Channel:
             return f"{self.number + 1}: {self.sample_path}"
 
     @property
-    def sample(self) -> np.ndarray:
+    def sample(self) -> np.ndarray | None:
         """Return the channel's sample.
 
+        The sample is loaded on first access.  The channel's volume is
+        not applied; see `gain`.
+
         Returns:
-            str: The channel's sample.
+            np.ndarray: The channel's sample, or ``None`` if the channel
+                has no sample.
         """
-        return self._sample
+        if self._sample is None and self._sample_path is None:
+            return None
+
+        return self._load_sample()
 
     @sample.setter
     def sample(self, sample_path: str | None) -> None:
         """Set the channel's sample.
 
-        This method will load the sample from the provided path and
-        apply the channel's volume to the sample.
+        The sample is not read until it is first played or exported.
 
         Args:
             sample_path (str|None): The path to the sample.
@@ -167,21 +231,71 @@ class Channel:
             None
         """
         self._sample_path = sample_path
+        self._sample = None
+        self._sample_rate = None
+        self._info = None
 
         if sample_path is None:
-            self._sample = None
             return
 
         assert Path(sample_path).exists(), f"'{sample_path}' does not exist"
 
-        # read the sample
-        (audio, sample_rate) = sf.read(sample_path, dtype="int16")
+    @property
+    def sample_rate(self) -> int | None:
+        """Return the sample rate of the channel's sample.
+
+        Returns:
+            int: The sample rate, or ``None`` if the channel has no
+                sample.
+        """
+        if self._sample is None and self._sample_path is None:
+            return None
+
+        self._load_sample()
+
+        return self._sample_rate
 
-        self._original_sample = audio
+    def set_sample_data(
+        self, sample: np.ndarray, sample_rate: int, sample_path: str | None = None
+    ) -> None:
+        """Set the channel's sample from audio that is already loaded.
+
+        Unlike setting `sample`, the sample file is not required to
+        exist, since it is never read.
+
+        Args:
+            sample (np.ndarray): The int16 sample.
+            sample_rate (int): The sample's sample rate.
+            sample_path (str|None, optional): The path the sample was
+                loaded from. Defaults to ``None``.
+
+        Returns:
+            None
+        """
+        assert isinstance(sample, np.ndarray), "sample must be a numpy array"
+        assert (
+            isinstance(sample_rate, int) and sample_rate > 0
+        ), f"sample_rate must be a positive integer, but got {sample_rate}"
+
+        self._sample_path = sample_path
+        self._sample = sample
         self._sample_rate = sample_rate
+        self._info = None
+
+    def _load_sample(self) -> np.ndarray:
+        """Load the channel's sample, if it is not already loaded.
 
-        # apply the new volume
-        self._sample = self.apply_audio_volume(self._original_sample, self._volume)
+        The sample is fetched from the process-wide
+        :class:`~octo_slample.sampler.sample_store.SampleStore`, so
+        channels whose samples have identical contents share one array.
+
+        Returns:
+            np.ndarray: The sample.
+        """
+        if self._sample is None:
+            self._sample, self._sample_rate = SAMPLE_STORE.load(self._sample_path)
+
+        return self._sample
 
     @classmethod
     def db_to_percent(self, db) -> float:
@@ -0,0 +1,169 @@
+"""Compiled bank class.
+
+This module contains the CompiledSampleBank class, which writes a bank
+and its decoded samples to a single ``.octobank`` file, and opens that
+file again by memory-mapping it, so no JSON is validated and no audio
+is decoded at startup.
+
+An ``.octobank`` file is laid out as:
+
+* a preamble: the magic bytes, the format version and the size of the
+  header
+* a UTF-8 JSON header with the bank's name and description, and each
+  channel's name, volume, choke group, sample path, sample rate, shape
+  and offset
+* little-endian int16 PCM for every channel, starting on a page
+  boundary, with each channel aligned to `CHANNEL_ALIGNMENT` bytes
+"""
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from octo_slample.sampler.sample_bank import SampleBank
+
+MAGIC = b"OCTOBANK"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<8sII")
+DATA_ALIGNMENT = 4096
+CHANNEL_ALIGNMENT = 64
+PCM_DTYPE = np.dtype("<i2")
+
+
+class CompiledSampleBank(SampleBank):
+    """Read/write a compiled :class:`~octo_slample.sampler.sample_bank.SampleBank`.
+
+    Channels of an opened bank are zero-copy views of one read-only
+    memory map of the file.
+    """
+
+    @classmethod
+    def compile(cls, bank: SampleBank, output_path: str | Path) -> Path:
+        """Compile a bank to an ``.octobank`` file.
+
+        Every channel's sample is loaded and written as int16 PCM.
+
+        Args:
+            bank (SampleBank): The bank to compile.
+            output_path (str|Path): The path to write the file to.
+
+        Returns:
+            Path: The path to the compiled bank.
+        """
+        channels = []
+        samples = []
+        offset = 0
+
+        for channel in bank._channels:
+            entry = {
+                "name": channel.name,
+                "volume": channel.volume,
+                "choke": channel.choke_group,
+                "path": channel.sample_path,
+            }
+
+            if channel.sample is not None:
+                sample = np.ascontiguousarray(channel.sample, dtype=PCM_DTYPE)
+                offset = cls._align(offset, CHANNEL_ALIGNMENT)
+                entry.update(
+                    sample_rate=channel.sample_rate,
+                    shape=list(sample.shape),
+                    offset=offset,
+                )
+                samples.append((offset, sample))
+                offset += sample.nbytes
+
+            channels.append(entry)
+
+        header = json.dumps(
+            {
+                "name": bank.name,
+                "description": bank.description,
+                "channels": channels,
+            }
+        ).encode("utf-8")
+        data_offset = cls._align(PREAMBLE.size + len(header), DATA_ALIGNMENT)
+
+        with open(output_path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            f.write(header)
+
+            for sample_offset, sample in samples:
+                f.seek(data_offset + sample_offset)
+                f.write(sample.tobytes())
+
+            f.truncate(data_offset + offset if samples else f.tell())
+
+        return Path(output_path)
+
+    @classmethod
+    def from_file(cls, file_path: str | Path) -> "CompiledSampleBank":
+        """Open a compiled bank.
+
+        Args:
+            file_path (str|Path): The path to the ``.octobank`` file.
+
+        Returns:
+            CompiledSampleBank: The bank, with every channel's sample
+                loaded.
+
+        Raises:
+            ValueError: If the file is not a compiled bank, or was
+                compiled by an unsupported version.
+        """
+        with open(file_path, "rb") as f:
+            preamble = f.read(PREAMBLE.size)
+            if len(preamble) < PREAMBLE.size:
+                raise ValueError(f"'{file_path}' is not a compiled bank")
+
+            magic, version, header_size = PREAMBLE.unpack(preamble)
+            if magic != MAGIC:
+                raise ValueError(f"'{file_path}' is not a compiled bank")
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"'{file_path}' is compiled bank version {version}, "
+                    + f"but only version {FORMAT_VERSION} is supported"
+                )
+
+            header = json.loads(f.read(header_size))
+            file_size = os.fstat(f.fileno()).st_size
+
+        # the whole data section is mapped once, and channels are sliced
+        # from it; an empty file cannot be mapped
+        data_offset = cls._align(PREAMBLE.size + header_size, DATA_ALIGNMENT)
+        data = np.empty(0, dtype=PCM_DTYPE)
+        if file_size > data_offset:
+            data = np.memmap(file_path, dtype=PCM_DTYPE, mode="r", offset=data_offset)
+
+        bank = cls(len(header["channels"]), header["name"], header["description"])
+
+        for channel, entry in zip(bank._channels, header["channels"]):
+            channel.name = entry["name"]
+            channel.volume = entry["volume"]
+            channel.choke_group = entry["choke"]
+
+            if "offset" in entry:
+                start = entry["offset"] // PCM_DTYPE.itemsize
+                shape = tuple(entry["shape"])
+                channel.set_sample_data(
+                    data[start : start + int(np.prod(shape))].reshape(shape),
+                    entry["sample_rate"],
+                    entry["path"],
+                )
+
+        return bank
+
+    @classmethod
+    def _align(cls, offset: int, alignment: int) -> int:
+        """Round an offset up to a multiple of an alignment.
+
+        Args:
+            offset (int): The offset, in bytes.
+            alignment (int): The alignment, in bytes.
+
+        Returns:
+            int: The aligned offset.
+        """
+        return -(-offset // alignment) * alignment
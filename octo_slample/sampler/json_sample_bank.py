@@ -29,14 +29,26 @@ class JsonSampleBank(JsonMixin, SampleBank):
                 "name": "pattern name",
                 "description": "pattern description",
                 "samples": [
+                    { "name": "kick", "path": "path/to/kick.wav" },
+                    { "name": "closed hat", "path": "path/to/ch.wav", "choke": 1 },
+                    { "name": "open hat", "path": "path/to/oh.wav", "choke": 1 },
                     {
-                        "sample": "path/to/sample1.wav",
-                        "sample": "path/to/sample2.wav",
+                        "name": "clap",
+                        "path": "path/to/clap.wav",
+                        "info": {
+                            "frames": 22050,
+                            "sample_rate": 44100,
+                            "channels": 1,
+                            "subtype": "PCM_16",
+                            "size": 44144,
+                            "mtime_ns": 1677151095000000000
+                        }
                     },
                 ]
             }
 
-        Note that the header row, ``"1234123412341234"``, is optional.
+        Samples that share a ``choke`` group stop each other when played.
+        A sample's ``info`` records its audio format, as probed by ``init``.
 
         See Also:
             https://github.com/keleshev/schema
@@ -53,6 +65,15 @@ class JsonSampleBank(JsonMixin, SampleBank):
                         {
                             Optional("name"): And(str, len),
                             Optional("path"): Or(None, And(str, len)),
+                            Optional("choke"): int,
+                            Optional("info"): {
+                                "frames": int,
+                                "sample_rate": int,
+                                "channels": int,
+                                "subtype": str,
+                                "size": int,
+                                "mtime_ns": int,
+                            },
                         }
                     ],
                 ),
@@ -62,20 +83,12 @@ class JsonSampleBank(JsonMixin, SampleBank):
     def _load(self, json_bank: dict):
         """Load a banks from a JSON file.
 
-        Validates the JSON bank against the schema defined by
-        `JsonSampleBank.schema()).
-
-        If the json document does not match the schema, a `SchemaError` is raised.
+        The JSON bank has already been validated against the schema
+        defined by `JsonSampleBank.schema()`.
 
         Args:
             json_bank (dict): The JSON pattern.
-
-        Raises:
-            SchemaError: If the JSON pattern does not match the schema.
         """
-        # validate JSON pattern
-        self.schema().validate(json_bank)
-
         # load samples into channels and set the name
         self.samples = json_bank["samples"]
         self.name = json_bank["name"]
@@ -1,22 +1,64 @@
-"""LoopingSampler class."""
+"""LoopingSampler class.
+
+This module contains the Timeline and LoopingSampler classes.
+"""
 
 from __future__ import annotations
 
-from octo_slample.clock import Clock
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from operator import itemgetter
+from typing import NamedTuple
+
+import numpy as np
+
+from octo_slample.clock import SCHEDULE_DEADLINE, Clock
 from octo_slample.constants import (
     DEFAULT_BPM,
     DEFAULT_CHANNEL_COUNT,
-    DEFAULT_STEP_COUNT,
+    SECONDS_PER_MINUTE,
+    SIXTEENTHS_PER_BEAT,
 )
+from octo_slample.loop_stats import LoopStats
 from octo_slample.pattern.pattern import Pattern
+from octo_slample.pattern.song import Song
+from octo_slample.sampler.channel import Channel
+from octo_slample.sampler.mixer import Mixer
 from octo_slample.sampler.sample_bank import SampleBank
 from octo_slample.sampler.sampler import Sampler
+from octo_slample.sampler.voice_pool import DEFAULT_MAX_POLYPHONY
+
+# one beat of sixteenths is scheduled ahead of the mixer
+DEFAULT_LOOKAHEAD_STEPS = SIXTEENTHS_PER_BEAT
+
+
+class Timeline(NamedTuple):
+    """A pattern or song compiled into the channels to play on each step.
+
+    ``events`` holds a ``(step, channel, gain)`` triple for every channel
+    played, sorted by step, where ``gain`` is the linear gain of the
+    channel's volume in the event's pattern, or ``None`` to play the
+    channel at its current gain.  ``step_count`` is the length of one
+    pass.
+    """
+
+    events: tuple[tuple[int, int, float | None], ...]
+    step_count: int
 
 
 class LoopingSampler(Sampler):
-    """A sampler that plays a pattern in a loop.
+    """A sampler that plays a pattern or song in a loop.
 
-    This implementation supports patterns and looping playback.
+    This implementation supports patterns, songs and looping playback.
+    Either is compiled ahead of time into a flat timeline of events, so
+    switching between a song's patterns costs nothing while playing.
+
+    By default, steps are scheduled on the mixer a lookahead window ahead
+    of playback, at frame positions computed from the BPM and sample
+    rate, and the mixer starts each sample at its exact frame.  With a
+    lookahead of 0, steps are instead played as the clock beats.
     """
 
     def __init__(
@@ -25,6 +67,11 @@ class LoopingSampler(Sampler):
         bpm: int = DEFAULT_BPM,
         pattern: Pattern | None = None,
         bank: SampleBank | None = None,
+        max_polyphony: int = DEFAULT_MAX_POLYPHONY,
+        lookahead_steps: int = DEFAULT_LOOKAHEAD_STEPS,
+        mixer: Mixer | None = None,
+        stats: LoopStats | None = None,
+        song: Song | None = None,
     ):
         """Initialize the sampler.
 
@@ -34,11 +81,38 @@ class LoopingSampler(Sampler):
             pattern (Pattern): The pattern to play.  Defaults to None.
             bank (SampleBank): (Optional) The sample bank.  Defaults to None.
                 If not provided, a new empty bank will be created.
+            max_polyphony (int): The maximum number of voices that can play
+                at once. Defaults to `DEFAULT_MAX_POLYPHONY`.
+            lookahead_steps (int): The number of steps scheduled ahead of
+                playback, or 0 to play steps as the clock beats.
+                Defaults to `DEFAULT_LOOKAHEAD_STEPS`.
+            mixer (Mixer): (Optional) The mixer to play channels through.
+                Defaults to a new mixer.
+            stats (LoopStats): (Optional) If given, the lateness and
+                dispatch time of each step is recorded into it.
+            song (Song): (Optional) The song to play, instead of a
+                pattern. Defaults to None.
         """
-        super().__init__(channel_count)
+        assert (
+            isinstance(lookahead_steps, int) and lookahead_steps >= 0
+        ), f"lookahead_steps must not be negative, but got {lookahead_steps}"
 
-        self._clock = Clock(bpm=bpm)
-        self._pattern = pattern
+        super().__init__(channel_count, mixer=mixer, max_polyphony=max_polyphony)
+
+        self._lookahead_steps = lookahead_steps
+        self._stats = stats
+        self._clock = Clock(
+            bpm=bpm,
+            schedule=SCHEDULE_DEADLINE,
+            lateness=stats.lateness if stats is not None else None,
+        )
+        self._pattern = None
+        self._song = None
+        self._timeline = Timeline((), 0)
+        if pattern is not None:
+            self.pattern = pattern
+        if song is not None:
+            self.song = song
         if bank is not None:
             self.bank = bank
 
@@ -55,6 +129,10 @@ class LoopingSampler(Sampler):
     def pattern(self, pattern: Pattern) -> None:
         """Set the pattern to play.
 
+        The pattern is compiled into a timeline, and replaces any song.
+        Changes made to the pattern after it is set take effect once it
+        is set again.
+
         Args:
             pattern (Pattern): The pattern to play.
 
@@ -63,41 +141,353 @@ class LoopingSampler(Sampler):
         """
         assert isinstance(pattern, Pattern), "pattern must be a Pattern"
         self._pattern = pattern
+        self._song = None
+        self._compile()
+
+    @property
+    def song(self) -> Song | None:
+        """Get the song.
+
+        Returns:
+            Song: The song, or ``None`` if a pattern is played instead.
+        """
+        return self._song
+
+    @song.setter
+    def song(self, song: Song) -> None:
+        """Set the song to play.
+
+        The song is compiled into a timeline, and replaces any pattern.
+        Changes made to the song after it is set take effect once it is
+        set again.
+
+        Args:
+            song (Song): The song to play.
+
+        Returns:
+            None
+        """
+        assert isinstance(song, Song), "song must be a Song"
+        assert song.sections, "song must have at least one section"
+        self._song = song
+        self._pattern = None
+        self._compile()
+
+    @Sampler.bank.setter
+    def bank(self, bank: SampleBank) -> None:
+        """Set the sample bank.
+
+        The pattern or song is compiled again, for the bank's channels.
+
+        Args:
+            bank (SampleBank): The sample bank.
+        """
+        Sampler.bank.fset(self, bank)
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile the pattern or song for the sampler's channels.
+
+        Returns:
+            None
+        """
+        if self._pattern is not None:
+            self._timeline = self.compile_timeline(
+                [(self._pattern, 1)], len(self), pattern_volumes=False
+            )
+        elif self._song is not None:
+            self._timeline = self.compile_timeline(self._song.sections, len(self))
+
+    @property
+    def stats(self) -> LoopStats | None:
+        """Get the timing statistics.
+
+        Returns:
+            LoopStats: The statistics, or ``None`` if they are not recorded.
+        """
+        return self._stats
+
+    @property
+    def timeline(self) -> Timeline:
+        """Get the compiled pattern or song.
+
+        Returns:
+            Timeline: The channels to play on each step.
+        """
+        return self._timeline
+
+    @classmethod
+    def compile_trigger_table(
+        cls, pattern: Pattern, channel_count: int
+    ) -> tuple[tuple[int, ...], ...]:
+        """Compile a pattern into the channels to play on each step.
+
+        Channels beyond `channel_count` are dropped, so every channel in
+        the table can be played without being checked.
+
+        Args:
+            pattern (Pattern): The pattern.
+            channel_count (int): The number of channels in the sampler.
+
+        Returns:
+            tuple[tuple[int, ...], ...]: The channels to play on each
+                step, in ascending order.
+        """
+        steps = pattern.steps[:channel_count]
+
+        return tuple(tuple(np.flatnonzero(step).tolist()) for step in steps.T)
+
+    @classmethod
+    def compile_timeline(
+        cls,
+        sections: Iterable[tuple[Pattern, int]],
+        channel_count: int,
+        pattern_volumes: bool = True,
+    ) -> Timeline:
+        """Compile a chain of patterns into a timeline.
+
+        Each pattern is compiled once, however many sections use it, and
+        its events are repeated at the step each repetition starts at.
+        By default, every event carries the gain of its channel's volume
+        in its own pattern, so each section plays at its pattern's
+        volumes.
+
+        Args:
+            sections (Iterable[tuple[Pattern, int]]): The patterns, in
+                order, and the number of times each is repeated.
+            channel_count (int): The number of channels in the sampler.
+            pattern_volumes (bool): Whether events carry their pattern's
+                volumes.  If ``False``, their gain is ``None``, and each
+                channel is played at its gain when it is played.
+                Defaults to ``True``.
+
+        Returns:
+            Timeline: The channels to play on each step of the chain.
+        """
+        events = []
+        step_count = 0
+        compiled = {}
+
+        for pattern, repeats in sections:
+            if id(pattern) not in compiled:
+                table = cls.compile_trigger_table(pattern, channel_count)
+                gains = (
+                    [Channel.db_to_percent(v) for v in pattern.channel_volumes]
+                    if pattern_volumes
+                    else [None] * channel_count
+                )
+                compiled[id(pattern)] = (
+                    [
+                        (step, channel, gains[channel])
+                        for step, channels in enumerate(table)
+                        for channel in channels
+                    ],
+                    len(table),
+                )
+
+            pattern_events, pattern_steps = compiled[id(pattern)]
+
+            for _ in range(0, repeats):
+                events.extend(
+                    (step_count + step, channel, gain)
+                    for step, channel, gain in pattern_events
+                )
+                step_count += pattern_steps
+
+        return Timeline(tuple(events), step_count)
 
     def loop(self) -> None:
-        """Play the pattern in a loop.
+        """Play the pattern or song in a loop.
 
-        Prior to playing, the channel volumes are set to the pattern's
-        channel volumes.
+        When playing a pattern, the bank's channel volumes are set to the
+        pattern's channel volumes, and channels are played at the bank's
+        volumes, so volume changes take effect while the loop plays.
+        When playing a song, channels are played at the volumes of the
+        pattern they are played by.
 
         Returns:
             None
         """
-        assert self._pattern, "pattern must be set before playing"
+        assert self._timeline.step_count, "pattern or song must be set before playing"
         assert self._bank, "bank must be set before playing"
 
-        self.bank.channel_volumes = self.pattern.channel_volumes
+        if self._pattern is not None:
+            self.bank.channel_volumes = self._pattern.channel_volumes
+
+        if self._lookahead_steps > 0:
+            self._loop_scheduled()
+            return
 
         while self.clock.is_running:
             self._play_pattern()
 
+    @property
+    def frames_per_step(self) -> float:
+        """Get the length of a step at the mixer's sample rate.
+
+        Returns:
+            float: The number of frames per sixteenth-note step.
+        """
+        return (
+            self._mixer.sample_rate
+            * SECONDS_PER_MINUTE
+            / (self.clock.bpm * SIXTEENTHS_PER_BEAT)
+        )
+
+    def schedule_steps(self, anchor_frame: int, step: int, until_frame: int) -> int:
+        """Schedule steps on the mixer, up to a frame.
+
+        Step ``n`` starts at ``anchor_frame + round(n * frames_per_step)``,
+        so step positions do not accumulate rounding errors.  Steps wrap
+        around the timeline.  Only steps with events are visited.  A step
+        scheduled after its frame has been mixed starts late, and its
+        lateness is recorded in the stats.
+
+        Args:
+            anchor_frame (int): The mixer frame that step 0 starts at.
+            step (int): The first step to schedule.
+            until_frame (int): The frame to schedule steps before.
+
+        Returns:
+            int: The first step that was not scheduled.
+        """
+        frames_per_step = self.frames_per_step
+        end_step = self._first_step_at(anchor_frame, step, until_frame)
+        events, step_count = self._timeline
+
+        if not events or end_step == step:
+            return end_step
+
+        schedule = self._mixer.schedule
+        lateness = self._stats.lateness if self._stats is not None else None
+        mixed_frames = self._mixer.frame_position
+
+        lap, offset = divmod(step, step_count)
+        lap_start = lap * step_count
+        index = bisect_left(events, offset, key=itemgetter(0))
+        late_step = None
+
+        while True:
+            if index == len(events):
+                lap_start += step_count
+                index = 0
+
+            event_step, channel, gain = events[index]
+            event_step += lap_start
+            if event_step >= end_step:
+                return end_step
+
+            frame = anchor_frame + round(event_step * frames_per_step)
+
+            if lateness is not None and event_step != late_step:
+                late_step = event_step
+                lateness.record(
+                    LoopStats.frames_to_ns(
+                        mixed_frames - frame, self._mixer.sample_rate
+                    )
+                )
+
+            bank_channel = self.bank[channel]
+            schedule(
+                frame,
+                channel,
+                bank_channel.sample,
+                bank_channel.choke_group,
+                bank_channel.gain if gain is None else gain,
+                bank_channel.sample_rate,
+            )
+            index += 1
+
+    def _first_step_at(self, anchor_frame: int, step: int, frame: int) -> int:
+        """Find the first step, from `step`, that starts at or after a frame.
+
+        Args:
+            anchor_frame (int): The mixer frame that step 0 starts at.
+            step (int): The earliest step to return.
+            frame (int): The frame.
+
+        Returns:
+            int: The step.
+        """
+        frames_per_step = self.frames_per_step
+        first = max(step, math.ceil((frame - anchor_frame) / frames_per_step) - 1)
+
+        # step starts are rounded, so the estimate is off by at most one
+        while anchor_frame + round(first * frames_per_step) < frame:
+            first += 1
+        while (
+            first > step
+            and anchor_frame + round((first - 1) * frames_per_step) >= frame
+        ):
+            first -= 1
+
+        return first
+
+    def _loop_scheduled(self) -> None:
+        """Play the pattern by scheduling it on the mixer ahead of time.
+
+        The mixer is kept `lookahead_steps` ahead of playback, and topped
+        up twice per lookahead window, so this thread's wake-up times do
+        not affect when samples start.  Steps still scheduled when the
+        clock stops are cancelled.
+
+        Returns:
+            None
+        """
+        mixer = self._mixer
+        if not mixer.is_running:
+            mixer.start()
+
+        lookahead_frames = self._lookahead_steps * self.frames_per_step
+        wait = lookahead_frames / mixer.sample_rate / 2
+
+        # step 0 starts one block out, so it is not late for the next callback
+        anchor_frame = mixer.frame_position + mixer.block_size
+        step = 0
+
+        try:
+            while self.clock.is_running:
+                started = time.perf_counter_ns()
+                until_frame = mixer.frame_position + mixer.block_size + lookahead_frames
+                step = self.schedule_steps(anchor_frame, step, until_frame)
+
+                if self._stats is not None:
+                    self._stats.dispatch.record(time.perf_counter_ns() - started)
+
+                time.sleep(wait)
+        finally:
+            mixer.cancel_scheduled()
+
     def _play_pattern(self) -> None:
-        """Plays the entire pattern, one step at a time.
+        """Plays the entire pattern or song, one step at a time.
 
-        Upon playing each channel, the clock beat is advanced.
+        The channels to play on each step are read from the compiled
+        timeline.  Upon playing each step, the clock beat is advanced.
 
         Returns:
             None
         """
-        assert self._pattern, "pattern must be set before playing"
+        assert self._timeline.step_count, "pattern or song must be set before playing"
         assert self._bank, "bank must be set before playing"
 
-        for step in range(0, DEFAULT_STEP_COUNT):
-            for channel in range(0, len(self)):
-                if self.pattern and self.pattern.is_step_set(channel, step):
-                    self.play_channel(channel)
+        trigger = self._trigger_channel
+        beat = self.clock.beat
+        dispatch = self._stats.dispatch if self._stats is not None else None
+        events, step_count = self._timeline
+        event_count = len(events)
+        index = 0
+
+        for step in range(0, step_count):
+            started = time.perf_counter_ns() if dispatch is not None else 0
+
+            while index < event_count and events[index][0] == step:
+                trigger(events[index][1], events[index][2])
+                index += 1
+
+            if dispatch is not None:
+                dispatch.record(time.perf_counter_ns() - started)
 
-            self.clock.beat()
+            beat()
 
     @property
     def clock(self) -> Clock:
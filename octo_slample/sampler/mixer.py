@@ -0,0 +1,416 @@
+"""Single-stream software mixer.
+
+This module contains the Mixer class. The mixer keeps one output stream
+open for the lifetime of the sampler and sums every active voice into
+that stream, one block at a time.  Samples can be triggered at once, or
+scheduled to start at an exact frame of the stream.
+"""
+import heapq
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+from octo_slample.constants import DEFAULT_SAMPLE_RATE
+from octo_slample.sample_converter import LinearResampler
+from octo_slample.sampler.voice_pool import DEFAULT_MAX_POLYPHONY, VoicePool
+
+DEFAULT_BLOCK_SIZE = 512
+# the number of resampled samples a mixer keeps, most recently used first
+RESAMPLED_BUFFER_COUNT = 64
+OUTPUT_CHANNEL_COUNT = 2
+OUTPUT_DTYPE = "int16"
+
+INT16_MIN = np.iinfo(np.int16).min
+INT16_MAX = np.iinfo(np.int16).max
+
+
+def to_output_layout(sample: np.ndarray) -> np.ndarray:
+    """Shape a sample as ``(frames, channels)`` for mixing.
+
+    Mono samples are returned as a single column view, which broadcasts
+    to both outputs.  Samples with more than two channels are truncated
+    to the first two.
+
+    Args:
+        sample (np.ndarray): The sample.
+
+    Returns:
+        np.ndarray: A view of the sample with two dimensions.
+    """
+    if sample.ndim == 1:
+        return sample.reshape(-1, 1)
+
+    return sample[:, :OUTPUT_CHANNEL_COUNT]
+
+
+class ScheduledTrigger(NamedTuple):
+    """A sample scheduled to start at a frame of the output stream."""
+
+    frame: int
+    serial: int
+    channel: int
+    buffer: np.ndarray
+    choke_group: int | None
+    gain: float
+
+
+class Mixer:
+    """Mix triggered samples into a single, persistent output stream.
+
+    Triggering a sample only starts a voice from the mixer's
+    :class:`~octo_slample.sampler.voice_pool.VoicePool`.  The audio
+    callback sums the active voices into one float32 block buffer per
+    callback, applying each voice's gain as it goes, so no threads,
+    output streams or scaled copies of samples are created per trigger.
+
+    Scheduled samples are started by the audio callback at their exact
+    frame, splitting the block around them, so their timing does not
+    depend on when the scheduling thread runs.
+
+    Samples recorded at another sample rate are resampled to the output
+    sample rate once, the first time they are triggered or scheduled,
+    and the resampled buffer is reused after that.  Resampling is never
+    done in the audio callback.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_polyphony: int = DEFAULT_MAX_POLYPHONY,
+    ):
+        """Initialize the mixer.
+
+        Args:
+            sample_rate (int, optional): The output sample rate.
+                Defaults to `DEFAULT_SAMPLE_RATE`.
+            block_size (int, optional): The number of frames mixed per
+                callback. Defaults to `DEFAULT_BLOCK_SIZE`.
+            max_polyphony (int, optional): The maximum number of voices
+                that can play at once. Defaults to `DEFAULT_MAX_POLYPHONY`.
+        """
+        self._sample_rate = sample_rate
+        self._block_size = block_size
+        self._pool = VoicePool(max_polyphony)
+        self._lock = threading.Lock()
+        self._block = np.zeros((block_size, OUTPUT_CHANNEL_COUNT), dtype=np.float32)
+        self._scratch = np.zeros_like(self._block)
+        self._stream = None
+        self._frame_position = 0
+        self._scheduled = []
+        self._schedule_serial = 0
+        self._resampled = OrderedDict()
+        self._resampled_lock = threading.Lock()
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the output sample rate.
+
+        Returns:
+            int: The output sample rate.
+        """
+        return self._sample_rate
+
+    @property
+    def block_size(self) -> int:
+        """Get the number of frames mixed per callback.
+
+        Returns:
+            int: The block size.
+        """
+        return self._block_size
+
+    @property
+    def frame_position(self) -> int:
+        """Get the number of frames mixed since the mixer was created.
+
+        Returns:
+            int: The frame position of the next block.
+        """
+        return self._frame_position
+
+    @property
+    def scheduled_count(self) -> int:
+        """Get the number of scheduled samples not yet started.
+
+        Returns:
+            int: The number of scheduled samples.
+        """
+        return len(self._scheduled)
+
+    @property
+    def max_polyphony(self) -> int:
+        """Get the maximum number of voices that can play at once.
+
+        Returns:
+            int: The size of the voice pool.
+        """
+        return len(self._pool)
+
+    @property
+    def voice_count(self) -> int:
+        """Get the number of active voices.
+
+        Returns:
+            int: The number of active voices.
+        """
+        return self._pool.active_count
+
+    @property
+    def is_running(self) -> bool:
+        """Get whether the output stream is open.
+
+        Returns:
+            bool: True if the output stream is open, False otherwise.
+        """
+        return self._stream is not None
+
+    def start(self) -> None:
+        """Open and start the output stream.
+
+        Calling `start` on a running mixer has no effect.
+
+        Returns:
+            None
+        """
+        if self.is_running:
+            return
+
+        # imported here, as PortAudio is only required for live playback
+        import sounddevice as sd
+
+        self._stream = sd.OutputStream(
+            samplerate=self._sample_rate,
+            blocksize=self._block_size,
+            channels=OUTPUT_CHANNEL_COUNT,
+            dtype=OUTPUT_DTYPE,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def stop(self) -> None:
+        """Stop and close the output stream.
+
+        Calling `stop` on a stopped mixer has no effect.
+
+        Returns:
+            None
+        """
+        if not self.is_running:
+            return
+
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+
+    def trigger(
+        self,
+        channel: int,
+        sample: np.ndarray | None,
+        choke_group: int | None = None,
+        gain: float = 1.0,
+        sample_rate: int | None = None,
+    ) -> None:
+        """Start playing a sample.
+
+        This method is non-blocking.  The sample is played from the next
+        block onwards.  If every voice is busy, the oldest voice is
+        stolen.
+
+        Args:
+            channel (int): The channel that triggered the sample.
+            sample (np.ndarray|None): The int16 audio to play. Mono
+                samples are played on both outputs.  If ``None``,
+                nothing is played.
+            choke_group (int, optional): The channel's choke group.
+                Voices in the same choke group are stopped.
+            gain (float, optional): The linear gain to play the sample
+                at. Defaults to ``1.0``.
+            sample_rate (int, optional): The sample rate of the sample.
+                Defaults to ``None``, the output sample rate.
+
+        Returns:
+            None
+        """
+        if sample is None or len(sample) == 0:
+            return
+
+        buffer = self.prepare(sample, sample_rate)
+
+        with self._lock:
+            self._pool.allocate(channel, buffer, choke_group, gain)
+
+    def schedule(
+        self,
+        frame: int,
+        channel: int,
+        sample: np.ndarray | None,
+        choke_group: int | None = None,
+        gain: float = 1.0,
+        sample_rate: int | None = None,
+    ) -> None:
+        """Start playing a sample at a frame of the output stream.
+
+        This method is non-blocking.  A sample scheduled for a frame that
+        has already been mixed is started at the beginning of the next
+        block.
+
+        Args:
+            frame (int): The frame to start at, in `frame_position` units.
+            channel (int): The channel that triggered the sample.
+            sample (np.ndarray|None): The int16 audio to play. If
+                ``None``, nothing is played.
+            choke_group (int, optional): The channel's choke group.
+                Voices in the same choke group are stopped at `frame`.
+            gain (float, optional): The linear gain to play the sample
+                at. Defaults to ``1.0``.
+            sample_rate (int, optional): The sample rate of the sample.
+                Defaults to ``None``, the output sample rate.
+
+        Returns:
+            None
+        """
+        if sample is None or len(sample) == 0:
+            return
+
+        buffer = self.prepare(sample, sample_rate)
+
+        with self._lock:
+            self._schedule_serial += 1
+            heapq.heappush(
+                self._scheduled,
+                ScheduledTrigger(
+                    frame, self._schedule_serial, channel, buffer, choke_group, gain
+                ),
+            )
+
+    def prepare(self, sample: np.ndarray, sample_rate: int | None = None) -> np.ndarray:
+        """Get the buffer a sample is mixed from.
+
+        The buffer is shaped ``(frames, channels)``.  If the sample is
+        not at the output sample rate, it is resampled, and the
+        resampled buffer is cached for the next time the same sample is
+        played.
+
+        Args:
+            sample (np.ndarray): The int16 audio.
+            sample_rate (int, optional): The sample rate of the sample.
+                Defaults to ``None``, the output sample rate.
+
+        Returns:
+            np.ndarray: The int16 buffer, at the output sample rate.
+        """
+        buffer = to_output_layout(sample)
+        if sample_rate is None or sample_rate == self._sample_rate:
+            return buffer
+
+        key = (id(sample), sample_rate)
+        with self._resampled_lock:
+            entry = self._resampled.get(key)
+            # the sample is kept in the entry, so its id is not reused
+            if entry is not None and entry[0] is sample:
+                self._resampled.move_to_end(key)
+                return entry[1]
+
+        resampled = LinearResampler.resample(buffer, sample_rate, self._sample_rate)
+        np.rint(resampled, out=resampled)
+        np.clip(resampled, INT16_MIN, INT16_MAX, out=resampled)
+        resampled = resampled.astype(np.int16)
+
+        with self._resampled_lock:
+            self._resampled[key] = (sample, resampled)
+            self._resampled.move_to_end(key)
+            while len(self._resampled) > RESAMPLED_BUFFER_COUNT:
+                self._resampled.popitem(last=False)
+
+        return resampled
+
+    def cancel_scheduled(self) -> None:
+        """Drop every scheduled sample that has not yet started.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._scheduled.clear()
+
+    def mix(self, frames: int) -> np.ndarray:
+        """Mix the next block of audio.
+
+        Each active voice is scaled by its gain and summed into the
+        float32 block buffer, which is then clipped to the int16 range.
+        Samples scheduled within the block are started at their frame.
+        Finished voices are released back to the pool.
+
+        Args:
+            frames (int): The number of frames to mix.
+
+        Returns:
+            np.ndarray: The mixed int16 audio, shaped
+                ``(frames, OUTPUT_CHANNEL_COUNT)``.
+        """
+        if len(self._block) != frames:
+            self._block = np.zeros((frames, OUTPUT_CHANNEL_COUNT), dtype=np.float32)
+            self._scratch = np.zeros_like(self._block)
+
+        block = self._block
+        block.fill(0)
+        block_end = self._frame_position + frames
+
+        with self._lock:
+            offset = 0
+            scheduled = self._scheduled
+
+            while scheduled and scheduled[0].frame < block_end:
+                trigger = heapq.heappop(scheduled)
+                start = max(trigger.frame - self._frame_position, offset)
+
+                self._mix_voices(block, offset, start)
+                offset = start
+
+                self._pool.release_finished()
+                self._pool.allocate(
+                    trigger.channel, trigger.buffer, trigger.choke_group, trigger.gain
+                )
+
+            self._mix_voices(block, offset, frames)
+            self._pool.release_finished()
+
+        self._frame_position = block_end
+
+        np.clip(block, INT16_MIN, INT16_MAX, out=block)
+
+        return block.astype(np.int16)
+
+    def _mix_voices(self, block: np.ndarray, start: int, stop: int) -> None:
+        """Sum the active voices into part of the block.
+
+        Must be called with the lock held.
+
+        Args:
+            block (np.ndarray): The float32 block buffer.
+            start (int): The first frame of the block to mix into.
+            stop (int): The frame of the block to stop mixing at.
+        """
+        if start >= stop:
+            return
+
+        for voice in self._pool.active():
+            chunk = voice.buffer[voice.position : voice.position + stop - start]
+            scaled = self._scratch[: len(chunk), : chunk.shape[1]]
+            np.multiply(chunk, np.float32(voice.gain), out=scaled)
+            block[start : start + len(chunk)] += scaled
+            voice.position += len(chunk)
+
+    def _callback(self, outdata: np.ndarray, frames: int, time, status) -> None:
+        """Fill the output stream's buffer.
+
+        Args:
+            outdata (np.ndarray): The buffer to fill.
+            frames (int): The number of frames to fill.
+            time: The stream timing information. Unused.
+            status: The stream status flags. Unused.
+        """
+        outdata[:] = self.mix(frames)
@@ -0,0 +1,176 @@
+"""Offline pattern renderer.
+
+This module contains the PatternRenderer class, which bounces a
+:class:`~octo_slample.pattern.pattern.Pattern` played by a
+:class:`~octo_slample.sampler.sample_bank.SampleBank` to audio, faster
+than real time.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from octo_slample.constants import (
+    DEFAULT_BPM,
+    DEFAULT_SAMPLE_RATE,
+    SECONDS_PER_MINUTE,
+    SIXTEENTHS_PER_BAR,
+    SIXTEENTHS_PER_BEAT,
+)
+from octo_slample.pattern.pattern import Pattern
+from octo_slample.sample_converter import LinearResampler
+from octo_slample.sampler.channel import Channel
+from octo_slample.sampler.mixer import (
+    INT16_MAX,
+    INT16_MIN,
+    OUTPUT_CHANNEL_COUNT,
+    to_output_layout,
+)
+from octo_slample.sampler.sample_bank import SampleBank
+from octo_slample.wav_writer import WavWriter
+
+
+class PatternRenderer:
+    """Render a pattern and sample bank to audio, offline.
+
+    Rather than waiting on a clock, the renderer computes the frame
+    offset of every step up front and adds each triggered sample, scaled
+    by its channel's gain, into a preallocated float32 output buffer.
+    Samples that are not at the output sample rate are resampled once,
+    before any hit is added.
+    """
+
+    def __init__(
+        self,
+        pattern: Pattern,
+        bank: SampleBank,
+        bpm: int = DEFAULT_BPM,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            pattern (Pattern): The pattern to render.
+            bank (SampleBank): The sample bank to render the pattern with.
+            bpm (int, optional): The beats per minute. Defaults to
+                `DEFAULT_BPM`.
+            sample_rate (int, optional): The output sample rate.
+                Defaults to `DEFAULT_SAMPLE_RATE`.
+        """
+        assert isinstance(pattern, Pattern), "pattern must be a Pattern"
+        assert isinstance(bank, SampleBank), "bank must be a SampleBank"
+        assert bpm > 0, f"bpm must be a positive number, but got {bpm}"
+
+        self._pattern = pattern
+        self._bank = bank
+        self._bpm = bpm
+        self._sample_rate = sample_rate
+
+    @property
+    def frames_per_step(self) -> float:
+        """Get the number of frames in one step.
+
+        Each step is a sixteenth note.
+
+        Returns:
+            float: The number of frames per step.
+        """
+        return (
+            self._sample_rate * SECONDS_PER_MINUTE / (self._bpm * SIXTEENTHS_PER_BEAT)
+        )
+
+    def step_offsets(self, step_count: int) -> np.ndarray:
+        """Compute the frame offset of each step.
+
+        Offsets are computed from the step index, rather than accumulated,
+        so rounding errors do not build up over long renders.
+
+        Args:
+            step_count (int): The number of steps.
+
+        Returns:
+            np.ndarray: The frame offset of each step.
+        """
+        return np.round(np.arange(step_count) * self.frames_per_step).astype(np.int64)
+
+    def render(self, bars: int | None = None) -> np.ndarray:
+        """Render the pattern to audio.
+
+        The pattern is repeated until `bars` bars have been rendered.
+        Prior to rendering, the channel volumes are set to the pattern's
+        channel volumes, as they are for loop playback.
+
+        The output is extended past the final step so that samples
+        triggered near the end are not cut off.
+
+        Args:
+            bars (int, optional): The number of bars to render. Defaults
+                to a single pass of the pattern.
+
+        Returns:
+            np.ndarray: The int16 audio, shaped
+                ``(frames, OUTPUT_CHANNEL_COUNT)``.
+        """
+        step_count = len(self._pattern) if bars is None else bars * SIXTEENTHS_PER_BAR
+        assert step_count > 0, "at least one step must be rendered"
+
+        self._bank.channel_volumes = self._pattern.channel_volumes
+
+        offsets = self.step_offsets(step_count)
+        steps = self._pattern.steps[:, np.arange(step_count) % len(self._pattern)]
+        channels = range(0, min(len(self._bank), self._pattern.channel_count()))
+        hits = [
+            (offsets[steps[channel]], self.prepare_sample(self._bank[channel]))
+            for channel in channels
+            if self._bank[channel].sample is not None and steps[channel].any()
+        ]
+
+        frame_count = round(step_count * self.frames_per_step)
+        for channel_offsets, sample in hits:
+            frame_count = max(frame_count, int(channel_offsets[-1]) + len(sample))
+
+        output = np.zeros((frame_count, OUTPUT_CHANNEL_COUNT), dtype=np.float32)
+
+        for channel_offsets, sample in hits:
+            for offset in channel_offsets:
+                output[offset : offset + len(sample)] += sample
+
+        np.clip(output, INT16_MIN, INT16_MAX, out=output)
+
+        return output.astype(np.int16)
+
+    def prepare_sample(self, channel: Channel) -> np.ndarray:
+        """Get a channel's sample as it is added to the output.
+
+        Args:
+            channel (Channel): The channel, which must have a sample.
+
+        Returns:
+            np.ndarray: The float32 sample, shaped ``(frames, channels)``,
+                at the output sample rate and scaled by the channel's
+                gain.
+        """
+        sample = to_output_layout(channel.sample)
+
+        if channel.sample_rate != self._sample_rate:
+            sample = LinearResampler.resample(
+                sample, channel.sample_rate, self._sample_rate
+            )
+
+        return sample * np.float32(channel.gain)
+
+    def write(self, output_path: str | Path, bars: int | None = None) -> str:
+        """Render the pattern and write it to a WAV file.
+
+        The file is written at the renderer's sample rate.
+
+        Args:
+            output_path (str|Path): The path of the WAV file.
+            bars (int, optional): The number of bars to render. Defaults
+                to a single pass of the pattern.
+
+        Returns:
+            str: The path to the written file.
+        """
+        WavWriter.create_directory(Path(output_path).parent)
+
+        return WavWriter.write_audio(self.render(bars), output_path, self._sample_rate)
@@ -121,6 +121,8 @@ class SampleBank:
             with the following keys:
                 * ``path``: The path to the sample file. Required, may be ``None``.
                 * ``name``: The name of the sample. Optional.
+                * ``choke``: The choke group of the channel. Optional.
+                * ``info``: The sample's audio format. Optional.
 
         Returns:
             list: A list of samples.
@@ -146,6 +148,8 @@ class SampleBank:
             self[channel].sample = new_sample["path"]
             if "name" in new_sample:
                 self[channel].name = new_sample["name"]
+            self[channel].choke_group = new_sample.get("choke", None)
+            self[channel].info = new_sample.get("info", None)
 
     def _validate_channel(self, channel: int):
         """Validate a channel number.
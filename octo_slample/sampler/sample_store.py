@@ -0,0 +1,164 @@
+"""Process-wide, content-addressed store of decoded samples.
+
+This module contains the SampleStore class and the process-wide
+``SAMPLE_STORE`` instance.  Samples are keyed by a hash of the file's
+contents, so a sample used by many banks, or copied to many paths, is
+decoded and held in memory once.
+"""
+import hashlib
+import threading
+import weakref
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from octo_slample.wav_reader import WavReader
+
+HASH_ALGORITHM = "blake2b"
+
+
+class SampleStore:
+    """A content-addressed store of decoded samples.
+
+    A file's resolved path, modification time and size are checked
+    first, so a file that has already been seen is not hashed again.
+    Otherwise, the file's contents are hashed and any sample already
+    decoded from identical contents is shared.
+
+    Samples are held weakly: a sample stays in the store for as long as
+    a channel refers to it, and the paths and sample rate recorded for
+    it are dropped with it.
+
+    ``bytes_saved`` counts the bytes of decoded samples that were shared
+    instead of being decoded again.  Memory-mapped samples are backed by
+    the file, so sharing them saves no allocation and is not counted.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._digests = {}
+        self._samples = weakref.WeakValueDictionary()
+        self._sample_rates = {}
+        # finalizers may run on any thread, including one holding the lock
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples.
+
+        Returns:
+            int: The number of stored samples.
+        """
+        return len(self._samples)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the number of bytes held by stored samples.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return sum(sample.nbytes for sample in self._samples.values())
+
+    def load(self, path: str | Path) -> tuple[np.ndarray, int]:
+        """Load a sample, sharing it with every other user of its contents.
+
+        16-bit PCM WAV files are memory-mapped read-only.  All other
+        files are decoded to int16 with soundfile.
+
+        Args:
+            path (str|Path): The path to the sample.
+
+        Returns:
+            tuple[np.ndarray, int]: The sample and its sample rate.
+        """
+        stat = Path(path).stat()
+        path_key = (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            digest = self._digests.get(path_key)
+
+        if digest is None:
+            digest = self.hash_file(path)
+
+        with self._lock:
+            self._digests[path_key] = digest
+            sample = self._samples.get(digest)
+
+            if sample is not None:
+                self.hits += 1
+                if not isinstance(sample, np.memmap):
+                    self.bytes_saved += sample.nbytes
+                return sample, self._sample_rates[digest]
+
+            self.misses += 1
+
+        decoded, sample_rate = self._decode(path)
+
+        with self._lock:
+            # another thread may have decoded the same contents meanwhile
+            sample = self._samples.setdefault(digest, decoded)
+            self._sample_rates[digest] = sample_rate
+
+            if sample is decoded:
+                weakref.finalize(sample, self._forget, digest)
+
+        return sample, sample_rate
+
+    def _forget(self, digest: str) -> None:
+        """Drop the paths and sample rate of a sample that has been freed.
+
+        Args:
+            digest (str): The hex digest of the sample's contents.
+        """
+        with self._lock:
+            # the contents may have been decoded again since
+            if self._samples.get(digest) is not None:
+                return
+
+            self._sample_rates.pop(digest, None)
+            for path_key in [k for k, v in self._digests.items() if v == digest]:
+                del self._digests[path_key]
+
+    def clear(self) -> None:
+        """Remove every stored sample and reset the statistics."""
+        with self._lock:
+            self._digests.clear()
+            self._samples.clear()
+            self._sample_rates.clear()
+            self.hits = 0
+            self.misses = 0
+            self.bytes_saved = 0
+
+    @classmethod
+    def hash_file(cls, path: str | Path) -> str:
+        """Hash a file's contents.
+
+        Args:
+            path (str|Path): The path to the file.
+
+        Returns:
+            str: The hex digest of the file's contents.
+        """
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, HASH_ALGORITHM).hexdigest()
+
+    @classmethod
+    def _decode(cls, path: str | Path) -> tuple[np.ndarray, int]:
+        """Decode a sample from disk.
+
+        Args:
+            path (str|Path): The path to the sample.
+
+        Returns:
+            tuple[np.ndarray, int]: The sample and its sample rate.
+        """
+        mapped = WavReader.memmap(path)
+
+        return mapped if mapped is not None else sf.read(path, dtype="int16")
+
+
+SAMPLE_STORE = SampleStore()
@@ -4,10 +4,10 @@ This module contains the Sampler class.
 """
 
 
-import threading
-
 from octo_slample.constants import DEFAULT_CHANNEL_COUNT
+from octo_slample.sampler.mixer import Mixer
 from octo_slample.sampler.sample_bank import SampleBank
+from octo_slample.sampler.voice_pool import DEFAULT_MAX_POLYPHONY
 
 
 class Sampler:
@@ -32,17 +32,32 @@ class Sampler:
     ```
 
     To get the number of channels, call `len(sampler)`.
+
+    All channels are played through a single
+    :class:`~octo_slample.sampler.mixer.Mixer`, which is started on the
+    first call to `play_channel`.
     """
 
-    def __init__(self, channel_count: int = DEFAULT_CHANNEL_COUNT):
+    def __init__(
+        self,
+        channel_count: int = DEFAULT_CHANNEL_COUNT,
+        mixer: Mixer | None = None,
+        max_polyphony: int = DEFAULT_MAX_POLYPHONY,
+    ):
         """Initialize the sampler.
 
         Creates the sampler pattern and sample bank.
 
         Args:
             channel_count (Optional): The number of channels. Defaults to 8.
+            mixer (Optional): The mixer to play channels through.
+                Defaults to a new :class:`~octo_slample.sampler.mixer.Mixer`.
+            max_polyphony (Optional): The maximum number of voices that can
+                play at once, when a new mixer is created. Defaults to
+                `DEFAULT_MAX_POLYPHONY`.
         """
         self._bank = SampleBank(channel_count)
+        self._mixer = mixer if mixer is not None else Mixer(max_polyphony=max_polyphony)
 
     @property
     def bank(self):
@@ -63,10 +78,25 @@ class Sampler:
         assert isinstance(bank, SampleBank), "bank must be a SampleBank"
         self._bank = bank
 
+    @property
+    def mixer(self) -> Mixer:
+        """Get the mixer.
+
+        Returns:
+            Mixer: The mixer.
+        """
+        return self._mixer
+
     def play_channel(self, channel: int):
         """Play a channel.
 
-        This method is non-blocking.
+        This method is non-blocking.  The channel's sample is pushed
+        onto the mixer, which is started if it is not already running.
+        Playing a channel stops any voices in the same choke group.
+        The channel's volume is applied by the mixer, so volume changes
+        take effect from the next time the channel is played, and the
+        sample is resampled by the mixer if it is not at the output
+        sample rate.
 
         Channels are 0-indexed.
         """
@@ -75,8 +105,30 @@ class Sampler:
             self
         ), f"channel must be in range 0-{len(self) - 1}"
 
-        x = threading.Thread(target=self.bank[channel].play)
-        x.start()
+        self._trigger_channel(channel)
+
+    def _trigger_channel(self, channel: int, gain: float | None = None):
+        """Play a channel that is known to be valid.
+
+        This is `play_channel` without the argument checks, for callers
+        that have validated their channels ahead of time.
+
+        Args:
+            channel (int): The channel. 0-indexed.
+            gain (float, optional): The linear gain to play the channel
+                at. Defaults to ``None``, the channel's gain.
+        """
+        if not self._mixer.is_running:
+            self._mixer.start()
+
+        bank_channel = self.bank[channel]
+        self._mixer.trigger(
+            channel,
+            bank_channel.sample,
+            bank_channel.choke_group,
+            bank_channel.gain if gain is None else gain,
+            bank_channel.sample_rate,
+        )
 
     def __len__(self):
         """Return the number of channels.
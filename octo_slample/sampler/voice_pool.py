@@ -0,0 +1,182 @@
+"""Fixed-size voice pool.
+
+This module contains the Voice and VoicePool classes.  The pool bounds
+the number of samples that can play at once, so memory and CPU stay
+flat no matter how densely channels are triggered.
+"""
+from collections.abc import Iterator
+
+import numpy as np
+
+from octo_slample.constants import DEFAULT_MAX_POLYPHONY
+
+
+class Voice:
+    """A slot in the voice pool that plays one sample."""
+
+    __slots__ = ("channel", "buffer", "gain", "position", "choke_group", "serial")
+
+    def __init__(self):
+        """Initialize an idle voice."""
+        self.channel = None
+        self.buffer = None
+        self.gain = 1.0
+        self.position = 0
+        self.choke_group = None
+        self.serial = 0
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the voice is playing a sample.
+
+        Returns:
+            bool: True if the voice is playing, False if it is free.
+        """
+        return self.buffer is not None
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the whole buffer has been played.
+
+        Returns:
+            bool: True if there is no audio left to play.
+        """
+        return self.buffer is None or self.position >= len(self.buffer)
+
+    def start(
+        self,
+        channel: int,
+        buffer: np.ndarray,
+        choke_group: int | None,
+        serial: int,
+        gain: float = 1.0,
+    ) -> None:
+        """Start playing a sample from the beginning.
+
+        Args:
+            channel (int): The channel that triggered the voice.
+            buffer (np.ndarray): The audio to play, shaped
+                ``(frames, channels)``.
+            choke_group (int|None): The channel's choke group.
+            serial (int): The trigger order, used to find the oldest voice.
+            gain (float, optional): The linear gain applied as the voice
+                is mixed. Defaults to ``1.0``.
+        """
+        self.channel = channel
+        self.buffer = buffer
+        self.gain = gain
+        self.position = 0
+        self.choke_group = choke_group
+        self.serial = serial
+
+    def release(self) -> None:
+        """Stop playing and free the voice.
+
+        The reference to the sample is dropped so the buffer is not kept
+        alive by an idle voice.
+        """
+        self.channel = None
+        self.buffer = None
+        self.gain = 1.0
+        self.position = 0
+        self.choke_group = None
+
+
+class VoicePool:
+    """A fixed-size pool of voices.
+
+    All voices are allocated up front.  When every voice is busy, the
+    oldest voice is stolen.  Voices that share a choke group cut each
+    other off, e.g. a closed hi-hat choking an open hi-hat.
+    """
+
+    def __init__(self, max_polyphony: int = DEFAULT_MAX_POLYPHONY):
+        """Initialize the pool.
+
+        Args:
+            max_polyphony (int, optional): The maximum number of voices
+                that can play at once. Defaults to `DEFAULT_MAX_POLYPHONY`.
+        """
+        assert (
+            isinstance(max_polyphony, int) and max_polyphony > 0
+        ), f"max_polyphony must be a positive integer, but got {max_polyphony}"
+
+        self._voices = tuple(Voice() for _ in range(0, max_polyphony))
+        self._serial = 0
+
+    def __len__(self) -> int:
+        """Return the size of the pool.
+
+        Returns:
+            int: The maximum number of voices that can play at once.
+        """
+        return len(self._voices)
+
+    @property
+    def active_count(self) -> int:
+        """Get the number of playing voices.
+
+        Returns:
+            int: The number of playing voices.
+        """
+        return sum(1 for voice in self._voices if voice.is_active)
+
+    def active(self) -> Iterator[Voice]:
+        """Iterate over the playing voices.
+
+        Returns:
+            Iterator[Voice]: The playing voices.
+        """
+        return (voice for voice in self._voices if voice.is_active)
+
+    def allocate(
+        self,
+        channel: int,
+        buffer: np.ndarray,
+        choke_group: int | None = None,
+        gain: float = 1.0,
+    ) -> Voice:
+        """Start a sample on a voice from the pool.
+
+        Any voices in the same choke group are released first.  If no
+        voice is free, the oldest voice is stolen.
+
+        Args:
+            channel (int): The channel that triggered the sample.
+            buffer (np.ndarray): The audio to play, shaped
+                ``(frames, channels)``.
+            choke_group (int, optional): The channel's choke group.
+                Defaults to ``None``, which chokes nothing.
+            gain (float, optional): The linear gain applied as the voice
+                is mixed. Defaults to ``1.0``.
+
+        Returns:
+            Voice: The voice playing the sample.
+        """
+        if choke_group is not None:
+            self.choke(choke_group)
+
+        voice = next((voice for voice in self._voices if not voice.is_active), None)
+        if voice is None:
+            voice = min(self._voices, key=lambda voice: voice.serial)
+
+        self._serial += 1
+        voice.start(channel, buffer, choke_group, self._serial, gain)
+
+        return voice
+
+    def choke(self, choke_group: int) -> None:
+        """Release every voice in a choke group.
+
+        Args:
+            choke_group (int): The choke group to silence.
+        """
+        for voice in self._voices:
+            if voice.is_active and voice.choke_group == choke_group:
+                voice.release()
+
+    def release_finished(self) -> None:
+        """Release every voice that has played its whole sample."""
+        for voice in self._voices:
+            if voice.is_active and voice.is_finished:
+                voice.release()
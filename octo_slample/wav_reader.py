@@ -0,0 +1,204 @@
+"""Read WAV files without decoding them.
+
+This module contains a class that reads the header of a RIFF WAV file
+and maps 16-bit PCM audio directly from disk, so samples cost page-cache
+pages rather than resident memory.
+"""
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+RIFF_HEADER = struct.Struct("<4sI4s")
+CHUNK_HEADER = struct.Struct("<4sI")
+FMT_CHUNK = struct.Struct("<HHIIHH")
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+EXTENSIBLE_SUBFORMAT_OFFSET = 24
+PCM_16_BITS_PER_SAMPLE = 16
+
+# soundfile subtypes, by format tag and bits per sample
+SUBTYPES = {
+    (WAVE_FORMAT_PCM, 8): "PCM_U8",
+    (WAVE_FORMAT_PCM, 16): "PCM_16",
+    (WAVE_FORMAT_PCM, 24): "PCM_24",
+    (WAVE_FORMAT_PCM, 32): "PCM_32",
+    (WAVE_FORMAT_IEEE_FLOAT, 32): "FLOAT",
+    (WAVE_FORMAT_IEEE_FLOAT, 64): "DOUBLE",
+}
+
+
+class WavHeader(NamedTuple):
+    """The layout of a WAV file's audio data."""
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames in the data chunk.
+
+        Returns:
+            int: The number of frames.
+        """
+        return self.data_size // self.block_align
+
+    @property
+    def subtype(self) -> str | None:
+        """Get the soundfile subtype of the audio.
+
+        Returns:
+            str: The subtype, e.g. ``"PCM_16"``, or ``None`` if the
+                audio is not integer PCM or IEEE float.
+        """
+        if (
+            self.channels == 0
+            or self.block_align != self.channels * self.bits_per_sample // 8
+        ):
+            return None
+
+        return SUBTYPES.get((self.format_tag, self.bits_per_sample))
+
+    @property
+    def is_pcm_16(self) -> bool:
+        """Whether the audio is 16-bit integer PCM.
+
+        Returns:
+            bool: True if the audio is 16-bit PCM, False otherwise.
+        """
+        return (
+            self.format_tag == WAVE_FORMAT_PCM
+            and self.channels > 0
+            and self.bits_per_sample == PCM_16_BITS_PER_SAMPLE
+            and self.block_align == self.channels * 2
+        )
+
+
+class WavReader:
+    """Read WAV files without decoding them.
+
+    This class contains class methods that parse RIFF WAV headers and
+    memory-map 16-bit PCM audio.
+    """
+
+    @classmethod
+    def read_header(cls, path: str | Path) -> WavHeader | None:
+        """Read the header of a RIFF WAV file.
+
+        Only the RIFF, ``fmt `` and ``data`` chunk headers are read; no
+        audio is decoded.
+
+        Args:
+            path (str|Path): The path to the WAV file.
+
+        Returns:
+            WavHeader: The header, or ``None`` if the file is not a RIFF
+                WAV file with ``fmt `` and ``data`` chunks.
+        """
+        with open(path, "rb") as f:
+            header = f.read(RIFF_HEADER.size)
+            if len(header) < RIFF_HEADER.size:
+                return None
+
+            riff, _, wave = RIFF_HEADER.unpack(header)
+            if riff != b"RIFF" or wave != b"WAVE":
+                return None
+
+            file_size = Path(path).stat().st_size
+            fmt = None
+
+            while chunk := f.read(CHUNK_HEADER.size):
+                if len(chunk) < CHUNK_HEADER.size:
+                    return None
+
+                chunk_id, chunk_size = CHUNK_HEADER.unpack(chunk)
+
+                if chunk_id == b"fmt ":
+                    fmt_chunk = f.read(chunk_size)
+                    if len(fmt_chunk) < FMT_CHUNK.size:
+                        return None
+
+                    fmt = cls._read_fmt_chunk(fmt_chunk)
+                    f.seek(chunk_size % 2, 1)
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        return None
+
+                    data_offset = f.tell()
+                    data_size = min(chunk_size, file_size - data_offset)
+
+                    return WavHeader(*fmt, data_offset, data_size)
+                else:
+                    f.seek(chunk_size + chunk_size % 2, 1)
+
+        return None
+
+    @classmethod
+    def memmap(cls, path: str | Path) -> tuple[np.ndarray, int] | None:
+        """Map a 16-bit PCM WAV file's audio into memory, read-only.
+
+        The returned array is backed by the file, so no audio is decoded
+        or copied until it is read.  Mono files are returned as a 1D
+        array and multi-channel files as ``(frames, channels)``, matching
+        `soundfile.read`.
+
+        Args:
+            path (str|Path): The path to the WAV file.
+
+        Returns:
+            tuple[np.ndarray, int]: The audio and its sample rate, or
+                ``None`` if the file is not a 16-bit PCM WAV file.
+        """
+        header = cls.read_header(path)
+        if header is None or not header.is_pcm_16 or header.frames == 0:
+            return None
+
+        import numpy as np
+
+        shape = (
+            (header.frames,)
+            if header.channels == 1
+            else (header.frames, header.channels)
+        )
+        audio = np.memmap(
+            path, dtype="<i2", mode="r", offset=header.data_offset, shape=shape
+        )
+
+        return audio, header.sample_rate
+
+    @classmethod
+    def _read_fmt_chunk(cls, chunk: bytes) -> tuple[int, int, int, int, int]:
+        """Parse the fields of a ``fmt `` chunk.
+
+        For ``WAVE_FORMAT_EXTENSIBLE`` files, the format tag is taken from
+        the sub-format GUID.
+
+        Args:
+            chunk (bytes): The contents of the ``fmt `` chunk.
+
+        Returns:
+            tuple: The format tag, channel count, sample rate, bits per
+                sample and block alignment.
+        """
+        format_tag, channels, sample_rate, _, block_align, bits = FMT_CHUNK.unpack(
+            chunk[: FMT_CHUNK.size]
+        )
+
+        if (
+            format_tag == WAVE_FORMAT_EXTENSIBLE
+            and len(chunk) >= EXTENSIBLE_SUBFORMAT_OFFSET + 2
+        ):
+            (format_tag,) = struct.unpack_from("<H", chunk, EXTENSIBLE_SUBFORMAT_OFFSET)
+
+        return format_tag, channels, sample_rate, bits, block_align
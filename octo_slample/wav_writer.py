@@ -21,9 +21,12 @@ Squid Sample requires WAV files to have the following spec:
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import soundfile as sf
 
 from octo_slample.directory import DirectoryMixin
+from octo_slample.file_copier import FileCopier
+from octo_slample.sample_converter import MAX_OUTPUT_CHANNELS, SampleConverter
 from octo_slample.sampler.channel import Channel
 from octo_slample.sampler.sample_bank import SampleBank
 
@@ -79,7 +82,11 @@ class WavWriter(DirectoryMixin):
         """Export the sample to 16-bit, 44.1kHz WAV file.
 
         This method converts the sample into the audio format required
-        by the ALM Squid Salmple.
+        by the ALM Squid Salmple.  Samples of channels at 0 dB that are
+        already in that format are copied as-is, without being decoded.
+        Otherwise, the sample is streamed from its file block by block,
+        so it is never decoded into memory whole, and the channel's
+        volume is applied as it is converted.
 
         Args:
             channel (Channel): The channel to export.
@@ -96,21 +103,73 @@ class WavWriter(DirectoryMixin):
             bank_output_path, (str, Path)
         ), "bank_output_path must be a string or Path"
 
-        if channel.sample is None:
+        sample_path = channel.sample_path
+        if sample_path is None:
             return ValueError(f"Channel {channel} has no sample to export")
 
         full_path = cls.build_sample_output_path(bank_output_path, channel.number)
         cls.create_directory(bank_output_path)
 
+        if channel.volume == 0 and cls.is_squid_format(sample_path):
+            return FileCopier.copy(sample_path, full_path)
+
+        return SampleConverter.convert(
+            sample_path, full_path, SQUID_SALMPLE_WAV_SAMPLE_RATE, gain=channel.gain
+        )
+
+    @classmethod
+    def is_squid_format(cls, sample_path: str | Path) -> bool:
+        """Check whether a sample is already in the Squid Salmple format.
+
+        Only the file's header is read.
+
+        Args:
+            sample_path (str|Path): The path to the sample.
+
+        Returns:
+            bool: True if the sample is a 16-bit, 44.1kHz WAV file with
+                at most two channels, False otherwise or if the file
+                cannot be read.
+        """
+        try:
+            info = sf.info(str(sample_path))
+        except RuntimeError:
+            return False
+
+        return (
+            info.format == SQUID_SALMPLE_AUDIO_FORMAT
+            and info.subtype == SQUID_SALMPLE_WAV_SUBTYPE
+            and info.samplerate == SQUID_SALMPLE_WAV_SAMPLE_RATE
+            and info.channels <= MAX_OUTPUT_CHANNELS
+        )
+
+    @classmethod
+    def write_audio(
+        cls,
+        audio: np.ndarray,
+        output_path: str | Path,
+        sample_rate: int = SQUID_SALMPLE_WAV_SAMPLE_RATE,
+    ) -> str:
+        """Write audio to a 16-bit WAV file.
+
+        Args:
+            audio (np.ndarray): The audio to write.
+            output_path (str|Path): The path of the WAV file.
+            sample_rate (int, optional): The sample rate of the audio.
+                Defaults to 44.1kHz.
+
+        Returns:
+            str: The path to the written file.
+        """
         sf.write(
-            full_path,
-            channel.sample,
-            SQUID_SALMPLE_WAV_SAMPLE_RATE,
+            str(output_path),
+            audio,
+            sample_rate,
             subtype=SQUID_SALMPLE_WAV_SUBTYPE,
             format=SQUID_SALMPLE_AUDIO_FORMAT,
         )
 
-        return full_path
+        return str(output_path)
 
     @classmethod
     def write_bank(
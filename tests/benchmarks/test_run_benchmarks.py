@@ -0,0 +1,70 @@
+import json
+
+import pytest
+import soundfile as sf
+from click.testing import CliRunner
+
+from benchmarks.run_benchmarks import BENCHMARKS, main, run_benchmarks
+from benchmarks.synthetic_library import LibrarySpec, SyntheticLibrary
+
+TINY_LIBRARY = LibrarySpec(banks=2, duration=0.01, sample_rate=8000)
+
+
+def test_generate(tmp_path):
+    bank_files = SyntheticLibrary.generate(tmp_path, TINY_LIBRARY)
+
+    assert bank_files == [
+        tmp_path / "bank_001" / "bank.json",
+        tmp_path / "bank_002" / "bank.json",
+    ]
+    info = sf.info(tmp_path / "bank_001" / "sample_8.wav")
+    assert (info.samplerate, info.channels, info.frames) == (8000, 2, 80)
+    assert info.subtype == "PCM_24"
+
+
+def test_generate_is_seeded(tmp_path):
+    SyntheticLibrary.generate(tmp_path / "a", TINY_LIBRARY)
+    SyntheticLibrary.generate(tmp_path / "b", TINY_LIBRARY)
+
+    assert (tmp_path / "a" / "bank_002" / "sample_3.wav").read_bytes() == (
+        tmp_path / "b" / "bank_002" / "sample_3.wav"
+    ).read_bytes()
+
+
+def test_run_benchmarks(tmp_path):
+    results = run_benchmarks(TINY_LIBRARY, tmp_path, repeat=1)
+
+    assert results["library"]["banks"] == 2
+    assert [result["name"] for result in results["results"]] == list(BENCHMARKS)
+    for result in results["results"]:
+        assert result["runs"] == 1
+        assert 0 <= result["min"] <= result["median"] <= result["max"]
+
+
+def test_run_unknown_benchmark_fails(tmp_path):
+    with pytest.raises(AssertionError):
+        run_benchmarks(TINY_LIBRARY, tmp_path, ["unknown"])
+
+
+def test_main_writes_json(tmp_path):
+    output = tmp_path / "results.json"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "--banks",
+            "1",
+            "--duration",
+            "0.01",
+            "--repeat",
+            "1",
+            "-k",
+            "text_pattern.parse",
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    results = json.loads(output.read_text())
+    assert [result["name"] for result in results["results"]] == ["text_pattern.parse"]
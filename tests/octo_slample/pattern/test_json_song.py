@@ -0,0 +1,97 @@
+import json
+import shutil
+from contextlib import nullcontext as does_not_raise
+from pathlib import Path
+
+import pytest
+from schema import SchemaError
+
+from octo_slample.json import JsonMixin
+from octo_slample.pattern.json_pattern import JsonPattern
+from octo_slample.pattern.json_song import JsonSong
+from octo_slample.pattern.song import Song
+
+PATTERNS = Path("patterns").resolve()
+SONG = Path("songs", "song.json").resolve()
+PATTERN = str(PATTERNS / "pattern.json")
+
+
+def test_json_song_init():
+    json_song = JsonSong()
+
+    assert isinstance(json_song, Song)
+    assert isinstance(json_song, JsonMixin)
+
+
+def test_json_song_load():
+    song = JsonSong.from_file(SONG)
+
+    assert song.file_path == SONG
+    assert song.name == "Song 1"
+    assert song.description == "Test song #1"
+    assert [section.repeats for section in song.sections] == [4, 2, 1]
+    assert len(song) == 16 * 4 + 64 * 2 + 16
+
+
+def test_json_song_loads_each_pattern_once(mocker):
+    from_files = mocker.spy(JsonPattern, "from_files")
+
+    song = JsonSong.from_file(SONG)
+
+    assert [path.resolve() for path in from_files.call_args.args[0]] == [
+        PATTERNS / "pattern.json",
+        PATTERNS / "organic_house.pattern.json",
+    ]
+    assert song.sections[0].pattern is song.sections[2].pattern
+
+
+def test_json_song_resolves_patterns_against_song_file(tmp_path, monkeypatch):
+    (tmp_path / "song").mkdir()
+    shutil.copy(PATTERN, tmp_path / "song" / "verse.json")
+    (tmp_path / "song" / "song.json").write_text(
+        json.dumps({"name": "song", "sections": [{"pattern": "verse.json"}]})
+    )
+    monkeypatch.chdir(tmp_path)
+
+    song = JsonSong.from_file("song/song.json")
+
+    assert len(song) == 16
+
+
+@pytest.mark.parametrize(
+    ("json_song", "exception"),
+    [
+        ({"name": "song", "sections": [{"pattern": PATTERN}]}, does_not_raise()),
+        ({"name": "song", "sections": []}, pytest.raises(SchemaError)),
+        ({"sections": [{"pattern": PATTERN}]}, pytest.raises(SchemaError)),
+        (
+            {"name": "song", "sections": [{"pattern": PATTERN, "repeat": 0}]},
+            pytest.raises(SchemaError),
+        ),
+        (
+            {
+                "name": "song",
+                "sections": [{"pattern": str(PATTERNS / "invalid" / "no_name.json")}],
+            },
+            pytest.raises(SchemaError),
+        ),
+        (
+            {"name": "song", "sections": [{"pattern": "missing.json"}]},
+            pytest.raises(FileNotFoundError),
+        ),
+    ],
+    ids=[
+        "valid",
+        "no_sections",
+        "no_name",
+        "zero_repeat",
+        "invalid_pattern",
+        "missing_pattern",
+    ],
+)
+def test_json_song_load_invalid(tmp_path, json_song, exception):
+    path = tmp_path / "song.json"
+    path.write_text(json.dumps(json_song))
+
+    with exception:
+        JsonSong.from_file(path)
@@ -1,5 +1,6 @@
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
 import pytest
 
 from octo_slample.constants import DEFAULT_CHANNEL_COUNT, DEFAULT_STEP_COUNT
@@ -34,7 +35,7 @@ def test_reset_negative_channel_count_fails(pattern_fixture):
 
 
 def test_reset_initializes_empty_pattern(pattern_fixture):
-    pattern_fixture._pattern[0][0] = True
+    pattern_fixture._steps[0, 0] = True
     pattern_fixture.reset()
     p = pattern_fixture.pattern
 
@@ -57,11 +58,18 @@ def test_channel_count_custom(pattern_fixture):
 def test_pattern_property_getter(pattern_fixture):
     p = pattern_fixture.pattern
 
-    assert p == pattern_fixture._pattern
+    assert p == pattern_fixture._steps.tolist()
+
+
+def test_pattern_property_is_a_view(pattern_fixture):
+    pattern_fixture.pattern[1][2] = True
+
+    assert pattern_fixture.is_step_set(1, 2) is True
+    assert pattern_fixture[1][2] is True
 
 
 def test_is_step_set(pattern_fixture):
-    pattern_fixture._pattern[0][0] = True
+    pattern_fixture._steps[0, 0] = True
     assert pattern_fixture.is_step_set(0, 0) is True
 
 
@@ -71,7 +79,43 @@ def test_is_step_set_negative_channel_fails(pattern_fixture):
 
 
 def test__getitem__(pattern_fixture):
-    assert pattern_fixture[0] == pattern_fixture._pattern[0]
+    assert pattern_fixture[0] == pattern_fixture._steps[0].tolist()
+
+
+def test_steps_is_read_only(pattern_fixture):
+    with pytest.raises(ValueError):
+        pattern_fixture.steps[0, 0] = True
+
+
+def test_channels_on_step(pattern_fixture):
+    pattern_fixture[1][4] = True
+    pattern_fixture[5][4] = True
+
+    assert pattern_fixture.channels_on_step(4).tolist() == [1, 5]
+    assert pattern_fixture.channels_on_step(0).tolist() == []
+
+
+def test_hit_counts(pattern_fixture):
+    pattern_fixture[0][::4] = True
+    pattern_fixture[2][3] = True
+
+    assert pattern_fixture.hit_counts().tolist() == [4, 0, 1, 0, 0, 0, 0, 0]
+
+
+def test_density_per_bar():
+    pattern = Pattern(channel_count=2, step_count=40)
+    pattern[0][::2] = True
+    pattern[1][32:] = True
+
+    np.testing.assert_allclose(
+        pattern.density_per_bar(), [[0.5, 0.5, 0.5], [0.0, 0.0, 1.0]]
+    )
+
+
+def test_long_pattern_is_compact():
+    pattern = Pattern(step_count=16 * 1024)
+
+    assert pattern.steps.nbytes == DEFAULT_CHANNEL_COUNT * 16 * 1024
 
 
 def test_channel_volumes__get(pattern_fixture):
@@ -0,0 +1,43 @@
+import pytest
+
+from octo_slample.pattern.pattern import Pattern
+from octo_slample.pattern.song import Song, SongSection
+
+
+@pytest.fixture
+def song():
+    verse = Pattern(step_count=16)
+    chorus = Pattern(step_count=32)
+
+    return Song([SongSection(verse, 2), (chorus, 1)], name="song")
+
+
+def test_song_init(song):
+    assert song.name == "song"
+    assert song.description is None
+    assert [section.repeats for section in song.sections] == [2, 1]
+    assert all(isinstance(section, SongSection) for section in song.sections)
+
+
+def test_song_init_no_sections():
+    assert Song().sections == ()
+    assert len(Song()) == 0
+
+
+def test_song_len(song):
+    assert len(song) == 16 * 2 + 32
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [[], [("pattern", 1)], [(Pattern(), 0)], [(Pattern(), 1.5)]],
+    ids=["empty", "not_pattern", "zero_repeats", "float_repeats"],
+)
+def test_song_invalid_sections_fail(song, sections):
+    with pytest.raises(AssertionError):
+        song.sections = sections
+
+
+def test_song_str(song):
+    assert str(song).startswith("Section 1 (x2):\n")
+    assert "Section 2 (x1):\n" in str(song)
@@ -128,7 +128,7 @@ def test_validate_pattern_lines(pattern_fixture, lines, exception):
 def test_convert_lines_to_pattern(pattern_fixture, lines, expected, exception):
     with exception:
         pattern_fixture._convert_lines_to_pattern(lines)
-        assert pattern_fixture._pattern == expected
+        assert pattern_fixture.pattern == expected
 
 
 def test__build_pattern_header(pattern_fixture):
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
+import soundfile as sf
 
-from octo_slample.sampler.channel import LEFT_RIGHT_CHANNEL_COUNT, SAMPLE_WIDTH, Channel
+from octo_slample.sampler.channel import Channel
+from octo_slample.sampler.sample_store import SAMPLE_STORE
 
 DEFAULT_CHANNEL = 0
 
@@ -18,21 +20,21 @@ def sample_path(tmp_path):
     return f
 
 
+@pytest.fixture(autouse=True)
+def clear_sample_store():
+    SAMPLE_STORE.clear()
+
+
 @pytest.fixture
 def sf_read_mock(mocker, audio_data):
-    a = mocker.patch("octo_slample.sampler.channel.sf.read")
+    a = mocker.patch("octo_slample.sampler.sample_store.sf.read")
     a.return_value = (np.copy(audio_data), 44100)
 
     return a
 
 
 @pytest.fixture
-def play_mock(mocker):
-    return mocker.patch("octo_slample.sampler.channel.sa.play_buffer")
-
-
-@pytest.fixture
-def channel_fixture(sf_read_mock, play_mock, sample_path):
+def channel_fixture(sf_read_mock, sample_path):
     return Channel(channel_number=DEFAULT_CHANNEL, sample_path=sample_path)
 
 
@@ -47,6 +49,73 @@ def test_channel_init_no_sample():
     assert channel._sample is None
 
 
+def test_set_sample_is_lazy(channel_fixture, sf_read_mock):
+    sf_read_mock.assert_not_called()
+
+    channel_fixture.sample
+
+    sf_read_mock.assert_called_once_with(channel_fixture.sample_path, dtype="int16")
+
+
+def test_sample_is_not_copied(channel_fixture):
+    channel_fixture.volume = -3.0
+
+    assert channel_fixture.sample is channel_fixture._sample
+
+
+def test_sample_rate(channel_fixture):
+    assert channel_fixture.sample_rate == 44100
+
+
+def test_sample_rate_no_sample():
+    assert Channel(DEFAULT_CHANNEL).sample_rate is None
+
+
+def test_set_sample_data(sf_read_mock, audio_data):
+    channel = Channel(DEFAULT_CHANNEL)
+
+    channel.set_sample_data(audio_data, 48000, "missing.wav")
+
+    assert channel.sample is audio_data
+    assert channel.sample_rate == 48000
+    assert channel.sample_path == "missing.wav"
+    sf_read_mock.assert_not_called()
+
+
+def test_set_sample_data_without_path(audio_data):
+    channel = Channel(DEFAULT_CHANNEL)
+
+    channel.set_sample_data(audio_data, 44100)
+
+    assert channel.sample is audio_data
+    assert channel.sample_rate == 44100
+
+
+def test_set_sample_data_invalid_sample_rate_fails(audio_data):
+    with pytest.raises(AssertionError):
+        Channel(DEFAULT_CHANNEL).set_sample_data(audio_data, 0)
+
+
+def test_pcm_16_wav_is_memory_mapped(tmp_path, sf_read_mock, audio_data):
+    path = tmp_path / "pcm16.wav"
+    sf.write(path, audio_data, 22050, subtype="PCM_16")
+
+    channel = Channel(DEFAULT_CHANNEL, sample_path=str(path))
+
+    assert isinstance(channel.sample, np.memmap)
+    assert not channel.sample.flags.writeable
+    assert np.array_equal(channel.sample, audio_data)
+    assert channel.sample_rate == 22050
+    sf_read_mock.assert_not_called()
+
+
+def test_sample_is_shared_between_channels(channel_fixture, sample_path, sf_read_mock):
+    other = Channel(DEFAULT_CHANNEL + 1, sample_path=sample_path, volume=-3.0)
+
+    assert channel_fixture.sample is other.sample
+    sf_read_mock.assert_called_once()
+
+
 def test_get_sample_default_is_audio_data(channel_fixture, audio_data):
     assert channel_fixture.sample is not None
     assert np.array_equal(channel_fixture.sample, audio_data)
@@ -69,32 +138,6 @@ def test_set_sample_none_has_no_side_effect(channel_fixture, sf_read_mock):
     sf_read_mock.assert_not_called()
 
 
-@pytest.mark.parametrize(
-    "sound",
-    [
-        (pytest.lazy_fixture("sample_path")),
-        (None),
-    ],
-    ids=["valid_sample_path", "no_sample_path"],
-)
-def test_play(channel_fixture, play_mock, sound):
-    if sound is None:
-        channel_fixture._sample = None
-        channel_fixture._sample_rate = None
-
-    channel_fixture.play()
-
-    if sound is not None:
-        play_mock.assert_called_once_with(
-            channel_fixture._sample,
-            LEFT_RIGHT_CHANNEL_COUNT,
-            SAMPLE_WIDTH,
-            channel_fixture._sample_rate,
-        )
-    else:
-        play_mock.assert_not_called()
-
-
 def test_get_sample_path(channel_fixture, sample_path):
     assert channel_fixture.sample_path == sample_path
 
@@ -117,33 +160,79 @@ def test_db_to_percent(volume, expected):
 
 
 def test_apply_audio_volume(channel_fixture, audio_data):
-    result = channel_fixture.apply_audio_volume(channel_fixture._sample, volume=-3)
+    result = channel_fixture.apply_audio_volume(channel_fixture.sample, volume=-3)
 
     assert np.array_equal(result, (audio_data * 0.501).astype(np.int16))
 
 
+def test_choke_group__default(channel_fixture):
+    assert channel_fixture.choke_group is None
+
+
+def test_choke_group__set(channel_fixture):
+    channel_fixture.choke_group = 1
+
+    assert channel_fixture.choke_group == 1
+
+
+def test_choke_group__set_invalid_arg_fails(channel_fixture):
+    with pytest.raises(AssertionError):
+        channel_fixture.choke_group = "hats"
+
+
+def test_info__default(channel_fixture):
+    assert channel_fixture.info is None
+
+
+def test_info__reset_when_sample_changes(channel_fixture, sample_path):
+    channel_fixture.info = {"frames": 10}
+    assert channel_fixture.info == {"frames": 10}
+
+    channel_fixture.sample = sample_path
+
+    assert channel_fixture.info is None
+
+
+def test_info__set_invalid_arg_fails(channel_fixture):
+    with pytest.raises(AssertionError):
+        channel_fixture.info = "PCM_16"
+
+
 def test_volume__get(channel_fixture):
     assert channel_fixture.volume == 0
 
 
-def test_volume__set_does_not_scale_audi_when_no_original_sample(
-    channel_fixture, audio_data
-):
-    del channel_fixture._original_sample
-
+def test_volume__set_does_not_load_sample(channel_fixture, sf_read_mock):
     channel_fixture.volume = 3
     assert channel_fixture._volume == 3.0
 
-    assert np.array_equal(channel_fixture._sample, audio_data)
+    assert channel_fixture._sample is None
+    sf_read_mock.assert_not_called()
 
 
-def test_volume__set_float_scales_audio(channel_fixture, audio_data):
+def test_volume__set_does_not_scale_audio(channel_fixture, audio_data):
     channel_fixture.volume = -3.0
 
     assert channel_fixture._volume == -3.0
-    assert np.array_equal(
-        channel_fixture._sample, (audio_data * 0.501).astype(np.int16)
-    )
+    assert np.array_equal(channel_fixture.sample, audio_data)
+
+
+def test_volume__set_after_load_does_not_reload(channel_fixture, sf_read_mock):
+    channel_fixture.sample
+    channel_fixture.volume = -3.0
+    channel_fixture.sample
+
+    sf_read_mock.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "volume,expected",
+    [(0, 1.0), (-3, 0.501), (3, 1.995)],
+)
+def test_gain(channel_fixture, volume, expected):
+    channel_fixture.volume = volume
+
+    assert channel_fixture.gain == pytest.approx(expected, 0.001)
 
 
 def test_volume__set_invalid_arg_fails(channel_fixture):
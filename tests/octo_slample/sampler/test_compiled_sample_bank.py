@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from octo_slample.sampler.compiled_sample_bank import (
+    CHANNEL_ALIGNMENT,
+    DATA_ALIGNMENT,
+    FORMAT_VERSION,
+    MAGIC,
+    PREAMBLE,
+    CompiledSampleBank,
+)
+from octo_slample.sampler.json_sample_bank import JsonSampleBank
+from octo_slample.sampler.sample_bank import SampleBank
+
+
+@pytest.fixture
+def sample_bank(tmp_path):
+    """Get a bank with mono, stereo and empty channels."""
+    mono = tmp_path / "mono.wav"
+    stereo = tmp_path / "stereo.wav"
+    sf.write(mono, np.arange(-50, 51, dtype=np.int16), 44100, subtype="PCM_16")
+    sf.write(
+        stereo,
+        np.arange(-30, 30, dtype=np.int16).reshape(-1, 2),
+        48000,
+        subtype="PCM_24",
+    )
+
+    bank = SampleBank(name="compiled", description="A compiled bank")
+    bank.samples = [
+        {"path": str(mono), "name": "kick"},
+        {"path": str(stereo), "name": "hat", "choke": 1},
+    ] + [{"path": None}] * 6
+    bank[1].volume = -6
+
+    return bank
+
+
+@pytest.fixture
+def compiled_bank_file(sample_bank, tmp_path):
+    return CompiledSampleBank.compile(sample_bank, tmp_path / "bank.octobank")
+
+
+def test_compiled_sample_bank_round_trip(sample_bank, compiled_bank_file):
+    bank = CompiledSampleBank.from_file(compiled_bank_file)
+
+    assert isinstance(bank, SampleBank)
+    assert bank.name == "compiled"
+    assert bank.description == "A compiled bank"
+    assert len(bank) == len(sample_bank)
+
+    for compiled, channel in zip(bank._channels, sample_bank._channels):
+        assert compiled.name == channel.name
+        assert compiled.volume == channel.volume
+        assert compiled.choke_group == channel.choke_group
+        assert compiled.sample_path == channel.sample_path
+        assert compiled.sample_rate == channel.sample_rate
+
+        if channel.sample is None:
+            assert compiled.sample is None
+        else:
+            np.testing.assert_array_equal(compiled.sample, channel.sample)
+            assert compiled.sample.dtype == np.int16
+
+
+def test_compiled_sample_bank_maps_aligned_samples(compiled_bank_file):
+    bank = CompiledSampleBank.from_file(compiled_bank_file)
+    (_, _, header_size) = PREAMBLE.unpack(
+        compiled_bank_file.read_bytes()[: PREAMBLE.size]
+    )
+
+    for channel in [bank[0], bank[1]]:
+        assert isinstance(channel.sample, np.memmap)
+        assert not channel.sample.flags.writeable
+        assert channel.sample.offset % DATA_ALIGNMENT == 0
+        assert (
+            channel.sample.ctypes.data - bank[0].sample.ctypes.data
+        ) % CHANNEL_ALIGNMENT == 0
+
+    # both channels are views of one map
+    assert np.shares_memory(bank[0].sample.base, bank[1].sample.base)
+
+
+def test_compiled_sample_bank_does_not_read_sample_files(
+    compiled_bank_file, sample_bank, mocker
+):
+    load = mocker.patch("octo_slample.sampler.channel.SAMPLE_STORE.load")
+
+    for path in {channel.sample_path for channel in sample_bank._channels} - {None}:
+        (compiled_bank_file.parent / path).unlink()
+
+    bank = CompiledSampleBank.from_file(compiled_bank_file)
+
+    assert bank[0].sample is not None
+    load.assert_not_called()
+
+
+def test_compiled_sample_bank_empty_bank(tmp_path):
+    bank = JsonSampleBank.from_file("banks/empty_sample_bank.json")
+    path = CompiledSampleBank.compile(bank, tmp_path / "empty.octobank")
+
+    compiled = CompiledSampleBank.from_file(path)
+
+    assert compiled.name == "EmptyBnk"
+    assert compiled.samples == [None] * 8
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"", b"RIFF", PREAMBLE.pack(b"NOTABANK", FORMAT_VERSION, 0)],
+    ids=["empty", "short", "magic"],
+)
+def test_compiled_sample_bank_rejects_other_files(tmp_path, contents):
+    path = tmp_path / "bank.octobank"
+    path.write_bytes(contents)
+
+    with pytest.raises(ValueError, match="is not a compiled bank"):
+        CompiledSampleBank.from_file(path)
+
+
+def test_compiled_sample_bank_rejects_other_versions(tmp_path):
+    path = tmp_path / "bank.octobank"
+    path.write_bytes(PREAMBLE.pack(MAGIC, FORMAT_VERSION + 1, 0))
+
+    with pytest.raises(ValueError, match="only version 1 is supported"):
+        CompiledSampleBank.from_file(path)
@@ -49,3 +49,28 @@ def test_json_sample_bank_load(pattern, exception):
 
         assert json_sample_bank is not None
         assert isinstance(json_sample_bank, SampleBank)
+
+
+@pytest.mark.parametrize(
+    ("info", "exception"),
+    [
+        (
+            {
+                "frames": 100,
+                "sample_rate": 44100,
+                "channels": 1,
+                "subtype": "PCM_16",
+                "size": 244,
+                "mtime_ns": 1,
+            },
+            does_not_raise(),
+        ),
+        ({"frames": 100}, pytest.raises(SchemaError)),
+    ],
+    ids=["valid", "incomplete"],
+)
+def test_json_sample_bank_schema_info(json_sample_bank, info, exception):
+    bank = {"name": "bank", "samples": [{"path": None, "info": info}]}
+
+    with exception:
+        json_sample_bank.schema().validate(bank)
@@ -1,26 +1,43 @@
+import numpy as np
 import pytest
 
-from octo_slample.clock import Clock
+from octo_slample.clock import SCHEDULE_DEADLINE, Clock
 from octo_slample.constants import (
     DEFAULT_BPM,
     DEFAULT_CHANNEL_COUNT,
     DEFAULT_STEP_COUNT,
 )
+from octo_slample.loop_stats import LoopStats
 from octo_slample.pattern.pattern import Pattern
-from octo_slample.sampler.looping_sampler import LoopingSampler
+from octo_slample.pattern.song import Song
+from octo_slample.sampler.channel import Channel
+from octo_slample.sampler.looping_sampler import LoopingSampler, Timeline
+from octo_slample.sampler.mixer import Mixer
 from octo_slample.sampler.sample_bank import SampleBank
 
+VERSE_GAIN = Channel.db_to_percent(-6)
+
 
 @pytest.fixture
 def looping_sampler(mock_sampler_play_channel) -> LoopingSampler:
     return LoopingSampler()
 
 
+@pytest.fixture
+def clocked_sampler(mock_sampler_play_channel) -> LoopingSampler:
+    return LoopingSampler(lookahead_steps=0)
+
+
 @pytest.fixture
 def mock_sampler_play_channel(mocker):
     return mocker.patch("octo_slample.sampler.sampler.Sampler.play_channel")
 
 
+@pytest.fixture
+def mock_sampler_trigger_channel(mocker):
+    return mocker.patch("octo_slample.sampler.sampler.Sampler._trigger_channel")
+
+
 @pytest.fixture
 def mock_clock_beat(mocker):
     return mocker.patch("octo_slample.clock.Clock.beat")
@@ -28,15 +45,27 @@ def mock_clock_beat(mocker):
 
 @pytest.fixture
 def pattern():
-    """Create a pattern with every other step set to true."""
+    """Create a pattern with every other channel set to true."""
     p = Pattern()
-    p._pattern = [
-        [_ % 2 == 0] * DEFAULT_STEP_COUNT for _ in range(0, DEFAULT_STEP_COUNT)
-    ]
+    for channel in range(0, p.channel_count(), 2):
+        p[channel][:] = True
 
     return p
 
 
+@pytest.fixture
+def song():
+    """Create a song of a verse played twice, then a chorus."""
+    verse = Pattern(step_count=4)
+    verse[0][0] = True
+    verse.channel_volumes = [-6] * DEFAULT_CHANNEL_COUNT
+    chorus = Pattern(step_count=4)
+    chorus[1][1] = True
+    chorus[3][1] = True
+
+    return Song([(verse, 2), (chorus, 1)])
+
+
 @pytest.fixture
 def mock_play_pattern(mocker):
     return mocker.patch(
@@ -67,6 +96,7 @@ def test_looping_sampler(looping_sampler) -> None:
 
     assert isinstance(looping_sampler.clock, Clock)
     assert looping_sampler.clock.bpm == DEFAULT_BPM
+    assert looping_sampler.clock.schedule == SCHEDULE_DEADLINE
 
     assert looping_sampler.pattern is None
     assert looping_sampler.bank is not None
@@ -113,34 +143,261 @@ def test_play_pattern_no_pattern_set(looping_sampler):
 
 
 def test_play_pattern(
-    looping_sampler, pattern, mock_sampler_play_channel, mock_clock_beat
+    looping_sampler, pattern, mock_sampler_trigger_channel, mock_clock_beat, mocker
 ) -> None:
     looping_sampler.pattern = pattern
     looping_sampler.bank = SampleBank()
+    is_step_set = mocker.spy(Pattern, "is_step_set")
 
     looping_sampler._play_pattern()
 
     assert (
-        mock_sampler_play_channel.call_count
+        mock_sampler_trigger_channel.call_count
         == (DEFAULT_STEP_COUNT * DEFAULT_CHANNEL_COUNT) / 2
     )
     assert mock_clock_beat.call_count == DEFAULT_STEP_COUNT
+    assert not is_step_set.called
+
 
+def test_compile_trigger_table() -> None:
+    pattern = Pattern(channel_count=3, step_count=4)
+    pattern[0][0] = True
+    pattern[2][0] = True
+    pattern[1][2] = True
+    pattern[2][3] = True
 
-def test_loop_not_running(looping_sampler, mock_play_pattern, pattern) -> None:
+    assert LoopingSampler.compile_trigger_table(pattern, 8) == (
+        (0, 2),
+        (),
+        (1,),
+        (2,),
+    )
+    assert LoopingSampler.compile_trigger_table(pattern, 2) == ((0,), (), (1,), ())
+
+
+def test_pattern_set_compiles_timeline(looping_sampler, pattern) -> None:
+    looping_sampler.pattern = pattern
+
+    assert looping_sampler.timeline == Timeline(
+        tuple(
+            (step, channel, None)
+            for step in range(0, DEFAULT_STEP_COUNT)
+            for channel in (0, 2, 4, 6)
+        ),
+        DEFAULT_STEP_COUNT,
+    )
+
+
+def test_bank_set_recompiles_timeline(looping_sampler, pattern) -> None:
     looping_sampler.pattern = pattern
-    looping_sampler.clock.stop()
-    looping_sampler.loop()
+    looping_sampler.bank = SampleBank(channel_count=3)
+
+    assert {event[1] for event in looping_sampler.timeline.events} == {0, 2}
+
+
+def test_loop_not_running(clocked_sampler, mock_play_pattern, pattern) -> None:
+    clocked_sampler.pattern = pattern
+    clocked_sampler.clock.stop()
+    clocked_sampler.loop()
 
     assert not mock_play_pattern.called
 
 
 def test_loop_running(
-    looping_sampler, mock_play_pattern, mock_clock_is_running, pattern
+    clocked_sampler, mock_play_pattern, mock_clock_is_running, pattern
 ) -> None:
-    looping_sampler.pattern = pattern
-    looping_sampler.clock.start()
-    looping_sampler.loop()
+    clocked_sampler.pattern = pattern
+    clocked_sampler.clock.start()
+    clocked_sampler.loop()
 
     assert mock_play_pattern.call_count == 4
     assert mock_clock_is_running.call_count == 5
+
+
+@pytest.fixture
+def scheduling_sampler(mocker, pattern):
+    mocker.patch("octo_slample.sampler.mixer.Mixer.start")
+    # 1.25 frames per sixteenth at 120 BPM
+    mixer = Mixer(sample_rate=10, block_size=4)
+
+    return LoopingSampler(pattern=pattern, mixer=mixer, lookahead_steps=4)
+
+
+def test_looping_sampler_invalid_lookahead_fails():
+    with pytest.raises(AssertionError):
+        LoopingSampler(lookahead_steps=-1)
+
+
+def test_frames_per_step(scheduling_sampler):
+    assert scheduling_sampler.frames_per_step == 1.25
+
+
+def test_schedule_steps(scheduling_sampler, mocker):
+    schedule = mocker.patch.object(scheduling_sampler.mixer, "schedule")
+
+    # steps 0-3 start at frames 100, 101.25, 102.5 and 103.75
+    next_step = scheduling_sampler.schedule_steps(100, 0, 104)
+
+    assert next_step == 3
+    assert [call.args[:2] for call in schedule.call_args_list] == [
+        (frame, channel) for frame in (100, 101, 102) for channel in (0, 2, 4, 6)
+    ]
+
+
+def test_schedule_steps_pattern_follows_channel_volumes(scheduling_sampler, mocker):
+    schedule = mocker.patch.object(scheduling_sampler.mixer, "schedule")
+
+    scheduling_sampler.schedule_steps(0, 0, 1)
+    scheduling_sampler.bank[0].volume = -6
+    scheduling_sampler.schedule_steps(0, 1, 2)
+
+    gains = [call.args[4] for call in schedule.call_args_list if call.args[1] == 0]
+    assert gains == [1.0, Channel.db_to_percent(-6)]
+
+
+def test_schedule_steps_wraps_pattern(scheduling_sampler, mocker):
+    schedule = mocker.patch.object(scheduling_sampler.mixer, "schedule")
+
+    next_step = scheduling_sampler.schedule_steps(0, DEFAULT_STEP_COUNT - 1, 21)
+
+    assert next_step == DEFAULT_STEP_COUNT + 1
+    assert {call.args[0] for call in schedule.call_args_list} == {19, 20}
+
+
+def test_loop_schedules_ahead_of_mixer(
+    scheduling_sampler, mock_clock_is_running, mocker
+):
+    mocker.patch(
+        "octo_slample.sampler.channel.Channel.sample",
+        new_callable=mocker.PropertyMock,
+        return_value=np.ones(2, dtype=np.int16),
+    )
+    mixer = scheduling_sampler.mixer
+    schedule = mocker.spy(mixer, "schedule")
+    # each wait lets the audio callback mix one block
+    mocker.patch(
+        "octo_slample.sampler.looping_sampler.time.sleep",
+        side_effect=lambda seconds: mixer.mix(4),
+    )
+
+    scheduling_sampler.clock.start()
+    scheduling_sampler.loop()
+
+    mixer.start.assert_called_once()
+    frames = sorted({call.args[0] for call in schedule.call_args_list})
+    # step 0 starts one block out, at frame 4.  The last window, scheduled
+    # after 3 blocks were mixed, ends 4 steps past frame 16, at frame 21.
+    assert frames[0] == 4
+    assert frames[-1] == 20
+    assert mixer.scheduled_count == 0
+
+
+def test_play_pattern_records_dispatch(
+    pattern, mock_sampler_trigger_channel, mock_clock_beat
+) -> None:
+    stats = LoopStats()
+    looping_sampler = LoopingSampler(pattern=pattern, lookahead_steps=0, stats=stats)
+
+    looping_sampler._play_pattern()
+
+    assert looping_sampler.clock._lateness is stats.lateness
+    assert len(stats.dispatch) == DEFAULT_STEP_COUNT
+
+
+def test_schedule_steps_records_lateness(scheduling_sampler, mocker):
+    mocker.patch.object(scheduling_sampler.mixer, "schedule")
+    scheduling_sampler._stats = LoopStats()
+    scheduling_sampler.mixer.mix(4)
+
+    scheduling_sampler.schedule_steps(0, 0, 8)
+
+    # steps 0-2 are scheduled after frames 0, 1 and 2 were mixed
+    lateness = scheduling_sampler.stats.lateness
+    assert len(lateness) == 6
+    assert lateness.max == LoopStats.frames_to_ns(4, 10)
+
+
+def test_compile_timeline(song) -> None:
+    assert LoopingSampler.compile_timeline(song.sections, 8) == Timeline(
+        ((0, 0, VERSE_GAIN), (4, 0, VERSE_GAIN), (9, 1, 1.0), (9, 3, 1.0)), 12
+    )
+    assert LoopingSampler.compile_timeline(song.sections, 2) == Timeline(
+        ((0, 0, VERSE_GAIN), (4, 0, VERSE_GAIN), (9, 1, 1.0)), 12
+    )
+
+
+def test_compile_timeline_compiles_each_pattern_once(song, mocker) -> None:
+    compile_trigger_table = mocker.spy(LoopingSampler, "compile_trigger_table")
+
+    LoopingSampler.compile_timeline(song.sections, 8)
+
+    assert compile_trigger_table.call_count == 2
+
+
+def test_song_set_replaces_pattern(looping_sampler, pattern, song) -> None:
+    looping_sampler.pattern = pattern
+    looping_sampler.song = song
+
+    assert looping_sampler.song is song
+    assert looping_sampler.pattern is None
+    assert looping_sampler.timeline.step_count == len(song)
+
+
+def test_pattern_set_replaces_song(looping_sampler, pattern, song) -> None:
+    looping_sampler.song = song
+    looping_sampler.pattern = pattern
+
+    assert looping_sampler.song is None
+    assert looping_sampler.timeline.step_count == DEFAULT_STEP_COUNT
+
+
+def test_song_set_without_sections_fails(looping_sampler) -> None:
+    with pytest.raises(AssertionError):
+        looping_sampler.song = Song()
+
+
+def test_play_pattern_song(
+    looping_sampler, song, mock_sampler_trigger_channel, mock_clock_beat
+) -> None:
+    looping_sampler.song = song
+
+    looping_sampler._play_pattern()
+
+    assert [call.args for call in mock_sampler_trigger_channel.call_args_list] == [
+        (0, VERSE_GAIN),
+        (0, VERSE_GAIN),
+        (1, 1.0),
+        (3, 1.0),
+    ]
+    assert mock_clock_beat.call_count == len(song)
+
+
+def test_loop_song_keeps_bank_volumes(clocked_sampler, mock_play_pattern, song) -> None:
+    clocked_sampler.song = song
+    clocked_sampler.clock.stop()
+    clocked_sampler.loop()
+
+    assert clocked_sampler.bank.channel_volumes == [0] * DEFAULT_CHANNEL_COUNT
+
+
+def test_schedule_steps_song_wraps(scheduling_sampler, song, mocker):
+    schedule = mocker.patch.object(scheduling_sampler.mixer, "schedule")
+    scheduling_sampler.song = song
+
+    # steps 8-16 start at frames 10 to 20; step 17 starts at 21.25
+    next_step = scheduling_sampler.schedule_steps(0, 8, 21)
+
+    assert next_step == 17
+    assert [call.args[:2] for call in schedule.call_args_list] == [
+        (11, 1),
+        (11, 3),
+        (15, 0),
+        (20, 0),
+    ]
+    # each section plays at its own pattern's volumes
+    assert [call.args[4] for call in schedule.call_args_list] == [
+        1.0,
+        1.0,
+        VERSE_GAIN,
+        VERSE_GAIN,
+    ]
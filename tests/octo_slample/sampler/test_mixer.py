@@ -0,0 +1,258 @@
+import numpy as np
+import pytest
+
+from octo_slample.sampler.mixer import INT16_MAX, OUTPUT_CHANNEL_COUNT, Mixer
+
+
+@pytest.fixture
+def mixer():
+    return Mixer(block_size=4)
+
+
+@pytest.fixture
+def mono_sample():
+    return np.array([1, 2, 3, 4, 5, 6], dtype=np.int16)
+
+
+@pytest.fixture
+def stereo_sample():
+    return np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+
+
+@pytest.fixture
+def mock_output_stream(mocker):
+    sounddevice = mocker.MagicMock()
+    mocker.patch.dict("sys.modules", {"sounddevice": sounddevice})
+
+    return sounddevice.OutputStream
+
+
+def test_mixer_init(mixer):
+    assert mixer.voice_count == 0
+    assert mixer.max_polyphony == 32
+    assert not mixer.is_running
+
+
+def test_trigger_is_bounded_by_max_polyphony(mono_sample):
+    mixer = Mixer(block_size=4, max_polyphony=2)
+
+    for _ in range(0, 10):
+        mixer.trigger(0, mono_sample)
+
+    assert mixer.voice_count == 2
+    assert np.array_equal(mixer.mix(4)[:, 0], mono_sample[:4] * 2)
+
+
+def test_trigger_chokes_voices(mixer, mono_sample, stereo_sample):
+    mixer.trigger(5, mono_sample, choke_group=1)
+    mixer.trigger(4, stereo_sample, choke_group=1)
+
+    block = mixer.mix(4)
+
+    assert mixer.voice_count == 0
+    assert np.array_equal(block, np.pad(stereo_sample, ((0, 1), (0, 0))))
+
+
+def test_mix_silence(mixer):
+    block = mixer.mix(4)
+
+    assert block.shape == (4, OUTPUT_CHANNEL_COUNT)
+    assert block.dtype == np.int16
+    assert not block.any()
+
+
+def test_trigger_none_is_ignored(mixer):
+    mixer.trigger(0, None)
+
+    assert mixer.voice_count == 0
+
+
+def test_mix_mono_sample_plays_on_both_outputs(mixer, mono_sample):
+    mixer.trigger(0, mono_sample)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], mono_sample[:4])
+    assert np.array_equal(block[:, 1], mono_sample[:4])
+
+
+def test_mix_removes_finished_voices(mixer, mono_sample):
+    mixer.trigger(0, mono_sample)
+
+    mixer.mix(4)
+    assert mixer.voice_count == 1
+
+    block = mixer.mix(4)
+    assert mixer.voice_count == 0
+    assert np.array_equal(block[:, 0], [5, 6, 0, 0])
+
+
+def test_mix_sums_voices(mixer, mono_sample, stereo_sample):
+    mixer.trigger(0, mono_sample)
+    mixer.trigger(1, stereo_sample)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], [2, 4, 6, 4])
+    assert np.array_equal(block[:, 1], [0, 0, 0, 4])
+
+
+def test_mix_applies_gain(mixer, mono_sample):
+    mixer.trigger(0, mono_sample * 100, gain=0.5)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], mono_sample[:4] * 50)
+
+
+def test_mix_gain_is_per_voice(mixer, mono_sample):
+    mixer.trigger(0, mono_sample, gain=2.0)
+    mixer.trigger(1, mono_sample)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], mono_sample[:4] * 3)
+
+
+def test_mix_clips(mixer):
+    loud = np.full(4, INT16_MAX, dtype=np.int16)
+    mixer.trigger(0, loud)
+    mixer.trigger(1, loud)
+
+    block = mixer.mix(4)
+
+    assert (block == INT16_MAX).all()
+
+
+def test_mix_resizes_block(mixer, mono_sample):
+    mixer.trigger(0, mono_sample)
+
+    block = mixer.mix(6)
+
+    assert block.shape == (6, OUTPUT_CHANNEL_COUNT)
+    assert np.array_equal(block[:, 0], mono_sample)
+
+
+def test_start_opens_one_stream(mixer, mock_output_stream):
+    mixer.start()
+    mixer.start()
+
+    assert mixer.is_running
+    mock_output_stream.assert_called_once()
+    mock_output_stream.return_value.start.assert_called_once()
+
+
+def test_stop_closes_stream(mixer, mock_output_stream):
+    mixer.start()
+    mixer.stop()
+    mixer.stop()
+
+    assert not mixer.is_running
+    mock_output_stream.return_value.stop.assert_called_once()
+    mock_output_stream.return_value.close.assert_called_once()
+
+
+def test_callback_fills_outdata(mixer, mono_sample):
+    outdata = np.zeros((4, OUTPUT_CHANNEL_COUNT), dtype=np.int16)
+    mixer.trigger(0, mono_sample)
+
+    mixer._callback(outdata, 4, None, None)
+
+    assert np.array_equal(outdata[:, 0], mono_sample[:4])
+
+
+def test_mix_advances_frame_position(mixer):
+    mixer.mix(4)
+    mixer.mix(3)
+
+    assert mixer.frame_position == 7
+
+
+def test_schedule_starts_sample_at_frame(mixer, mono_sample):
+    mixer.schedule(6, 0, mono_sample)
+
+    first = mixer.mix(4)
+    second = mixer.mix(4)
+
+    assert not first.any()
+    assert np.array_equal(second[:, 0], [0, 0, 1, 2])
+    assert mixer.scheduled_count == 0
+
+
+def test_schedule_chokes_at_frame(mixer, mono_sample, stereo_sample):
+    mixer.trigger(0, mono_sample, choke_group=1)
+    mixer.schedule(2, 1, stereo_sample, choke_group=1)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], [1, 2, 1, 2])
+    assert np.array_equal(block[:, 1], [1, 2, -1, -2])
+
+
+def test_schedule_late_sample_starts_at_next_block(mixer, mono_sample):
+    mixer.mix(4)
+    mixer.schedule(1, 0, mono_sample, gain=2.0)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], mono_sample[:4] * 2)
+
+
+def test_schedule_orders_samples_by_frame(mixer, mono_sample):
+    mixer.schedule(3, 0, mono_sample)
+    mixer.schedule(1, 1, mono_sample)
+
+    block = mixer.mix(4)
+
+    assert np.array_equal(block[:, 0], [0, 1, 2, 4])
+
+
+def test_cancel_scheduled(mixer, mono_sample):
+    mixer.schedule(2, 0, mono_sample)
+    mixer.schedule(2, 0, None)
+
+    mixer.cancel_scheduled()
+
+    assert mixer.scheduled_count == 0
+    assert not mixer.mix(4).any()
+
+
+@pytest.mark.parametrize("sample_rate", [22050, 48000])
+def test_trigger_resamples_to_output_rate(sample_rate):
+    mixer = Mixer(block_size=1024)
+    # a 10 ms tone plays for 10 ms, at its own pitch, at any sample rate
+    t = np.arange(0, sample_rate // 100) / sample_rate
+    sample = (10000 * np.sin(2 * np.pi * 1000 * t)).astype(np.int16)
+
+    mixer.trigger(0, sample, sample_rate=sample_rate)
+    block = mixer.mix(1024)
+
+    expected = 10000 * np.sin(2 * np.pi * 1000 * np.arange(0, 441) / 44100)
+    assert not block[441:].any()
+    assert np.abs(block[20:420, 0] - expected[20:420]).max() < 200
+
+
+def test_schedule_resamples_to_output_rate(mixer):
+    mixer.schedule(0, 0, np.full(50, 1000, dtype=np.int16), sample_rate=22050)
+
+    block = mixer.mix(128)
+
+    assert np.count_nonzero(block[:, 0]) == 100
+
+
+def test_prepare_upsamples_full_scale_samples_without_wrapping(mixer):
+    loud = np.array([32767, -32768] * 4, dtype=np.int16)
+
+    resampled = mixer.prepare(loud, 22050)
+
+    assert resampled.dtype == np.int16
+    assert np.abs(resampled[1:-2:2, 0].astype(int)).max() <= 1
+
+
+def test_prepare_caches_resampled_buffers(mixer, mono_sample):
+    resampled = mixer.prepare(mono_sample, 22050)
+
+    assert len(resampled) == 2 * len(mono_sample)
+    assert mixer.prepare(mono_sample, 22050) is resampled
+    assert mixer.prepare(mono_sample.copy(), 22050) is not resampled
+    assert np.shares_memory(mixer.prepare(mono_sample, 44100), mono_sample)
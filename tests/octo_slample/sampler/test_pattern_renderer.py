@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from octo_slample.constants import DEFAULT_SAMPLE_RATE
+from octo_slample.pattern.text_pattern import TextPattern
+from octo_slample.sampler.mixer import OUTPUT_CHANNEL_COUNT
+from octo_slample.sampler.pattern_renderer import PatternRenderer
+from octo_slample.sampler.sample_bank import SampleBank
+
+FRAMES_PER_STEP_AT_120_BPM = DEFAULT_SAMPLE_RATE * 60 / (120 * 4)
+
+
+@pytest.fixture
+def click_sample():
+    return np.array([1000, 500, 250, 125], dtype=np.int16)
+
+
+@pytest.fixture
+def bank(tmp_path, click_sample):
+    path = tmp_path / "click.wav"
+    sf.write(path, click_sample, DEFAULT_SAMPLE_RATE, subtype="PCM_16")
+
+    b = SampleBank()
+    b[0].sample = str(path)
+    b[1].sample = str(path)
+
+    return b
+
+
+@pytest.fixture
+def pattern():
+    p = TextPattern()
+    p.pattern = ["x   x   x   x   ", "  x             "]
+
+    return p
+
+
+@pytest.fixture
+def renderer(pattern, bank):
+    return PatternRenderer(pattern, bank, bpm=120)
+
+
+def test_frames_per_step(renderer):
+    assert renderer.frames_per_step == FRAMES_PER_STEP_AT_120_BPM
+
+
+def test_step_offsets_do_not_drift():
+    renderer = PatternRenderer(TextPattern(), SampleBank(), bpm=123)
+
+    offsets = renderer.step_offsets(100_000)
+
+    assert offsets[0] == 0
+    assert offsets[-1] == round(99_999 * renderer.frames_per_step)
+
+
+def test_render_places_hits_at_step_offsets(renderer, click_sample):
+    audio = renderer.render()
+
+    assert audio.dtype == np.int16
+    assert audio.shape == (16 * FRAMES_PER_STEP_AT_120_BPM, OUTPUT_CHANNEL_COUNT)
+
+    for step in [0, 4, 8, 12]:
+        offset = int(step * FRAMES_PER_STEP_AT_120_BPM)
+        assert np.array_equal(audio[offset : offset + 4, 0], click_sample)
+
+    offset = int(2 * FRAMES_PER_STEP_AT_120_BPM)
+    assert np.array_equal(audio[offset : offset + 4, 1], click_sample)
+    assert np.count_nonzero(audio[:, 0]) == 5 * len(click_sample)
+
+
+def test_render_bars_repeats_pattern(renderer):
+    audio = renderer.render(bars=4)
+
+    assert len(audio) == 64 * FRAMES_PER_STEP_AT_120_BPM
+    assert np.count_nonzero(audio[:, 0]) == 4 * 5 * 4
+
+
+def test_render_extends_output_for_tails(bank, tmp_path):
+    tail = tmp_path / "tail.wav"
+    sf.write(tail, np.ones(DEFAULT_SAMPLE_RATE, dtype=np.int16), DEFAULT_SAMPLE_RATE)
+    bank[0].sample = str(tail)
+    pattern = TextPattern(step_count=1)
+    pattern.pattern = ["x"]
+    renderer = PatternRenderer(pattern, bank, bpm=120)
+
+    audio = renderer.render()
+
+    assert len(audio) == DEFAULT_SAMPLE_RATE
+
+
+def test_render_applies_pattern_volumes(renderer, pattern, bank, click_sample):
+    pattern.channel_volumes = [-3.0] + [0] * 7
+
+    audio = renderer.render()
+
+    assert bank[0].volume == -3.0
+    assert np.array_equal(audio[:4, 0], (click_sample * 0.501).astype(np.int16))
+    assert np.array_equal(bank[0].sample, click_sample)
+
+
+def test_render_sums_and_clips_hits(bank, tmp_path):
+    loud = tmp_path / "loud.wav"
+    sf.write(loud, np.full(4, 30000, dtype=np.int16), DEFAULT_SAMPLE_RATE)
+    bank[0].sample = str(loud)
+    bank[1].sample = str(loud)
+    pattern = TextPattern()
+    pattern.pattern = ["x", "x"]
+
+    audio = PatternRenderer(pattern, bank).render()
+
+    assert (audio[:4] == 32767).all()
+
+
+def test_write(renderer, tmp_path):
+    output = tmp_path / "bounce" / "pattern.wav"
+
+    path = renderer.write(output, bars=2)
+
+    assert path == str(output)
+    info = sf.info(path)
+    assert info.samplerate == DEFAULT_SAMPLE_RATE
+    assert info.subtype == "PCM_16"
+    assert info.channels == OUTPUT_CHANNEL_COUNT
+    assert info.frames == 32 * FRAMES_PER_STEP_AT_120_BPM
+
+
+@pytest.mark.parametrize("sample_rate", [22050, 48000])
+def test_render_resamples_samples_to_output_rate(tmp_path, sample_rate):
+    # a 10 ms tone renders as 10 ms, at its own pitch, at any sample rate
+    t = np.arange(0, sample_rate // 100) / sample_rate
+    path = tmp_path / "tone.wav"
+    sf.write(path, np.sin(2 * np.pi * 1000 * t) * 0.3, sample_rate, subtype="PCM_16")
+    bank = SampleBank()
+    bank[0].sample = str(path)
+    pattern = TextPattern()
+    pattern.pattern = ["x"]
+
+    audio = PatternRenderer(pattern, bank).render()
+
+    t = np.arange(0, DEFAULT_SAMPLE_RATE // 100) / DEFAULT_SAMPLE_RATE
+    expected = 0.3 * 32768 * np.sin(2 * np.pi * 1000 * t)
+    assert not audio[len(t) : int(FRAMES_PER_STEP_AT_120_BPM)].any()
+    assert np.abs(audio[20 : len(t) - 20, 0] - expected[20:-20]).max() < 200
+
+
+def test_render_upsamples_full_scale_samples_without_wrapping(tmp_path):
+    path = tmp_path / "loud.wav"
+    loud = np.array([20000, -20000] * 8, dtype=np.int16)
+    sf.write(path, loud, 22050, subtype="PCM_16")
+    bank = SampleBank()
+    bank[0].sample = str(path)
+    pattern = TextPattern()
+    pattern.pattern = ["x"]
+
+    audio = PatternRenderer(pattern, bank).render()
+
+    assert np.abs(audio[:30, 0]).max() <= 20000
+    assert np.abs(audio[1:29:2, 0]).max() < 1
+
+
+def test_write_at_renderer_sample_rate(pattern, bank, tmp_path):
+    renderer = PatternRenderer(pattern, bank, sample_rate=48000)
+
+    path = renderer.write(tmp_path / "pattern.wav")
+
+    info = sf.info(path)
+    assert info.samplerate == 48000
+    assert info.frames == round(16 * 48000 * 60 / (120 * 4))
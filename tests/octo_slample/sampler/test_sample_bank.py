@@ -77,6 +77,31 @@ def test_sample_bank_set_samples(sample_bank, mock_channel):
         mock_channel.assert_called_with(SAMPLE_DICT["path"])
 
 
+def test_sample_bank_set_samples_choke_group(sample_bank, mock_channel):
+    samples = [SAMPLE_DICT] * (DEFAULT_CHANNEL_COUNT - 1) + [
+        {"path": SAMPLE, "choke": 1}
+    ]
+
+    sample_bank.samples = samples
+
+    assert [channel.choke_group for channel in sample_bank._channels] == [None] * (
+        DEFAULT_CHANNEL_COUNT - 1
+    ) + [1]
+
+
+def test_sample_bank_set_samples_info(sample_bank, mock_channel):
+    info = {"frames": 100, "sample_rate": 44100}
+    samples = [SAMPLE_DICT] * (DEFAULT_CHANNEL_COUNT - 1) + [
+        {"path": SAMPLE, "info": info}
+    ]
+
+    sample_bank.samples = samples
+
+    assert [channel.info for channel in sample_bank._channels] == [None] * (
+        DEFAULT_CHANNEL_COUNT - 1
+    ) + [info]
+
+
 @pytest.mark.parametrize(
     "channel_number, exception",
     [
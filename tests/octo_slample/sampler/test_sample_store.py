@@ -0,0 +1,131 @@
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from octo_slample.sampler.sample_store import SampleStore
+
+
+@pytest.fixture
+def store():
+    return SampleStore()
+
+
+@pytest.fixture
+def audio_data():
+    return np.array([0, 100, -100, 200, -200], dtype=np.int16)
+
+
+@pytest.fixture
+def kick_path(tmp_path, audio_data):
+    path = tmp_path / "kick.wav"
+    sf.write(path, audio_data, 44100, subtype="PCM_16")
+
+    return path
+
+
+@pytest.fixture
+def flac_path(tmp_path, audio_data):
+    path = tmp_path / "kick.flac"
+    sf.write(path, audio_data, 48000)
+
+    return path
+
+
+def test_load(store, kick_path, audio_data):
+    sample, sample_rate = store.load(kick_path)
+
+    assert np.array_equal(sample, audio_data)
+    assert sample_rate == 44100
+    assert store.misses == 1
+    assert store.hits == 0
+    assert len(store) == 1
+
+
+def test_load_decodes_non_pcm_16_files(store, flac_path, audio_data):
+    sample, sample_rate = store.load(flac_path)
+
+    assert not isinstance(sample, np.memmap)
+    assert np.array_equal(sample, audio_data)
+    assert sample_rate == 48000
+
+
+def test_load_same_path_is_shared(store, kick_path, mocker):
+    hash_file = mocker.spy(SampleStore, "hash_file")
+
+    first, _ = store.load(kick_path)
+    second, _ = store.load(kick_path)
+
+    assert first is second
+    assert store.hits == 1
+    # memory-mapped samples are not allocated, so sharing them saves nothing
+    assert store.bytes_saved == 0
+    hash_file.assert_called_once()
+
+
+def test_load_shared_decoded_sample_saves_bytes(store, flac_path):
+    first, _ = store.load(flac_path)
+    second, _ = store.load(flac_path)
+
+    assert first is second
+    assert store.bytes_saved == first.nbytes
+
+
+def test_load_identical_contents_are_shared(store, kick_path, tmp_path):
+    copy = tmp_path / "copy" / "kick.wav"
+    copy.parent.mkdir()
+    copy.write_bytes(kick_path.read_bytes())
+
+    first, _ = store.load(kick_path)
+    second, _ = store.load(copy)
+
+    assert first is second
+    assert store.misses == 1
+    assert store.hits == 1
+    assert len(store) == 1
+
+
+def test_load_modified_file_is_reloaded(store, kick_path, audio_data):
+    first, _ = store.load(kick_path)
+    del first
+
+    mtime_ns = kick_path.stat().st_mtime_ns
+    sf.write(kick_path, audio_data * 2, 44100, subtype="PCM_16")
+    os.utime(kick_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    second, _ = store.load(kick_path)
+
+    assert np.array_equal(second, audio_data * 2)
+    assert store.misses == 2
+
+
+def test_samples_are_held_weakly(store, kick_path):
+    sample, _ = store.load(kick_path)
+    assert len(store) == 1
+    assert store.nbytes == sample.nbytes
+
+    del sample
+
+    assert len(store) == 0
+
+
+def test_freed_samples_are_forgotten(store, kick_path, flac_path):
+    kick, _ = store.load(kick_path)
+    flac, _ = store.load(flac_path)
+
+    del kick
+
+    assert list(store._sample_rates) == [SampleStore.hash_file(flac_path)]
+    assert [key[0] for key in store._digests] == [str(flac_path.resolve())]
+
+
+def test_clear(store, kick_path):
+    sample, _ = store.load(kick_path)
+    store.load(kick_path)
+
+    store.clear()
+
+    assert len(store) == 0
+    assert store.hits == 0
+    assert store.misses == 0
+    assert store.bytes_saved == 0
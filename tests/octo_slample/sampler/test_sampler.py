@@ -1,21 +1,23 @@
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
 import pytest
 
 from octo_slample.constants import DEFAULT_CHANNEL_COUNT
+from octo_slample.sampler.mixer import Mixer
 from octo_slample.sampler.sample_bank import SampleBank
 from octo_slample.sampler.sampler import Sampler
 
 
 @pytest.fixture
-def sampler(mock_threading_thread, mock_bank___getitem__):
-    return Sampler()
+def sampler(mock_mixer, mock_bank___getitem__):
+    return Sampler(mixer=mock_mixer)
 
 
 @pytest.fixture
-def mock_threading_thread(mocker):
-    m = mocker.patch("octo_slample.sampler.sampler.threading.Thread")
-    m.return_value = m
+def mock_mixer(mocker):
+    m = mocker.MagicMock(spec=Mixer)
+    m.is_running = False
 
     return m
 
@@ -31,6 +33,19 @@ def test_sampler(sampler):
     assert isinstance(sampler._bank, SampleBank)
 
 
+def test_sampler_default_mixer():
+    sampler = Sampler()
+
+    assert isinstance(sampler.mixer, Mixer)
+    assert not sampler.mixer.is_running
+
+
+def test_sampler_max_polyphony():
+    sampler = Sampler(max_polyphony=4)
+
+    assert sampler.mixer.max_polyphony == 4
+
+
 def test_sampler_bank_get(sampler):
     assert sampler.bank is not None
     assert isinstance(sampler.bank, SampleBank)
@@ -54,13 +69,34 @@ def test_sampler_bank_set(sampler):
     ],
     ids=["negative", "too high", "none", "valid"],
 )
-def test_play_channel(
-    sampler, mock_threading_thread, mock_bank___getitem__, channel, exception
-):
+def test_play_channel(sampler, mock_mixer, mock_bank___getitem__, channel, exception):
     with exception:
         sampler.play_channel(channel)
 
-        mock_threading_thread.assert_called_once_with(
-            target=mock_bank___getitem__(channel).play
+        mock_mixer.start.assert_called_once()
+        mock_mixer.trigger.assert_called_once_with(
+            channel,
+            mock_bank___getitem__(channel).sample,
+            mock_bank___getitem__(channel).choke_group,
+            mock_bank___getitem__(channel).gain,
+            mock_bank___getitem__(channel).sample_rate,
         )
-        mock_threading_thread.start.assert_called_once()
+
+
+def test_play_channel_does_not_restart_running_mixer(sampler, mock_mixer):
+    mock_mixer.is_running = True
+
+    sampler.play_channel(0)
+
+    mock_mixer.start.assert_not_called()
+    mock_mixer.trigger.assert_called_once()
+
+
+def test_play_channel_resamples_channel_sample(mocker):
+    mocker.patch("octo_slample.sampler.mixer.Mixer.start")
+    sampler = Sampler(mixer=Mixer())
+    sampler.bank[0].set_sample_data(np.full(100, 1000, dtype=np.int16), 22050)
+
+    sampler.play_channel(0)
+
+    assert np.count_nonzero(sampler.mixer.mix(512)[:, 0]) == 200
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from octo_slample.sampler.voice_pool import DEFAULT_MAX_POLYPHONY, Voice, VoicePool
+
+OPEN_HAT = 5
+CLOSED_HAT = 4
+HAT_CHOKE_GROUP = 1
+
+
+@pytest.fixture
+def buffer():
+    return np.zeros((4, 1), dtype=np.int16)
+
+
+@pytest.fixture
+def pool():
+    return VoicePool(max_polyphony=4)
+
+
+def test_voice_is_idle_by_default():
+    voice = Voice()
+
+    assert not voice.is_active
+    assert voice.is_finished
+
+
+def test_voice_start_and_release(buffer):
+    voice = Voice()
+
+    voice.start(0, buffer, None, 1, gain=0.5)
+    assert voice.is_active
+    assert not voice.is_finished
+    assert voice.gain == 0.5
+
+    voice.release()
+    assert not voice.is_active
+    assert voice.buffer is None
+    assert voice.gain == 1.0
+
+
+def test_pool_default_size():
+    assert len(VoicePool()) == DEFAULT_MAX_POLYPHONY
+
+
+@pytest.mark.parametrize("max_polyphony", [0, -1, None], ids=["zero", "neg", "none"])
+def test_pool_invalid_size(max_polyphony):
+    with pytest.raises(AssertionError):
+        VoicePool(max_polyphony)
+
+
+def test_allocate(pool, buffer):
+    voice = pool.allocate(0, buffer)
+
+    assert voice.is_active
+    assert voice.channel == 0
+    assert pool.active_count == 1
+    assert list(pool.active()) == [voice]
+
+
+def test_allocate_reuses_preallocated_voices(pool, buffer):
+    voices = set(id(v) for v in pool._voices)
+
+    for _ in range(0, 20):
+        voice = pool.allocate(0, buffer)
+        assert id(voice) in voices
+
+
+def test_allocate_steals_oldest_voice(pool, buffer):
+    voices = [pool.allocate(channel, buffer) for channel in range(0, 4)]
+
+    stolen = pool.allocate(7, buffer)
+
+    assert stolen is voices[0]
+    assert stolen.channel == 7
+    assert pool.active_count == 4
+
+    assert pool.allocate(6, buffer) is voices[1]
+
+
+def test_allocate_chokes_voices_in_the_same_group(pool, buffer):
+    open_hat = pool.allocate(OPEN_HAT, buffer, HAT_CHOKE_GROUP)
+    kick = pool.allocate(0, buffer)
+
+    closed_hat = pool.allocate(CLOSED_HAT, buffer, HAT_CHOKE_GROUP)
+
+    assert kick.is_active
+    assert closed_hat.is_active
+    assert open_hat is closed_hat or not open_hat.is_active
+    assert pool.active_count == 2
+    assert sorted(voice.channel for voice in pool.active()) == [0, CLOSED_HAT]
+
+
+def test_release_finished(pool, buffer):
+    finished = pool.allocate(0, buffer)
+    playing = pool.allocate(1, buffer)
+    finished.position = len(buffer)
+
+    pool.release_finished()
+
+    assert not finished.is_active
+    assert playing.is_active
@@ -1,6 +1,18 @@
+import json
+import os
+
+import numpy as np
 import pytest
+import soundfile as sf
+from schema import SchemaError
 
 from octo_slample.bank_exporter import BankExporter
+from octo_slample.bank_initializer import BankInitializer
+from octo_slample.export_manifest import ExportManifest
+from octo_slample.sampler.json_sample_bank import JsonSampleBank
+from octo_slample.wav_writer import WavWriter
+
+EMPTY_BANK = {"name": "empty", "samples": [{"path": None}] * 8}
 
 
 @pytest.fixture
@@ -10,17 +22,20 @@ def banks(tmp_path):
     (input_banks / "bank_1").mkdir()
     (input_banks / "bank_2").mkdir()
     (input_banks / "bank_1" / "sample.wav").touch()
-    (input_banks / "bank_1" / "bank.json").touch()
+    (input_banks / "bank_1" / "bank.json").write_text(json.dumps(EMPTY_BANK))
     (input_banks / "bank_2" / "sample.wav").touch()
-    (input_banks / "bank_2" / "bank.json").touch()
+    (input_banks / "bank_2" / "bank.json").write_text(json.dumps(EMPTY_BANK))
 
     return input_banks
 
 
 @pytest.fixture
 def mock_export_bank(mocker):
-    m = mocker.patch("octo_slample.bank_exporter.BankExporter.export_bank")
-    m.side_effect = [["squid/bank_1"], ["squid/bank_2"]]
+    m = mocker.patch("octo_slample.bank_exporter.BankExporter.export_bank_incremental")
+    m.side_effect = [
+        ("squid/bank_1", ["chan-001.wav"], {}),
+        ("squid/bank_2", ["chan-001.wav"], {}),
+    ]
 
     return m
 
@@ -55,7 +70,215 @@ def test_bank_exporter_export_set(banks, tmp_path, mock_export_bank):
 
     assert mock_export_bank.call_count == 2
 
-    assert result == [["squid/bank_1"], ["squid/bank_2"]]
+    assert result == [
+        ("squid/bank_1", ["chan-001.wav"]),
+        ("squid/bank_2", ["chan-001.wav"]),
+    ]
+
+
+@pytest.fixture
+def real_banks(tmp_path):
+    input_banks = tmp_path / "real_banks"
+
+    for name in ["b_hats", "a_kicks", "c_snares"]:
+        (input_banks / name).mkdir(parents=True)
+        for channel in range(1, 9):
+            sf.write(
+                input_banks / name / f"sample_{channel}.wav",
+                np.zeros(16, dtype=np.int16),
+                44100,
+                subtype="PCM_16",
+            )
+        BankInitializer.init(input_banks / name)
+
+    return input_banks
+
+
+def test_bank_exporter_export_set_numbers_banks_in_sorted_order(
+    banks, tmp_path, mock_export_bank
+):
+    BankExporter.export_set(banks, tmp_path / "squid")
+
+    assert [call.args[:2] for call in mock_export_bank.call_args_list] == [
+        (banks / "bank_1" / "bank.json", 1),
+        (banks / "bank_2" / "bank.json", 2),
+    ]
+
+
+def test_bank_exporter_export_set_lists_each_directory_once(
+    banks, tmp_path, mock_export_bank, mocker
+):
+    scandir = mocker.spy(os, "scandir")
+
+    BankExporter.export_set(banks, tmp_path / "squid")
+
+    # the set directory and each bank directory
+    assert scandir.call_count == 3
+
+
+def test_bank_exporter_export_set_ignores_directories_without_bank_files(
+    banks, tmp_path, mock_export_bank
+):
+    (banks / "bank_0" / "nested").mkdir(parents=True)
+
+    BankExporter.export_set(banks, tmp_path / "squid")
+
+    assert [call.args[:2] for call in mock_export_bank.call_args_list] == [
+        (banks / "bank_1" / "bank.json", 1),
+        (banks / "bank_2" / "bank.json", 2),
+    ]
+
+
+def test_bank_exporter_export_set_isolates_errors(banks, tmp_path, mock_export_bank):
+    error = ValueError("bad bank")
+    mock_export_bank.side_effect = [error, ("squid/bank_2", [], {})]
+
+    result = BankExporter.export_set(banks, tmp_path / "squid")
+
+    assert result == [error, ("squid/bank_2", [])]
+
+
+def test_bank_exporter_export_set_loads_banks_once(
+    banks, tmp_path, mock_export_bank, mocker
+):
+    from_files = mocker.spy(JsonSampleBank, "from_files")
+
+    BankExporter.export_set(banks, tmp_path / "squid")
+
+    assert from_files.call_count == 1
+    assert [call.args[4].name for call in mock_export_bank.call_args_list] == [
+        "empty",
+        "empty",
+    ]
+
+
+def test_bank_exporter_export_set_reports_banks_that_fail_to_load(
+    banks, tmp_path, mock_export_bank
+):
+    (banks / "bank_1" / "bank.json").write_text("{}")
+
+    result = BankExporter.export_set(banks, tmp_path / "squid")
+
+    assert isinstance(result[0], SchemaError)
+    assert result[1] == ("squid/bank_1", ["chan-001.wav"])
+    assert mock_export_bank.call_count == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bank_exporter_export_set_jobs(real_banks, tmp_path, jobs):
+    (real_banks / "d_broken").mkdir()
+    (real_banks / "d_broken" / "bank.json").write_text("{}")
+
+    result = BankExporter.export_set(real_banks, tmp_path / "squid", jobs=jobs)
+
+    assert [r[0] for r in result[:3]] == [
+        str(tmp_path / "squid" / f"Bank {n}") for n in [1, 2, 3]
+    ]
+    assert (tmp_path / "squid" / "Bank 1" / "chan-001.wav").exists()
+    assert "a_kicks" in (tmp_path / "squid" / "Bank 1" / "info.txt").read_text()
+    assert "c_snares" in (tmp_path / "squid" / "Bank 3" / "info.txt").read_text()
+    assert isinstance(result[3], Exception)
+
+
+def test_bank_exporter_export_set_skips_unchanged_files(real_banks, tmp_path):
+    output = tmp_path / "squid"
+    BankExporter.export_set(real_banks, output)
+    written = {path: path.stat().st_mtime_ns for path in output.rglob("*.wav")}
+    info = (output / "Bank 2" / "info.txt").stat().st_mtime_ns
+
+    changed = real_banks / "b_hats" / "sample_3.wav"
+    mtime_ns = changed.stat().st_mtime_ns
+    sf.write(changed, np.ones(16, dtype=np.int16), 44100, subtype="PCM_16")
+    os.utime(changed, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    BankExporter.export_set(real_banks, output)
+
+    rewritten = [
+        path for path, mtime in written.items() if path.stat().st_mtime_ns != mtime
+    ]
+    assert rewritten == [output / "Bank 2" / "chan-003.wav"]
+    assert (output / "Bank 2" / "info.txt").stat().st_mtime_ns == info
+
+
+def test_bank_exporter_export_bank_incremental_rewrites_changed_settings(
+    real_banks, tmp_path
+):
+    bank_file = real_banks / "a_kicks" / "bank.json"
+    _, _, entry = BankExporter.export_bank_incremental(bank_file, 1, tmp_path)
+    written = {path: path.stat().st_mtime_ns for path in tmp_path.rglob("*.wav")}
+
+    bank = JsonSampleBank.from_file(bank_file)
+    bank[2].volume = -6
+    _, _, entry = BankExporter.export_bank_incremental(
+        bank_file, 1, tmp_path, entry, bank
+    )
+
+    rewritten = [
+        path for path, mtime in written.items() if path.stat().st_mtime_ns != mtime
+    ]
+    assert rewritten == [tmp_path / "Bank 1" / "chan-003.wav"]
+    assert entry["channels"]["2"]["settings"]["volume"] == -6
+
+
+def test_bank_exporter_export_bank_incremental_rewrites_on_new_converter(
+    real_banks, tmp_path, mocker
+):
+    bank_file = real_banks / "a_kicks" / "bank.json"
+    _, _, entry = BankExporter.export_bank_incremental(bank_file, 1, tmp_path)
+    write_channel = mocker.spy(WavWriter, "write_channel")
+
+    mocker.patch("octo_slample.bank_exporter.CONVERTER_VERSION", 2)
+    BankExporter.export_bank_incremental(bank_file, 1, tmp_path, entry)
+
+    assert write_channel.call_count == 8
+
+
+def test_bank_exporter_export_set_rewrites_modified_outputs(real_banks, tmp_path):
+    output = tmp_path / "squid"
+    BankExporter.export_set(real_banks, output)
+    expected = (output / "Bank 1" / "chan-001.wav").read_bytes()
+
+    (output / "Bank 1" / "chan-001.wav").write_bytes(b"corrupt")
+    BankExporter.export_set(real_banks, output)
+
+    assert (output / "Bank 1" / "chan-001.wav").read_bytes() == expected
+
+
+def test_bank_exporter_export_set_removes_stale_banks(real_banks, tmp_path):
+    output = tmp_path / "squid"
+    BankExporter.export_set(real_banks, output)
+
+    for path in (real_banks / "c_snares").iterdir():
+        path.unlink()
+    (real_banks / "c_snares").rmdir()
+    BankExporter.export_set(real_banks, output)
+
+    assert (output / "Bank 2").is_dir()
+    assert not (output / "Bank 3").exists()
+    assert set(ExportManifest.load(output).banks) == {"1", "2"}
+
+
+def test_bank_exporter_export_bank_incremental_removes_stale_channels(
+    real_banks, tmp_path
+):
+    bank_file = real_banks / "a_kicks" / "bank.json"
+    _, _, entry = BankExporter.export_bank_incremental(bank_file, 1, tmp_path)
+
+    bank_json = json.loads(bank_file.read_text())
+    bank_json["samples"][7] = {"name": "empty", "path": None}
+    bank_file.write_text(json.dumps(bank_json))
+
+    _, sample_paths, entry = BankExporter.export_bank_incremental(
+        bank_file, 1, tmp_path, entry
+    )
+
+    assert isinstance(sample_paths[7], ValueError)
+    assert not (tmp_path / "Bank 1" / "chan-008.wav").exists()
+    assert "7" not in entry["channels"]
+
+
+def test_bank_exporter_export_set_invalid_jobs_fails(banks, tmp_path):
+    with pytest.raises(AssertionError):
+        BankExporter.export_set(banks, tmp_path / "squid", jobs=0)
 
 
 def test_bank_exporter_export_bank(
@@ -1,7 +1,12 @@
+import struct
+
+import numpy as np
 import pytest
+import soundfile as sf
 
 from octo_slample.bank_initializer import BankInitializer
 from octo_slample.exception import BankExistsError
+from octo_slample.wav_reader import WavReader
 
 
 @pytest.fixture
@@ -88,6 +93,48 @@ def test_run_recursively(directory_with_subdirectories):
     assert (directory_with_subdirectories / "subdirectory2" / "bank.json").exists()
 
 
+def test_init_recursive_summary(directory_with_subdirectories):
+    (directory_with_subdirectories / "subdirectory1" / "bank.json").touch()
+    progress = []
+
+    summary = BankInitializer.init_recursive(
+        directory_with_subdirectories,
+        jobs=2,
+        progress=lambda completed, total: progress.append((completed, total)),
+    )
+
+    assert summary.directories_scanned == 3
+    assert summary.written == (directory_with_subdirectories / "subdirectory2",)
+    assert summary.skipped == (directory_with_subdirectories / "subdirectory1",)
+    assert summary.failed == ()
+    assert progress == [(1, 2), (2, 2)]
+
+
+def test_init_recursive_nested(tmp_path):
+    (tmp_path / "drums" / "kicks").mkdir(parents=True)
+    (tmp_path / "drums" / "kicks" / "kick.wav").touch()
+    (tmp_path / "drums" / "empty").mkdir()
+    (tmp_path / "pads").mkdir()
+    (tmp_path / "pads" / "pad.wav").touch()
+
+    summary = BankInitializer.init_recursive(tmp_path)
+
+    assert summary.written == (tmp_path / "drums" / "kicks", tmp_path / "pads")
+    assert not (tmp_path / "drums" / "bank.json").exists()
+    assert not (tmp_path / "drums" / "empty" / "bank.json").exists()
+
+
+def test_init_recursive_isolates_failures(directory_with_subdirectories, mocker):
+    write_bank_file = mocker.patch.object(BankInitializer, "write_bank_file")
+    write_bank_file.side_effect = [True, PermissionError("denied")]
+
+    summary = BankInitializer.init_recursive(directory_with_subdirectories, jobs=1)
+
+    assert len(summary.written) == 1
+    assert len(summary.failed) == 1
+    assert isinstance(summary.failed[0][1], PermissionError)
+
+
 def test_bank_initializer_to_bank_dict(directory_to_init):
     """Test the BankInitializer to_bank_dict method."""
     initializer = BankInitializer(directory_to_init)
@@ -108,6 +155,68 @@ def test_bank_initializer_to_bank_dict(directory_to_init):
     }
 
 
+def test_bank_initializer_to_bank_dict_probes_samples(tmp_path, mocker):
+    sf.write(tmp_path / "kick.wav", np.zeros((100, 2)), 48000, subtype="PCM_24")
+    read = mocker.spy(sf, "read")
+
+    bank = BankInitializer(tmp_path).to_bank_dict()
+
+    stat = (tmp_path / "kick.wav").stat()
+    assert bank["samples"] == [
+        {
+            "name": "kick",
+            "path": str((tmp_path / "kick.wav").resolve()),
+            "info": {
+                "frames": 100,
+                "sample_rate": 48000,
+                "channels": 2,
+                "subtype": "PCM_24",
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
+        }
+    ]
+    read.assert_not_called()
+
+
+def test_bank_initializer_probe_sample_reads_wav_headers(tmp_path, mocker):
+    sf.write(tmp_path / "kick.wav", np.zeros(100), 44100, subtype="FLOAT")
+    info = mocker.spy(sf, "info")
+
+    sample = BankInitializer.probe_sample(tmp_path / "kick.wav")
+
+    assert sample["frames"] == 100
+    assert sample["subtype"] == "FLOAT"
+    info.assert_not_called()
+
+
+def test_bank_initializer_probe_sample_other_formats(tmp_path):
+    sf.write(tmp_path / "kick.flac", np.zeros((100, 2)), 48000, subtype="PCM_16")
+
+    sample = BankInitializer.probe_sample(tmp_path / "kick.flac")
+
+    assert sample["frames"] == 100
+    assert sample["sample_rate"] == 48000
+    assert sample["channels"] == 2
+    assert sample["subtype"] == "PCM_16"
+
+
+def test_bank_initializer_probe_sample_unreadable(directory_to_init):
+    assert BankInitializer.probe_sample(directory_to_init / "sample1.wav") is None
+
+
+def test_bank_initializer_probe_sample_missing(tmp_path):
+    assert BankInitializer.probe_sample(tmp_path / "missing.wav") is None
+
+
+def test_bank_initializer_probe_sample_header_error(tmp_path, mocker):
+    path = tmp_path / "kick.wav"
+    sf.write(path, np.zeros(100), 44100, subtype="PCM_16")
+    mocker.patch.object(WavReader, "read_header", side_effect=struct.error)
+
+    assert BankInitializer.probe_sample(path) is None
+
+
 def test_bank_initializer_write_bank_file(directory_to_init):
     """Test the BankInitializer write_bank_file method."""
     initializer = BankInitializer(directory_to_init)
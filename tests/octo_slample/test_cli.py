@@ -1,14 +1,18 @@
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 from schema import SchemaError
 
 import octo_slample.cli as cli
+from octo_slample.bank_initializer import InitSummary
+from octo_slample.directory_walker import DEFAULT_MAX_WORKERS
 from octo_slample.exception import BankExistsError
 
 
 @pytest.fixture
 def mock_looping_sampler(mocker):
-    m = mocker.patch("octo_slample.cli.LoopingSampler")
+    m = mocker.patch("octo_slample.sampler.looping_sampler.LoopingSampler")
     m.clock = mocker.Mock()
     m.loop = mocker.Mock()
 
@@ -17,14 +21,22 @@ def mock_looping_sampler(mocker):
 
 @pytest.fixture
 def mock_json_pattern(mocker):
-    m = mocker.patch("octo_slample.cli.JsonPattern.from_file")
+    m = mocker.patch("octo_slample.pattern.json_pattern.JsonPattern.from_file")
 
     return m
 
 
 @pytest.fixture
 def mock_json_sample_bank(mocker):
-    m = mocker.patch("octo_slample.cli.JsonSampleBank.from_file")
+    m = mocker.patch("octo_slample.sampler.json_sample_bank.JsonSampleBank.from_file")
+
+    return m
+
+
+@pytest.fixture
+def mock_pattern_renderer(mocker):
+    m = mocker.patch("octo_slample.sampler.pattern_renderer.PatternRenderer")
+    m.return_value.write.return_value = "bounce.wav"
 
     return m
 
@@ -44,12 +56,12 @@ def mock_click_getchar(mocker):
 
 @pytest.fixture
 def mock_play_channel(mocker):
-    return mocker.patch("octo_slample.cli.Sampler.play_channel")
+    return mocker.patch("octo_slample.sampler.sampler.Sampler.play_channel")
 
 
 @pytest.fixture
 def mock_wav_writer(mocker):
-    m = mocker.patch("octo_slample.cli.WavWriter.write_bank")
+    m = mocker.patch("octo_slample.wav_writer.WavWriter.write_bank")
     m.return_value = ["foo.wav", "bar.wav"]
 
     return m
@@ -66,14 +78,14 @@ def mock_bank_initializer(mocker):
 @pytest.fixture
 def mock_bank_init_recursive(mocker):
     m = mocker.patch("octo_slample.cli.BankInitializer.init_recursive")
-    m.return_value.initialize.return_value = "foo.json"
+    m.return_value = InitSummary(3, (Path("a"), Path("b")), (), ())
 
     return m
 
 
 @pytest.fixture
 def mock_bank_exporter_export_bank(mocker):
-    m = mocker.patch("octo_slample.cli.BankExporter.export_bank")
+    m = mocker.patch("octo_slample.bank_exporter.BankExporter.export_bank")
     m.return_value = ["foo.wav", "bar.wav"]
 
     return m
@@ -81,7 +93,7 @@ def mock_bank_exporter_export_bank(mocker):
 
 @pytest.fixture
 def mock_bank_exporter_export_set(mocker, tmp_path):
-    m = mocker.patch("octo_slample.cli.BankExporter.export_set")
+    m = mocker.patch("octo_slample.bank_exporter.BankExporter.export_set")
     m.return_value = [(tmp_path, "foo.wav"), (tmp_path, "bar.wav")]
 
     return m
@@ -89,7 +101,7 @@ def mock_bank_exporter_export_set(mocker, tmp_path):
 
 @pytest.fixture
 def mock_bank_exporter_create_directory(mocker):
-    return mocker.patch("octo_slample.cli.BankExporter.create_directory")
+    return mocker.patch("octo_slample.bank_exporter.BankExporter.create_directory")
 
 
 def test_octo_slample_help():
@@ -101,12 +113,17 @@ def test_octo_slample_help():
     assert "  Octo Slample command line interface." in result.output
     assert "  --help  Show this message and exit." in result.output
     assert "Commands:" in result.output
+    assert (
+        "  compile     Compile a bank to a single file that opens instantly."
+        in result.output
+    )
     assert "  export      Export a bank to a set of wav files." in result.output
     assert (
         "  export-set  Export a set of banks to a Squid formatted Set." in result.output
     )
     assert "  loop        Run the loop mode." in result.output
     assert "  pads        Run the pads mode." in result.output
+    assert "  render      Render a pattern to a WAV file." in result.output
 
 
 def test_loop_help():
@@ -118,9 +135,11 @@ def test_loop_help():
     assert "  Run the loop mode." in result.output
     assert "  In loop mode, the loop is played continuously." in result.output
     assert "Options:" in result.output
-    assert "  -p, --pattern TEXT  Pattern file  [required]" in result.output
+    assert "  -p, --pattern TEXT  Pattern file" in result.output
+    assert "  -s, --song TEXT     Song file, instead of a pattern" in result.output
     assert "  -b, --bank TEXT     Bank file  [required]" in result.output
     assert "  --bpm INTEGER       Beats per minute" in result.output
+    assert "  --polyphony N       Maximum number of voices  [x>=1]" in result.output
 
 
 def test_loop_starts_clock_and_loops(mock_looping_sampler):
@@ -140,10 +159,110 @@ def test_loop_starts_clock_and_loops(mock_looping_sampler):
 
     assert result.exit_code == 0, "octo-slample loop should exit with code 0"
     assert "Playing pattern: " in result.output
+    assert mock_looping_sampler.call_args.kwargs["max_polyphony"] == 32
     mock_looping_sampler.return_value.clock.start.assert_called_once()
     mock_looping_sampler.return_value.loop.assert_called_once()
 
 
+@pytest.fixture
+def mock_json_song(mocker):
+    return mocker.patch("octo_slample.pattern.json_song.JsonSong.from_file")
+
+
+def test_loop_song(
+    mock_looping_sampler, mock_json_pattern, mock_json_song, mock_json_sample_bank
+):
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample, ["loop", "--song", "song.json", "--bank", "bank.json"]
+    )
+
+    assert result.exit_code == 0
+    assert "Playing song: " in result.output
+    mock_json_song.assert_called_once_with("song.json")
+    mock_json_pattern.assert_not_called()
+    assert mock_looping_sampler.call_args.kwargs["song"] is mock_json_song.return_value
+    assert mock_looping_sampler.call_args.kwargs["pattern"] is None
+    mock_looping_sampler.return_value.loop.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "args",
+    [[], ["--pattern", "pattern.json", "--song", "song.json"]],
+    ids=["neither", "both"],
+)
+def test_loop_needs_a_pattern_or_a_song(mock_looping_sampler, args):
+    runner = CliRunner()
+    result = runner.invoke(cli.octo_slample, ["loop", "--bank", "bank.json"] + args)
+
+    assert result.exit_code == 2
+    assert "Pass either --pattern or --song" in result.output
+    mock_looping_sampler.assert_not_called()
+
+
+def test_loop_stats(mock_looping_sampler, mock_json_pattern, mock_json_sample_bank):
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        ["loop", "--pattern", "pattern.json", "--bank", "bank.json", "--stats"],
+    )
+
+    assert result.exit_code == 0
+    stats = mock_looping_sampler.call_args.kwargs["stats"]
+    assert isinstance(stats, cli.LoopStats)
+    assert "Step timing:" in result.output
+    assert " - lateness: n=0" in result.output
+    assert " - dispatch: n=0" in result.output
+
+
+def test_loop_stats_interval(
+    mock_looping_sampler, mock_json_pattern, mock_json_sample_bank, mocker
+):
+    reporter = mocker.patch("octo_slample.cli.report_loop_stats_periodically")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        [
+            "loop",
+            "--pattern",
+            "pattern.json",
+            "--bank",
+            "bank.json",
+            "--stats-interval",
+            "5",
+        ],
+    )
+
+    assert result.exit_code == 0
+    stats = mock_looping_sampler.call_args.kwargs["stats"]
+    assert reporter.call_args.args[:2] == (stats, 5.0)
+    assert reporter.call_args.args[2].is_set()
+
+
+def test_loop_without_stats(
+    mock_looping_sampler, mock_json_pattern, mock_json_sample_bank
+):
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample, ["loop", "--pattern", "pattern.json", "--bank", "bank.json"]
+    )
+
+    assert mock_looping_sampler.call_args.kwargs["stats"] is None
+    assert "Step timing:" not in result.output
+
+
+def test_report_loop_stats_periodically(mocker):
+    print_loop_stats = mocker.patch("octo_slample.cli.print_loop_stats")
+    stop = mocker.Mock()
+    stop.wait.side_effect = [False, False, True]
+    stats = cli.LoopStats()
+
+    cli.report_loop_stats_periodically(stats, 0.5, stop).join()
+
+    stop.wait.assert_called_with(0.5)
+    assert print_loop_stats.call_count == 2
+
+
 def test_loop_handles_invalid_pattern_file(mock_json_pattern, mock_json_sample_bank):
     mock_json_pattern.side_effect = SchemaError("Invalid pattern file")
     runner = CliRunner()
@@ -183,6 +302,72 @@ def test_loop_handles_unknown_error(
     assert result.exit_code == 1
 
 
+def test_render_help():
+    runner = CliRunner()
+    result = runner.invoke(cli.octo_slample, ["render", "--help"])
+
+    assert result.exit_code == 0
+    assert "Usage: octo-slample render [OPTIONS]" in result.output
+    assert "  Render a pattern to a WAV file." in result.output
+    assert "  -o, --output TEXT   Output WAV file  [required]" in result.output
+    assert "  --bars INTEGER      Number of bars to render" in result.output
+
+
+def test_render(
+    mock_pattern_renderer, mock_json_pattern, mock_json_sample_bank
+) -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        [
+            "render",
+            "-p",
+            "pattern.json",
+            "-b",
+            "bank.json",
+            "-o",
+            "bounce.wav",
+            "--bpm",
+            "128",
+            "--bars",
+            "64",
+        ],
+    )
+
+    assert result.exit_code == 0
+    mock_pattern_renderer.assert_called_once_with(
+        mock_json_pattern.return_value, mock_json_sample_bank.return_value, bpm=128
+    )
+    mock_pattern_renderer.return_value.write.assert_called_once_with("bounce.wav", 64)
+    assert "Rendered pattern to 'bounce.wav'" in result.output
+
+
+def test_render_handles_invalid_pattern_file(mock_json_pattern, mock_json_sample_bank):
+    mock_json_pattern.side_effect = SchemaError("Invalid pattern file")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        ["render", "-p", "invalid.json", "-b", "bank.json", "-o", "bounce.wav"],
+    )
+
+    assert result.exit_code == 1
+    assert "Error: Invalid pattern file" in result.output
+
+
+def test_render_handles_unknown_error(
+    mock_pattern_renderer, mock_json_pattern, mock_json_sample_bank
+):
+    mock_pattern_renderer.side_effect = Exception("Boom")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        ["render", "-p", "pattern.json", "-b", "bank.json", "-o", "bounce.wav"],
+    )
+
+    assert result.exit_code == 1
+    assert "Unknown Error: Boom" in result.output
+
+
 def test_pads_help():
     runner = CliRunner()
     result = runner.invoke(cli.octo_slample, ["pads", "--help"])
@@ -222,6 +407,59 @@ def test_pads(mocker, mock_click_getchar, mock_play_channel):
     mock_play_channel.assert_has_calls([mocker.call(n) for n in range(0, 8)])
 
 
+@pytest.fixture
+def mock_compiled_sample_bank(mocker):
+    return mocker.patch("octo_slample.sampler.compiled_sample_bank.CompiledSampleBank")
+
+
+def test_compile_help():
+    runner = CliRunner()
+    result = runner.invoke(cli.octo_slample, ["compile", "--help"])
+
+    assert result.exit_code == 0
+    assert "Usage: octo-slample compile [OPTIONS]" in result.output
+    assert "  -b, --bank TEXT    Bank file  [required]" in result.output
+    assert "  -o, --output TEXT  Compiled bank file" in result.output
+
+
+@pytest.mark.parametrize(
+    ("args", "output"),
+    [([], "banks/bank.octobank"), (["-o", "fast.octobank"], "fast.octobank")],
+    ids=["default", "output"],
+)
+def test_compile(mock_compiled_sample_bank, mock_json_sample_bank, args, output):
+    mock_compiled_sample_bank.compile.return_value = output
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample, ["compile", "-b", "banks/bank.json"] + args
+    )
+
+    assert result.exit_code == 0
+    mock_json_sample_bank.assert_called_once_with("banks/bank.json")
+    mock_compiled_sample_bank.compile.assert_called_once_with(
+        mock_json_sample_bank.return_value, output
+    )
+    assert f"Compiled bank to '{output}'" in result.output
+
+
+def test_compile_handles_invalid_bank_file(mock_json_sample_bank):
+    mock_json_sample_bank.side_effect = SchemaError("Invalid bank file")
+    runner = CliRunner()
+    result = runner.invoke(cli.octo_slample, ["compile", "-b", "bank.json"])
+
+    assert result.exit_code == 1
+    assert "Error: Invalid bank file" in result.output
+
+
+def test_load_bank(mock_compiled_sample_bank, mock_json_sample_bank):
+    assert cli.load_bank("bank.json") is mock_json_sample_bank.return_value
+    assert (
+        cli.load_bank("bank.octobank")
+        is mock_compiled_sample_bank.from_file.return_value
+    )
+    mock_compiled_sample_bank.from_file.assert_called_once_with("bank.octobank")
+
+
 def test_export_help():
     runner = CliRunner()
     result = runner.invoke(cli.octo_slample, ["export", "--help"])
@@ -337,7 +575,35 @@ def test_init_recursive(mock_bank_init_recursive, tmp_path):
     result = runner.invoke(cli.octo_slample, ["init", str(tmp_path), "--recursive"])
 
     assert result.exit_code == 0
-    mock_bank_init_recursive.assert_called_once_with(str(tmp_path), False)
+    mock_bank_init_recursive.assert_called_once_with(
+        str(tmp_path), False, DEFAULT_MAX_WORKERS, cli.print_init_progress
+    )
+    assert "- Wrote 2 bank files" in result.output
+
+
+def test_init_recursive_jobs(mock_bank_init_recursive, tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample, ["init", str(tmp_path), "--recursive", "--jobs", "4"]
+    )
+
+    assert result.exit_code == 0
+    mock_bank_init_recursive.assert_called_once_with(
+        str(tmp_path), False, 4, cli.print_init_progress
+    )
+
+
+def test_init_recursive_reports_failures(mock_bank_init_recursive, tmp_path):
+    mock_bank_init_recursive.return_value = InitSummary(
+        3, (tmp_path / "a",), (), ((tmp_path / "b", PermissionError("denied")),)
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli.octo_slample, ["init", str(tmp_path), "--recursive"])
+
+    assert result.exit_code == 1
+    assert f"- Failed '{tmp_path / 'b'}': PermissionError: denied" in result.output
+    assert "1 directories could not be initialized" in result.output
 
 
 def test_export_set_help():
@@ -349,6 +615,7 @@ def test_export_set_help():
     assert "  Export a set of banks to a Squid formatted Set." in result.output
     assert "input_directory" in result.output
     assert "output_directory" in result.output
+    assert "-j, --jobs N  Number of banks to export at once" in result.output
 
 
 def test_export_set(
@@ -371,12 +638,53 @@ def test_export_set(
     )
 
     mock_bank_exporter_export_set.assert_called_once_with(
-        str(tmp_path / "banks"), str(tmp_path / "exported_samples")
+        str(tmp_path / "banks"), str(tmp_path / "exported_samples"), 1
     )
 
     assert result.exit_code == 0, "octo-slample export-set should exit with code 0"
 
 
+def test_export_set_jobs(tmp_path, mock_bank_exporter_export_set):
+    (tmp_path / "banks").mkdir()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        [
+            "export-set",
+            "--jobs",
+            "4",
+            str(tmp_path / "banks"),
+            str(tmp_path / "exported_samples"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    mock_bank_exporter_export_set.assert_called_once_with(
+        str(tmp_path / "banks"), str(tmp_path / "exported_samples"), 4
+    )
+
+
+def test_export_set_reports_failed_banks(tmp_path, mock_bank_exporter_export_set):
+    (tmp_path / "banks").mkdir()
+    mock_bank_exporter_export_set.return_value = [
+        (tmp_path / "Bank 1", ["chan-001.wav"]),
+        ValueError("bad bank"),
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.octo_slample,
+        ["export-set", str(tmp_path / "banks"), str(tmp_path / "exported_samples")],
+    )
+
+    assert result.exit_code == 1
+    assert f" - {tmp_path / 'Bank 1'}" in result.output
+    assert "   - chan-001.wav" in result.output
+    assert " - Bank 2 failed: bad bank" in result.output
+    assert "1 of 2 banks failed to export" in result.output
+
+
 def test_export_set_handles_unknown_error(mock_bank_exporter_export_set):
     runner = CliRunner()
 
@@ -0,0 +1,89 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+# generous, so that slow machines pass, but well under the cost of
+# importing numpy and soundfile
+IMPORT_BUDGET_US = 150_000
+
+AUDIO_MODULES = ["numpy", "soundfile", "sounddevice"]
+
+CLI_SCRIPT = "import sys; from octo_slample.cli import octo_slample; octo_slample()"
+
+COMMANDS = ["compile", "export", "export-set", "init", "loop", "pads", "render"]
+
+
+def run_with_import_times(*args: str) -> dict[str, tuple[int, int]]:
+    """Run Python with `-X importtime`.
+
+    Returns the cumulative import time, in microseconds, and the nesting
+    depth of every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[2])},
+    )
+    assert result.returncode == 0, result.stderr
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = (
+            int(cumulative),
+            (len(name) - len(name.lstrip()) - 1) // 2,
+        )
+
+    return times
+
+
+@pytest.fixture(scope="module")
+def interpreter_modules():
+    """Get the modules that the interpreter imports at startup."""
+    return set(run_with_import_times("-c", "pass"))
+
+
+def import_time_us(times: dict, interpreter_modules: set) -> int:
+    """Sum the import times of modules not imported at startup."""
+    return sum(
+        cumulative
+        for name, (cumulative, depth) in times.items()
+        if depth == 0 and name not in interpreter_modules
+    )
+
+
+@pytest.mark.parametrize("command", COMMANDS)
+def test_command_import_budget(command, interpreter_modules):
+    times = run_with_import_times("-c", CLI_SCRIPT, command, "--help")
+
+    assert not set(AUDIO_MODULES) & set(times)
+    assert "schema" not in times
+    assert import_time_us(times, interpreter_modules) < IMPORT_BUDGET_US
+
+
+def test_init_import_budget(interpreter_modules, tmp_path):
+    sf.write(tmp_path / "kick.wav", np.zeros(16), 44100, subtype="PCM_16")
+
+    times = run_with_import_times("-c", CLI_SCRIPT, "init", str(tmp_path))
+
+    assert not set(AUDIO_MODULES) & set(times)
+    assert import_time_us(times, interpreter_modules) < IMPORT_BUDGET_US
+
+    bank = json.loads((tmp_path / "bank.json").read_text())
+    assert bank["samples"][0]["info"]["subtype"] == "PCM_16"
+
+
+def test_import_times_include_audio_modules():
+    times = run_with_import_times("-c", "import octo_slample.sampler.looping_sampler")
+
+    assert set(AUDIO_MODULES) - {"sounddevice"} <= set(times)
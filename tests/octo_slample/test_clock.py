@@ -1,9 +1,13 @@
 import pytest
 
-from octo_slample.clock import Clock
+from octo_slample.clock import SCHEDULE_DEADLINE, Clock
 from octo_slample.constants import DEFAULT_BPM, DEFAULT_STEP_COUNT, SECONDS_PER_MINUTE
+from octo_slample.loop_stats import LatencyHistogram
 
 TIME = 1234567890
+START_NS = 5_000_000_000
+# a sixteenth at 120 BPM
+STEP_NS = 125_000_000
 
 
 @pytest.fixture
@@ -68,3 +72,119 @@ def test_clock_beat_returns_counter_when_clock_stopped(clock, mock_sleep, mock_t
     assert counter == 0
     mock_time.assert_not_called()
     mock_sleep.assert_not_called()
+
+
+@pytest.fixture
+def mock_perf_counter_ns(mocker):
+    return mocker.patch("octo_slample.clock.time.perf_counter_ns")
+
+
+@pytest.fixture
+def deadline_clock(mock_perf_counter_ns):
+    mock_perf_counter_ns.return_value = START_NS
+    clock = Clock(schedule=SCHEDULE_DEADLINE, spin_ns=1_000_000)
+    clock.start()
+
+    return clock
+
+
+def test_clock_invalid_schedule_fails():
+    with pytest.raises(AssertionError):
+        Clock(schedule="metronome")
+
+
+def test_clock_deadlines_are_anchored_to_start(deadline_clock):
+    assert deadline_clock.step_ns == STEP_NS
+    assert deadline_clock.deadline_ns(1) == START_NS + STEP_NS
+    # no drift after an hour of steps
+    assert deadline_clock.deadline_ns(28_800) == START_NS + 3600 * 10**9
+
+
+def test_clock_deadline_beat_sleeps_then_spins(
+    deadline_clock, mock_perf_counter_ns, mock_sleep
+):
+    mock_perf_counter_ns.side_effect = [
+        START_NS,
+        START_NS + STEP_NS - 500,
+        START_NS + STEP_NS,
+    ]
+
+    counter = deadline_clock.beat()
+
+    assert counter == 1
+    mock_sleep.assert_called_once_with((STEP_NS - 1_000_000) / 10**9)
+    assert deadline_clock.missed_deadlines == 0
+
+
+def test_clock_deadline_beat_reports_missed_deadline(
+    deadline_clock, mock_perf_counter_ns, mock_sleep
+):
+    mock_perf_counter_ns.side_effect = [
+        START_NS + STEP_NS + 1000,
+        START_NS + STEP_NS + 1000,
+        START_NS + 2 * STEP_NS,
+    ]
+
+    deadline_clock.beat()
+
+    assert deadline_clock.missed_deadlines == 1
+    assert deadline_clock.max_lateness_ns == 1000
+    mock_sleep.assert_not_called()
+
+    # the next beat still waits for its own deadline
+    deadline_clock.beat()
+
+    mock_sleep.assert_called_once_with((STEP_NS - 1000 - 1_000_000) / 10**9)
+
+
+def test_clock_deadline_beat_skips_lost_steps(
+    deadline_clock, mock_perf_counter_ns, mock_sleep
+):
+    mock_perf_counter_ns.return_value = START_NS + 3 * STEP_NS + 10
+
+    deadline_clock.beat()
+
+    assert deadline_clock.missed_deadlines == 1
+    assert deadline_clock.max_lateness_ns == 2 * STEP_NS + 10
+    assert deadline_clock._next_step == 4
+
+
+def test_clock_start_resets_missed_deadlines(deadline_clock, mock_perf_counter_ns):
+    mock_perf_counter_ns.return_value = START_NS + 2 * STEP_NS
+    deadline_clock.beat()
+
+    deadline_clock.start()
+
+    assert deadline_clock.missed_deadlines == 0
+    assert deadline_clock.deadline_ns(1) == START_NS + 3 * STEP_NS
+
+
+def test_clock_deadline_beat_records_lateness(mock_perf_counter_ns, mock_sleep):
+    lateness = LatencyHistogram()
+    mock_perf_counter_ns.return_value = START_NS
+    clock = Clock(schedule=SCHEDULE_DEADLINE, lateness=lateness)
+    clock.start()
+    mock_perf_counter_ns.side_effect = [
+        START_NS,
+        START_NS + STEP_NS + 2_000,
+        START_NS + 3 * STEP_NS,
+    ]
+
+    clock.beat()
+    clock.beat()
+
+    assert len(lateness) == 2
+    assert lateness.max == STEP_NS
+
+
+def test_clock_epoch_beat_records_lateness(clock, mock_sleep, mock_time, mocker):
+    lateness = LatencyHistogram()
+    clock._lateness = lateness
+    mocker.patch(
+        "octo_slample.clock.time.perf_counter_ns", side_effect=[0, 125_000_500]
+    )
+
+    clock.beat()
+
+    assert len(lateness) == 1
+    assert lateness.max == 500
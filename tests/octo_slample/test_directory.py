@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from octo_slample.directory import DirectoryMixin
@@ -58,3 +60,16 @@ def testcollect_subdirectories_with_subdirectories(directory_with_subdirectories
         directory_with_subdirectories / "subdirectory1",
         directory_with_subdirectories / "subdirectory2",
     ]
+
+
+def testcollect_subdirectories_lists_each_directory_once(
+    directory_with_subdirectories, mocker
+):
+    stat = mocker.spy(os, "stat")
+    scandir = mocker.spy(os, "scandir")
+
+    DirectoryMixin.collect_subdirectories(directory_with_subdirectories)
+
+    assert scandir.call_count == 3
+    # only the check that the directory is a directory
+    assert stat.call_count == 1
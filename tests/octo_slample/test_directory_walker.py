@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from octo_slample.directory_walker import (
+    DirectoryIndex,
+    DirectoryScan,
+    DirectoryWalker,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "drums" / "kicks").mkdir(parents=True)
+    (tmp_path / "drums" / "hats").mkdir()
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "readme.txt").touch()
+    (tmp_path / "drums" / "kicks" / "kick.wav").touch()
+    (tmp_path / "drums" / "hats" / "hat.wav").touch()
+
+    return tmp_path
+
+
+def test_scan(tree):
+    scan = DirectoryWalker.scan(tree)
+
+    assert scan == DirectoryScan(
+        tree, (tree / "readme.txt",), (tree / "drums", tree / "empty")
+    )
+    assert scan.has_suffix(".txt")
+    assert not scan.has_suffix(".wav")
+
+
+def test_scan_missing_directory(tmp_path):
+    scan = DirectoryWalker.scan(tmp_path / "missing")
+
+    assert scan.files == ()
+    assert scan.subdirectories == ()
+    assert isinstance(scan.error, FileNotFoundError)
+
+
+def test_walk(tree):
+    scans = DirectoryWalker(max_workers=2).walk(tree)
+
+    assert sorted(scans) == [
+        tree,
+        tree / "drums",
+        tree / "drums" / "hats",
+        tree / "drums" / "kicks",
+        tree / "empty",
+    ]
+    assert scans[tree / "drums" / "kicks"].files == (
+        tree / "drums" / "kicks" / "kick.wav",
+    )
+
+
+def test_walk_lists_each_directory_once(tree, mocker):
+    scan = mocker.spy(DirectoryWalker, "scan")
+
+    DirectoryWalker().walk(tree)
+
+    assert scan.call_count == 5
+
+
+def test_walk_max_depth(tree):
+    scans = DirectoryWalker().walk(tree, max_depth=1)
+
+    assert sorted(scans) == [tree, tree / "drums", tree / "empty"]
+
+
+def test_scan_follows_symlinks(tree):
+    (tree / "link").symlink_to(tree / "drums", target_is_directory=True)
+
+    scan = DirectoryWalker.scan(tree)
+
+    assert tree / "link" in scan.subdirectories
+    assert scan.stat_calls == 1
+
+
+def test_index(tree):
+    (tree / "drums" / "kicks" / "bank.json").touch()
+
+    index = DirectoryIndex.build(tree)
+
+    assert index.root == tree
+    assert len(index) == 5
+    assert index[tree / "drums" / "kicks"].wav_files == (
+        tree / "drums" / "kicks" / "kick.wav",
+    )
+    assert index[tree / "drums" / "kicks"].json_files == (
+        tree / "drums" / "kicks" / "bank.json",
+    )
+    assert index.subdirectories_with(tree, ".wav") == [tree / "drums"]
+    assert index.subdirectories_with(tree / "drums", ".json") == [
+        tree / "drums" / "kicks"
+    ]
+
+
+def test_index_is_immutable(tree):
+    index = DirectoryIndex.build(tree)
+
+    with pytest.raises(TypeError):
+        index[tree] = DirectoryScan(tree, (), ())
+
+
+def test_index_counts_calls(tree, mocker):
+    stat = mocker.spy(os, "stat")
+    scandir = mocker.spy(os, "scandir")
+
+    index = DirectoryIndex.build(tree)
+
+    assert index.scandir_calls == scandir.call_count == 5
+    assert index.stat_calls == stat.call_count == 0
+
+
+def test_invalid_max_workers_fails():
+    with pytest.raises(AssertionError):
+        DirectoryWalker(max_workers=0)
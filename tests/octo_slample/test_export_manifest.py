@@ -0,0 +1,66 @@
+from octo_slample.export_manifest import (
+    MANIFEST_FILE_NAME,
+    MANIFEST_VERSION,
+    ExportManifest,
+)
+from octo_slample.sampler.sample_store import SampleStore
+
+
+def test_load_missing_manifest_is_empty(tmp_path):
+    assert ExportManifest.load(tmp_path).banks == {}
+
+
+def test_load_invalid_manifest_is_empty(tmp_path):
+    (tmp_path / MANIFEST_FILE_NAME).write_text("not json")
+
+    assert ExportManifest.load(tmp_path).banks == {}
+
+
+def test_load_outdated_manifest_is_empty(tmp_path):
+    (tmp_path / MANIFEST_FILE_NAME).write_text(
+        f'{{"version": {MANIFEST_VERSION + 1}, "banks": {{"1": {{}}}}}}'
+    )
+
+    assert ExportManifest.load(tmp_path).banks == {}
+
+
+def test_save_and_load(tmp_path):
+    ExportManifest({"1": {"channels": {}}}).save(tmp_path)
+
+    assert ExportManifest.load(tmp_path).banks == {"1": {"channels": {}}}
+
+
+def test_file_record(tmp_path):
+    path = tmp_path / "kick.wav"
+    path.write_bytes(b"kick")
+
+    record = ExportManifest.file_record(path)
+
+    assert record["path"] == str(path)
+    assert record["size"] == 4
+    assert record["hash"] == SampleStore.hash_file(path)
+
+
+def test_file_record_reuses_hash_of_unchanged_file(tmp_path, mocker):
+    path = tmp_path / "kick.wav"
+    path.write_bytes(b"kick")
+    previous = ExportManifest.file_record(path)
+    hash_file = mocker.spy(SampleStore, "hash_file")
+
+    assert ExportManifest.file_record(path, previous) == previous
+    hash_file.assert_not_called()
+
+
+def test_is_unchanged(tmp_path):
+    path = tmp_path / "chan-001.wav"
+    path.write_bytes(b"kick")
+    record = ExportManifest.file_record(path)
+
+    assert ExportManifest.is_unchanged(path, record)
+    assert not ExportManifest.is_unchanged(path, None)
+
+    path.write_bytes(b"snare")
+    assert not ExportManifest.is_unchanged(path, record)
+
+    path.unlink()
+    assert not ExportManifest.is_unchanged(path, record)
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from octo_slample.file_copier import FileCopier
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.wav"
+    path.write_bytes(os.urandom(300_000))
+
+    return path
+
+
+@pytest.fixture
+def no_reflink(mocker):
+    return mocker.patch.object(FileCopier, "_reflink", return_value=False)
+
+
+def test_copy(source, tmp_path):
+    result = FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert result == str(tmp_path / "copy.wav")
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
+
+
+def test_copy_overwrites(source, tmp_path):
+    (tmp_path / "copy.wav").write_bytes(b"x" * 500_000)
+
+    FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
+
+
+def test_copy_empty_file(tmp_path):
+    (tmp_path / "empty.wav").touch()
+
+    FileCopier.copy(tmp_path / "empty.wav", tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == b""
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "copy_file_range"), reason="copy_file_range is not available"
+)
+def test_copy_uses_copy_file_range(source, tmp_path, no_reflink, mocker):
+    sendfile = mocker.spy(FileCopier, "_sendfile")
+
+    FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
+    sendfile.assert_not_called()
+
+
+def test_copy_falls_back_to_sendfile(source, tmp_path, no_reflink, mocker):
+    mocker.patch("os.copy_file_range", side_effect=OSError, create=True)
+
+    FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
+
+
+def test_copy_falls_back_to_buffered_copy(source, tmp_path, no_reflink, mocker):
+    mocker.patch("os.copy_file_range", side_effect=OSError, create=True)
+    mocker.patch("os.sendfile", side_effect=OSError, create=True)
+
+    FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
+
+
+def test_copy_discards_partial_kernel_copy(source, tmp_path, no_reflink, mocker):
+    mocker.patch("os.copy_file_range", side_effect=[1000, 0], create=True)
+    mocker.patch("os.sendfile", side_effect=OSError, create=True)
+
+    FileCopier.copy(source, tmp_path / "copy.wav")
+
+    assert (tmp_path / "copy.wav").read_bytes() == source.read_bytes()
@@ -1,6 +1,9 @@
+import json
+
 import pytest
+from schema import Schema, SchemaError
 
-from octo_slample.json import JsonMixin
+from octo_slample.json import VALIDATION_CACHE, JsonMixin, ValidationCache
 
 
 @pytest.fixture
@@ -21,3 +24,159 @@ def test_json_mixin_has__load_method(json_mixin):
     assert hasattr(json_mixin, "_load")
 
     json_mixin._load({})
+
+
+class NamedDocument(JsonMixin):
+    """A JSON document with a name."""
+
+    @classmethod
+    def schema(cls):
+        return Schema({"name": str})
+
+    def _load(self, json_dict):
+        self.name = json_dict["name"]
+
+
+@pytest.fixture
+def validation_cache():
+    """Get an empty validation cache."""
+    VALIDATION_CACHE.clear()
+    yield VALIDATION_CACHE
+    VALIDATION_CACHE.clear()
+
+
+@pytest.fixture
+def document_file(tmp_path):
+    """Get a valid document file."""
+    path = tmp_path / "document.json"
+    path.write_text(json.dumps({"name": "one"}))
+
+    return path
+
+
+def test_json_mixin_compiled_schema_is_built_once(mocker):
+    schema = mocker.spy(NamedDocument, "schema")
+    NamedDocument._compiled_schemas.pop(NamedDocument, None)
+
+    assert NamedDocument.compiled_schema() is NamedDocument.compiled_schema()
+    assert schema.call_count == 1
+
+
+def test_json_mixin_from_json_validates():
+    with pytest.raises(SchemaError):
+        NamedDocument.from_json({"name": 1})
+
+    assert NamedDocument.from_json({"name": 1}, validate=False).name == 1
+
+
+def test_json_mixin_file_path(validation_cache, document_file):
+    assert NamedDocument.from_json({"name": "one"}).file_path is None
+    assert NamedDocument.from_file(str(document_file)).file_path == document_file
+
+
+def test_json_mixin_from_file_skips_validated_files(
+    mocker, validation_cache, document_file
+):
+    validate = mocker.spy(NamedDocument.compiled_schema(), "validate")
+
+    assert NamedDocument.from_file(document_file).name == "one"
+    assert NamedDocument.from_file(document_file).name == "one"
+    assert validate.call_count == 1
+    assert len(validation_cache) == 1
+
+
+def test_json_mixin_from_file_revalidates_changed_files(
+    mocker, validation_cache, document_file
+):
+    validate = mocker.spy(NamedDocument.compiled_schema(), "validate")
+    NamedDocument.from_file(document_file)
+
+    document_file.write_text(json.dumps({"name": "two"}))
+
+    assert NamedDocument.from_file(document_file).name == "two"
+    assert validate.call_count == 2
+
+    document_file.write_text(json.dumps({"name": 2}))
+
+    with pytest.raises(SchemaError):
+        NamedDocument.from_file(document_file)
+
+
+def test_json_mixin_from_file_does_not_cache_invalid_files(
+    validation_cache, document_file
+):
+    document_file.write_text(json.dumps({"name": 1}))
+
+    for _ in range(0, 2):
+        with pytest.raises(SchemaError):
+            NamedDocument.from_file(document_file)
+
+    assert len(validation_cache) == 0
+
+
+def test_validation_cache_keys_files_by_class(validation_cache, document_file):
+    fingerprint = ValidationCache.fingerprint(
+        document_file.stat(), document_file.read_bytes()
+    )
+    validation_cache.add(NamedDocument, document_file, fingerprint)
+
+    assert validation_cache.is_valid(NamedDocument, document_file, fingerprint)
+    assert not validation_cache.is_valid(JsonMixin, document_file, fingerprint)
+    assert not validation_cache.is_valid(
+        NamedDocument, document_file, fingerprint[:2] + ("0",)
+    )
+
+
+def test_json_mixin_from_files_keeps_input_order(validation_cache, tmp_path):
+    paths = []
+    for name in ["c", "a", "b"]:
+        paths.append(tmp_path / f"{name}.json")
+        paths[-1].write_text(json.dumps({"name": name}))
+
+    documents = NamedDocument.from_files(paths, max_workers=2)
+
+    assert [document.name for document in documents] == ["c", "a", "b"]
+
+
+def test_json_mixin_from_files_returns_errors(validation_cache, tmp_path):
+    (tmp_path / "valid.json").write_text(json.dumps({"name": "valid"}))
+    (tmp_path / "invalid.json").write_text(json.dumps({"name": 1}))
+    (tmp_path / "broken.json").write_text("{")
+
+    documents = NamedDocument.from_files(
+        [
+            tmp_path / "invalid.json",
+            tmp_path / "missing.json",
+            tmp_path / "broken.json",
+            tmp_path / "valid.json",
+        ]
+    )
+
+    assert isinstance(documents[0], SchemaError)
+    assert isinstance(documents[1], FileNotFoundError)
+    assert isinstance(documents[2], json.JSONDecodeError)
+    assert documents[3].name == "valid"
+
+
+def test_json_mixin_from_files_invalid_max_workers_fails():
+    with pytest.raises(AssertionError):
+        NamedDocument.from_files([], max_workers=0)
+
+
+def test_json_mixin_load_tree(validation_cache, tmp_path):
+    (tmp_path / "b" / "nested").mkdir(parents=True)
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b" / "nested" / "two.json").write_text(json.dumps({"name": "two"}))
+    (tmp_path / "a" / "one.json").write_text(json.dumps({"name": "one"}))
+    (tmp_path / "a" / "notes.txt").write_text("{}")
+
+    documents = NamedDocument.load_tree(tmp_path)
+
+    assert list(documents) == [
+        tmp_path / "a" / "one.json",
+        tmp_path / "b" / "nested" / "two.json",
+    ]
+    assert [document.name for document in documents.values()] == ["one", "two"]
+    assert list(NamedDocument.load_tree(tmp_path, max_depth=1)) == [
+        tmp_path / "a" / "one.json"
+    ]
@@ -0,0 +1,74 @@
+import pytest
+
+from octo_slample.loop_stats import LatencyHistogram, LoopStats
+
+
+@pytest.fixture
+def histogram():
+    return LatencyHistogram()
+
+
+def test_empty_histogram(histogram):
+    assert len(histogram) == 0
+    assert histogram.percentile(50) == 0
+    assert histogram.summary() == "n=0 p50=0.000 ms p99=0.000 ms max=0.000 ms"
+
+
+def test_record(histogram):
+    for time_ns in [1_000_000] * 98 + [5_000_000, 20_000_000]:
+        histogram.record(time_ns)
+
+    assert len(histogram) == 100
+    assert histogram.max == 20_000_000
+    assert histogram.percentile(50) == pytest.approx(1_000_000, rel=0.13)
+    assert histogram.percentile(99) == pytest.approx(5_000_000, rel=0.13)
+    assert histogram.percentile(100) == 20_000_000
+
+
+def test_record_negative_time_is_zero(histogram):
+    histogram.record(-5)
+
+    assert histogram.max == 0
+    assert histogram.percentile(50) == 0
+
+
+def test_record_beyond_last_bucket(histogram):
+    histogram.record(100 * 10**9)
+
+    assert histogram.percentile(50) == 100 * 10**9
+
+
+def test_histogram_is_fixed_size(histogram):
+    buckets = len(histogram._counts)
+
+    for time_ns in range(0, 10**9, 10**6):
+        histogram.record(time_ns)
+
+    assert len(histogram._counts) == buckets
+
+
+def test_reset(histogram):
+    histogram.record(1000)
+    histogram.reset()
+
+    assert len(histogram) == 0
+    assert histogram.max == 0
+
+
+def test_invalid_percentile_fails(histogram):
+    with pytest.raises(AssertionError):
+        histogram.percentile(101)
+
+
+def test_loop_stats_report():
+    stats = LoopStats()
+    stats.lateness.record(2_000_000)
+
+    assert stats.report().splitlines() == [
+        "lateness: n=1 p50=2.000 ms p99=2.000 ms max=2.000 ms",
+        "dispatch: n=0 p50=0.000 ms p99=0.000 ms max=0.000 ms",
+    ]
+
+
+def test_frames_to_ns():
+    assert LoopStats.frames_to_ns(441, 44100) == 10_000_000
@@ -0,0 +1,212 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from octo_slample.sample_converter import (
+    LinearResampler,
+    LowPassFilter,
+    SampleConverter,
+)
+
+SQUID_RATE = 44100
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def sine():
+    t = np.arange(0, 9600) / 96000
+
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def tone(frequency, sample_rate, frames):
+    t = np.arange(0, frames) / sample_rate
+
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def test_low_pass_filter_keeps_stream_length_and_level():
+    low_pass = LowPassFilter(0.2)
+    source = np.ones((1000, 2), dtype=np.float32)
+
+    filtered = np.concatenate(
+        (low_pass.process(source), low_pass.process(source[:0], last=True))
+    )
+
+    assert low_pass.taps.sum() == pytest.approx(1)
+    assert filtered.shape == source.shape
+    # the stream is silent either side, so only the edges are smoothed
+    assert np.allclose(filtered[100:-100], 1, atol=1e-4)
+
+
+@pytest.mark.parametrize("block_frames", [1, 7, 1000])
+def test_low_pass_filter_is_independent_of_block_size(sine, block_frames):
+    source = sine[:, np.newaxis]
+    expected = LowPassFilter(0.2).process(source, last=True)
+
+    low_pass = LowPassFilter(0.2)
+    blocks = [
+        low_pass.process(source[i : i + block_frames])
+        for i in range(0, len(source), block_frames)
+    ]
+    result = np.concatenate(blocks + [low_pass.process(source[:0], last=True)])
+
+    assert np.allclose(result, expected, atol=1e-6)
+
+
+def test_low_pass_filter_invalid_cutoff_fails():
+    with pytest.raises(AssertionError):
+        LowPassFilter(0.5)
+
+
+def test_resampler_output_frames():
+    assert LinearResampler(96000, SQUID_RATE, 96000).output_frames == SQUID_RATE
+
+
+def test_resampler_interpolates():
+    resampler = LinearResampler(2, 4, 3)
+    ramp = np.array([[0.0], [1.0], [2.0]], dtype=np.float32)
+
+    resampled = np.concatenate((resampler.process(ramp), resampler.flush(1)))
+
+    assert np.allclose(resampled[:, 0], [0, 0.5, 1, 1.5, 2, 2])
+
+
+def test_resampler_interpolates_int16_without_wrapping():
+    loud = np.array([[20000], [-20000], [20000], [-20000]], dtype=np.int16)
+
+    resampled = LinearResampler.resample(loud, 22050, 44100)
+
+    assert resampled.dtype == np.float32
+    assert np.allclose(resampled[:, 0], [20000, 0, -20000, 0, 20000, 0, -20000, -20000])
+
+
+@pytest.mark.parametrize("block_frames", [1, 7, 1000, 10_000])
+def test_resampler_is_independent_of_block_size(sine, block_frames):
+    source = sine[:, np.newaxis]
+    whole = LinearResampler(96000, SQUID_RATE, len(source))
+    expected = np.concatenate((whole.process(source), whole.flush(1)))
+
+    chunked = LinearResampler(96000, SQUID_RATE, len(source))
+    blocks = [
+        chunked.process(source[i : i + block_frames])
+        for i in range(0, len(source), block_frames)
+    ]
+    result = np.concatenate(blocks + [chunked.flush(1)])
+
+    assert len(result) == chunked.output_frames
+    assert np.allclose(result, expected)
+
+
+def test_dither_is_within_one_bit(rng):
+    block = np.full((10_000, 1), 0.25 + 0.3 / 32768, dtype=np.float32)
+
+    dithered = SampleConverter.dither(block, rng)
+
+    assert dithered.dtype == np.int16
+    assert dithered.min() >= 8192 - 1
+    assert dithered.max() <= 8192 + 2
+    assert dithered.mean() == pytest.approx(8192.3, abs=0.05)
+
+
+def test_dither_clips(rng):
+    block = np.array([[2.0], [-2.0]], dtype=np.float32)
+
+    assert SampleConverter.dither(block, rng)[:, 0].tolist() == [32767, -32768]
+
+
+def test_convert_copies_pcm_16_samples_exactly(tmp_path):
+    audio = np.arange(-500, 500, dtype=np.int16)
+    sf.write(tmp_path / "in.wav", audio, SQUID_RATE, subtype="PCM_16")
+
+    SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, block_frames=64
+    )
+
+    result, sample_rate = sf.read(tmp_path / "out.wav", dtype="int16")
+    assert sample_rate == SQUID_RATE
+    assert np.array_equal(result, audio)
+
+
+def test_convert_resamples_and_reduces_bit_depth(tmp_path, sine, rng):
+    sf.write(tmp_path / "in.wav", sine, 96000, subtype="FLOAT")
+
+    path = SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, 1000, rng
+    )
+
+    assert path == str(tmp_path / "out.wav")
+    info = sf.info(path)
+    assert info.samplerate == SQUID_RATE
+    assert info.subtype == "PCM_16"
+    assert info.frames == round(len(sine) * SQUID_RATE / 96000)
+
+    result, _ = sf.read(path, dtype="float32")
+    t = np.arange(0, info.frames) / SQUID_RATE
+    expected = 0.5 * np.sin(2 * np.pi * 440 * t)
+    assert np.abs(result - expected).max() < 0.01
+
+
+def test_convert_drops_extra_channels(tmp_path, rng):
+    audio = np.zeros((100, 4), dtype=np.float32)
+    audio[:, 1] = 0.5
+    sf.write(tmp_path / "in.wav", audio, SQUID_RATE, subtype="FLOAT")
+
+    SampleConverter.convert(tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE)
+
+    result, _ = sf.read(tmp_path / "out.wav", dtype="int16")
+    assert result.shape == (100, 2)
+    assert np.abs(result[:, 1].astype(int) - 16384).max() <= 1
+
+
+def test_convert_streams_blocks(tmp_path, mocker):
+    sf.write(tmp_path / "in.wav", np.zeros(1000, dtype=np.int16), SQUID_RATE)
+    write = mocker.spy(sf.SoundFile, "write")
+
+    SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, block_frames=100
+    )
+
+    assert write.call_count == 10
+    assert all(len(call.args[1]) == 100 for call in write.call_args_list)
+
+
+def test_convert_filters_frequencies_above_target_nyquist(tmp_path, rng):
+    # a 30 kHz tone would alias to 14.1 kHz at 44.1 kHz
+    sf.write(tmp_path / "in.wav", tone(30000, 96000, 9600), 96000, subtype="FLOAT")
+
+    SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, 1000, rng
+    )
+
+    result, _ = sf.read(tmp_path / "out.wav", dtype="float32")
+    assert np.sqrt(np.mean(result**2)) < 0.005
+
+
+def test_convert_passes_frequencies_below_target_nyquist(tmp_path, rng):
+    sf.write(tmp_path / "in.wav", tone(8000, 96000, 9600), 96000, subtype="FLOAT")
+
+    SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, 1000, rng
+    )
+
+    result, _ = sf.read(tmp_path / "out.wav", dtype="float32")
+    assert np.sqrt(np.mean(result[200:-200] ** 2)) == pytest.approx(
+        0.5 / np.sqrt(2), rel=0.05
+    )
+
+
+def test_convert_applies_gain(tmp_path, rng):
+    audio = np.full(1000, 10000, dtype=np.int16)
+    sf.write(tmp_path / "in.wav", audio, SQUID_RATE, subtype="PCM_16")
+
+    SampleConverter.convert(
+        tmp_path / "in.wav", tmp_path / "out.wav", SQUID_RATE, rng=rng, gain=0.1
+    )
+
+    result, _ = sf.read(tmp_path / "out.wav", dtype="int16")
+    assert np.abs(result.astype(int) - 1000).max() <= 1
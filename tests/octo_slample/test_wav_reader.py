@@ -0,0 +1,115 @@
+import struct
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from octo_slample.wav_reader import WAVE_FORMAT_PCM, WavReader
+
+
+@pytest.fixture
+def stereo_audio():
+    return np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+
+
+@pytest.fixture
+def pcm_16_wav(tmp_path, stereo_audio):
+    path = tmp_path / "pcm16.wav"
+    sf.write(path, stereo_audio, 48000, subtype="PCM_16")
+
+    return path
+
+
+@pytest.fixture
+def wav_with_list_chunk(tmp_path):
+    """Write a mono 16-bit WAV with an odd-sized chunk before the data."""
+    audio = np.array([5, 6, 7], dtype="<i2").tobytes()
+    fmt = struct.pack("<HHIIHH", WAVE_FORMAT_PCM, 1, 44100, 88200, 2, 16)
+    chunks = (
+        b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+        + b"data" + struct.pack("<I", len(audio)) + audio
+    )  # fmt: skip
+    path = tmp_path / "list.wav"
+    path.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks)
+
+    return path
+
+
+def test_read_header(pcm_16_wav):
+    header = WavReader.read_header(pcm_16_wav)
+
+    assert header.format_tag == WAVE_FORMAT_PCM
+    assert header.channels == 2
+    assert header.sample_rate == 48000
+    assert header.bits_per_sample == 16
+    assert header.frames == 3
+    assert header.is_pcm_16
+
+
+def test_read_header_skips_unknown_chunks(wav_with_list_chunk):
+    header = WavReader.read_header(wav_with_list_chunk)
+
+    assert header.channels == 1
+    assert header.frames == 3
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"", b"RIFF", b"RIFF\x00\x00\x00\x00AIFF", b"RIFF\x04\x00\x00\x00WAVE"],
+    ids=["empty", "truncated", "not_wave", "no_chunks"],
+)
+def test_read_header_invalid_file(tmp_path, contents):
+    path = tmp_path / "invalid.wav"
+    path.write_bytes(contents)
+
+    assert WavReader.read_header(path) is None
+
+
+def test_read_header_float_wav_is_not_pcm_16(tmp_path, stereo_audio):
+    path = tmp_path / "float.wav"
+    sf.write(path, stereo_audio / 32768, 44100, subtype="FLOAT")
+
+    assert not WavReader.read_header(path).is_pcm_16
+    assert WavReader.memmap(path) is None
+
+
+def test_read_header_24_bit_wav_is_not_pcm_16(tmp_path, stereo_audio):
+    path = tmp_path / "pcm24.wav"
+    sf.write(path, stereo_audio, 44100, subtype="PCM_24")
+
+    assert WavReader.read_header(path).bits_per_sample == 24
+    assert WavReader.memmap(path) is None
+
+
+@pytest.mark.parametrize(
+    "subtype", ["PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"]
+)
+@pytest.mark.parametrize("channels", [1, 2])
+def test_header_subtype_matches_soundfile(tmp_path, subtype, channels):
+    path = tmp_path / "sample.wav"
+    sf.write(path, np.zeros((4, channels)), 44100, subtype=subtype)
+
+    assert WavReader.read_header(path).subtype == sf.info(str(path)).subtype
+
+
+def test_header_subtype_unknown_format(tmp_path):
+    path = tmp_path / "ulaw.wav"
+    sf.write(path, np.zeros(4), 8000, subtype="ULAW")
+
+    assert WavReader.read_header(path).subtype is None
+
+
+def test_memmap(pcm_16_wav, stereo_audio):
+    audio, sample_rate = WavReader.memmap(pcm_16_wav)
+
+    assert isinstance(audio, np.memmap)
+    assert sample_rate == 48000
+    assert np.array_equal(audio, stereo_audio)
+
+
+def test_memmap_mono_is_1d(wav_with_list_chunk):
+    audio, sample_rate = WavReader.memmap(wav_with_list_chunk)
+
+    assert audio.shape == (3,)
+    assert np.array_equal(audio, [5, 6, 7])
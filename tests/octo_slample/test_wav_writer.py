@@ -1,6 +1,8 @@
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
 import pytest
+import soundfile as sf
 
 from octo_slample.sampler.channel import Channel
 from octo_slample.sampler.sample_bank import SampleBank
@@ -21,6 +23,8 @@ def mock_channel(mocker):
         side_effect=["/foo/bar/1.wav", "/foo/bar/2.wav", "/foo/bar/3.wav"]
     )
     type(m).name = mocker.PropertyMock(side_effect=["foo", "bar", "baz"])
+    type(m).volume = mocker.PropertyMock(return_value=0.0)
+    type(m).gain = mocker.PropertyMock(return_value=1.0)
 
     return m
 
@@ -31,8 +35,18 @@ def mock_sf_write(mocker):
 
 
 @pytest.fixture
-def mock_channel_sample_is_none(mock_channel):
-    mock_channel.sample = None
+def mock_convert(mocker):
+    m = mocker.patch("octo_slample.wav_writer.SampleConverter.convert")
+    m.side_effect = lambda source_path, output_path, sample_rate, **kwargs: str(
+        output_path
+    )
+
+    return m
+
+
+@pytest.fixture
+def mock_channel_sample_is_none(mocker, mock_channel):
+    type(mock_channel).sample_path = mocker.PropertyMock(return_value=None)
 
     return mock_channel
 
@@ -133,7 +147,7 @@ def test_build_bank_output_path(tmp_path):
     ],
 )
 def test_write_channel(
-    tmp_path, mock_sf_write, channel, bank_output_path, expected, exception
+    tmp_path, mock_convert, channel, bank_output_path, expected, exception
 ):
     with exception:
         result = WavWriter.write_channel(
@@ -143,20 +157,109 @@ def test_write_channel(
         if isinstance(result, Exception):
             assert isinstance(result, expected)
 
-            mock_sf_write.assert_not_called()
+            mock_convert.assert_not_called()
         else:
             expected = str(tmp_path / expected)
             assert result == expected
 
-            mock_sf_write.assert_called_once_with(
-                expected,
-                channel.sample,
-                SQUID_SALMPLE_WAV_SAMPLE_RATE,
-                subtype=SQUID_SALMPLE_WAV_SUBTYPE,
-                format=SQUID_SALMPLE_AUDIO_FORMAT,
+            mock_convert.assert_called_once_with(
+                "/foo/bar/1.wav", expected, SQUID_SALMPLE_WAV_SAMPLE_RATE, gain=1.0
             )
 
 
+@pytest.mark.parametrize(
+    ("samplerate", "subtype", "channels", "expected"),
+    [
+        (44100, "PCM_16", 1, True),
+        (44100, "PCM_16", 2, True),
+        (48000, "PCM_16", 1, False),
+        (44100, "PCM_24", 1, False),
+        (44100, "PCM_16", 3, False),
+    ],
+    ids=["mono", "stereo", "48k", "24-bit", "3 channels"],
+)
+def test_is_squid_format(tmp_path, samplerate, subtype, channels, expected):
+    path = tmp_path / "sample.wav"
+    sf.write(path, np.zeros((8, channels)), samplerate, subtype=subtype)
+
+    assert WavWriter.is_squid_format(path) is expected
+
+
+def test_is_squid_format_unreadable_file(tmp_path):
+    (tmp_path / "sample.wav").write_bytes(b"not audio")
+
+    assert not WavWriter.is_squid_format(tmp_path / "sample.wav")
+
+
+def test_write_channel_copies_squid_format_samples(tmp_path, mock_convert):
+    path = tmp_path / "kick.wav"
+    sf.write(path, np.arange(16, dtype=np.int16), 44100, subtype="PCM_16")
+
+    result = WavWriter.write_channel(Channel(0, sample_path=str(path)), tmp_path)
+
+    assert result == str(tmp_path / "chan-001.wav")
+    assert (tmp_path / "chan-001.wav").read_bytes() == path.read_bytes()
+    mock_convert.assert_not_called()
+
+
+def test_write_channel_converts_squid_format_samples_with_volume(tmp_path):
+    path = tmp_path / "kick.wav"
+    sf.write(path, np.full(16, 10000, dtype=np.int16), 44100, subtype="PCM_16")
+
+    WavWriter.write_channel(Channel(0, sample_path=str(path), volume=-6), tmp_path)
+
+    result, _ = sf.read(tmp_path / "chan-001.wav", dtype="int16")
+    assert (tmp_path / "chan-001.wav").read_bytes() != path.read_bytes()
+    assert np.abs(result.astype(int) - round(10000 * 10**-0.6)).max() <= 1
+
+
+def test_write_channel_converts_other_samples(tmp_path, mock_convert):
+    path = tmp_path / "kick.wav"
+    sf.write(path, np.arange(16, dtype=np.int16), 48000, subtype="PCM_16")
+
+    WavWriter.write_channel(Channel(0, sample_path=str(path)), tmp_path)
+
+    mock_convert.assert_called_once_with(
+        str(path),
+        str(tmp_path / "chan-001.wav"),
+        SQUID_SALMPLE_WAV_SAMPLE_RATE,
+        gain=1.0,
+    )
+
+
+def test_write_channel_applies_volume(tmp_path):
+    path = tmp_path / "kick.wav"
+    sf.write(path, np.full(16, 10000, dtype=np.int16), 44100, subtype="PCM_24")
+
+    WavWriter.write_channel(Channel(0, sample_path=str(path), volume=-10), tmp_path)
+
+    result, _ = sf.read(tmp_path / "chan-001.wav", dtype="int16")
+    assert np.abs(result.astype(int) - 1000).max() <= 1
+
+
+def test_write_audio(tmp_path, mock_sf_write):
+    audio = np.zeros((4, 2), dtype=np.int16)
+
+    result = WavWriter.write_audio(audio, tmp_path / "audio.wav")
+
+    assert result == str(tmp_path / "audio.wav")
+    mock_sf_write.assert_called_once_with(
+        str(tmp_path / "audio.wav"),
+        audio,
+        SQUID_SALMPLE_WAV_SAMPLE_RATE,
+        subtype=SQUID_SALMPLE_WAV_SUBTYPE,
+        format=SQUID_SALMPLE_AUDIO_FORMAT,
+    )
+
+
+def test_write_audio_sample_rate(tmp_path, mock_sf_write):
+    audio = np.zeros((4, 2), dtype=np.int16)
+
+    WavWriter.write_audio(audio, tmp_path / "audio.wav", 48000)
+
+    assert mock_sf_write.call_args.args[2] == 48000
+
+
 @pytest.mark.parametrize(
     ("sample_bank", "set_output_path", "bank_number", "expected", "exception"),
     [